@@ -0,0 +1,51 @@
+"""
+Import time of the nexustrader entry points, each measured in a fresh interpreter.
+
+    python benchmark/import_time_benchmark.py
+"""
+
+import re
+import sys
+import subprocess
+
+STATEMENTS = [
+    "import nexustrader.constants",
+    "from nexustrader.exchange.binance import BinanceAccountType",
+    "import nexustrader.config",
+    "import nexustrader.engine",
+    "from nexustrader.exchange.binance import BinancePrivateConnector",
+]
+
+HEAVY_MODULES = ["ccxt", "aiohttp", "redis", "zmq", "picows", "nautilus_trader"]
+
+
+def measure(statement: str, rounds: int = 5):
+    times = []
+    for _ in range(rounds):
+        # -X importtime writes "self | cumulative | name" per module to stderr,
+        # nested imports are indented, the top level ones add up to the total
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total = 0
+        for line in result.stderr.splitlines()[1:]:
+            _, cumulative, name = line.split("|")
+            if not name.startswith("  "):
+                total += int(cumulative)
+        times.append(total / 1e6)
+    loaded = {
+        name
+        for name in HEAVY_MODULES
+        if re.search(rf"\|\s+{name}$", result.stderr, re.MULTILINE)
+    }
+    return min(times), sorted(loaded)
+
+
+if __name__ == "__main__":
+    for statement in STATEMENTS:
+        seconds, loaded = measure(statement)
+        print(f"{seconds:8.3f}s  {statement}")
+        print(f"           heavy modules: {', '.join(loaded) or '-'}")
@@ -0,0 +1,562 @@
+import json
+import functools
+import time
+import heapq
+import asyncio
+import itertools
+import tempfile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple
+
+import msgspec
+import numpy as np
+from apscheduler.triggers.interval import IntervalTrigger
+
+from nexustrader.config import Config
+from nexustrader.constants import AccountType, DataType, StorageBackend
+from nexustrader.core.nautilius_core import TestClock
+from nexustrader.core.recorder import RECORDED_TYPES, read_records, _select_records
+from nexustrader.engine import Engine
+from nexustrader.error import EngineBuildError
+
+
+@dataclass
+class BacktestResult:
+    """
+    Attributes:
+        events (`int`): Market data events replayed
+        elapsed (`float`): Wall clock seconds of the run
+        pnl (`Dict[AccountType, List[Tuple[int, float, float]]]`): `(timestamp, pnl, unrealized_pnl)`
+            of every mock account, sampled every `update_interval` simulated seconds
+    """
+    events: int = 0
+    elapsed: float = 0.0
+    pnl: Dict[AccountType, List[Tuple[int, float, float]]] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, float]:
+        """The final `pnl` / `unrealized_pnl` summed over the accounts and the largest drawdown of an account"""
+        summary = {"events": self.events, "elapsed": self.elapsed, "pnl": 0.0, "unrealized_pnl": 0.0, "max_drawdown": 0.0}
+        for samples in self.pnl.values():
+            if not samples:
+                continue
+            _, pnl, unrealized_pnl = np.array(samples, dtype=float).T
+            equity = pnl + unrealized_pnl
+            summary["pnl"] += pnl[-1]
+            summary["unrealized_pnl"] += unrealized_pnl[-1]
+            drawdown = float(np.max(np.maximum.accumulate(equity) - equity))
+            summary["max_drawdown"] = max(summary["max_drawdown"], drawdown)
+        return summary
+
+
+class ReplayData:
+    """
+    Recorded market data decoded once into `.npy` columns.
+
+    The columns are opened memory-mapped, so the workers of `run_sweep` share
+    the pages of one copy instead of each parsing the Parquet files. The
+    string columns (`exchange`, `symbol`, `interval`) are stored as codes into
+    `categories.json`.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = Path(directory)
+        self._columns: Dict[DataType, Dict[str, np.ndarray]] = {}
+        self._categories: Dict[DataType, Dict[str, list]] = {}
+        for data_type in RECORDED_TYPES:
+            path = self._directory / data_type.value
+            if not path.is_dir():
+                continue
+            fields = msgspec.structs.fields(RECORDED_TYPES[data_type])
+            self._columns[data_type] = {
+                f.name: np.load(path / f"{f.name}.npy", mmap_mode="r") for f in fields
+            }
+            categories = json.loads((path / "categories.json").read_text())
+            self._categories[data_type] = {
+                f.name: [msgspec.convert(value, f.type) for value in categories[f.name]]
+                for f in fields
+                if f.name in categories
+            }
+
+    @classmethod
+    def load(
+        cls,
+        data_dir: str,
+        directory: str,
+        symbols: List[str],
+        data_types: List[DataType] = (DataType.BOOKL1, DataType.TRADE, DataType.KLINE),
+        start: int | None = None,
+        end: int | None = None,
+    ) -> "ReplayData":
+        """
+        Decode the data of `symbols` recorded in `data_dir` into `directory`
+
+        Args:
+            data_dir: Directory of the recorded market data, `RecorderConfig.directory`
+            directory: Directory the columns are written to
+        """
+        import duckdb
+
+        conn = duckdb.connect()
+        try:
+            for data_type in data_types:
+                select = _select_records(data_dir, data_type, symbols, start, end)
+                if select is None:
+                    continue
+                columns = conn.execute(*select).fetchnumpy()
+                path = Path(directory) / data_type.value
+                path.mkdir(parents=True, exist_ok=True)
+                categories = {}
+                for name, column in columns.items():
+                    if isinstance(column, np.ma.MaskedArray):
+                        column = column.filled(np.nan)
+                    if column.dtype == object:
+                        values, column = np.unique(column, return_inverse=True)
+                        categories[name] = values.tolist()
+                        column = column.astype(np.int32)
+                    np.save(path / f"{name}.npy", column)
+                (path / "categories.json").write_text(json.dumps(categories))
+        finally:
+            conn.close()
+        return cls(directory)
+
+    def read(
+        self,
+        data_type: DataType,
+        symbols: List[str],
+        start: int | None = None,
+        end: int | None = None,
+        interval: str | None = None,
+        batch_size: int = 10_000,
+    ) -> Iterator[msgspec.Struct]:
+        """Yield the records of `symbols` ordered by timestamp, the same as `read_records`"""
+        if data_type not in self._columns or not symbols:
+            return
+        columns = self._columns[data_type]
+        categories = self._categories[data_type]
+
+        timestamp = columns["timestamp"]
+        lo = 0 if start is None else np.searchsorted(timestamp, start, side="left")
+        hi = len(timestamp) if end is None else np.searchsorted(timestamp, end, side="right")
+        mask = np.isin(columns["symbol"][lo:hi], [categories["symbol"].index(s) for s in symbols if s in categories["symbol"]])
+        if interval is not None:
+            codes = [i for i, value in enumerate(categories["interval"]) if value.value == interval]
+            mask &= np.isin(columns["interval"][lo:hi], codes)
+        rows = lo + np.flatnonzero(mask)
+
+        struct_type = RECORDED_TYPES[data_type]
+        names = list(columns)
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i : i + batch_size]
+            values = []
+            for name in names:
+                column = columns[name][batch].tolist()
+                if name in categories:
+                    column = [categories[name][code] for code in column]
+                values.append(column)
+            for row in zip(*values):
+                yield struct_type(**dict(zip(names, row)))
+
+
+class _Timer:
+    """A callback fired on the simulated clock"""
+
+    def __init__(self, callback: Callable, next_time: datetime, next_fire: Callable[[datetime], datetime | None]):
+        self.callback = callback
+        self.next_time = next_time
+        self._next_fire = next_fire
+
+    def advance(self):
+        self.next_time = self._next_fire(self.next_time)
+
+
+class _SimulatedWaits:
+    """
+    Sleeps and timeouts on the simulated clock, and the count of the work left
+    before the clock may move on.
+
+    The work pending is the items of the order queues not handled yet and the
+    tasks started during the replay that are not waiting on the clock. A task
+    counts again from the moment its wait is over until it waits or ends.
+    """
+
+    def __init__(self, clock: TestClock, timers: List[_Timer]):
+        self._clock = clock
+        self._timers = timers
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._running: Set[asyncio.Task] = set()
+
+    def add(self):
+        self._pending += 1
+        self._idle.clear()
+
+    def remove(self):
+        self._pending -= 1
+        if not self._pending:
+            self._idle.set()
+
+    async def join(self):
+        """Wait until no work is pending"""
+        await asyncio.sleep(0)  # conflated callbacks are delivered with `call_soon`
+        while self._pending:
+            await self._idle.wait()
+            await asyncio.sleep(0)  # and so are the wake ups of the waiting tasks
+
+    def track(self, task: asyncio.Task):
+        self._running.add(task)
+        self.add()
+        task.add_done_callback(self._untrack)
+
+    def _untrack(self, task: asyncio.Task):
+        if task in self._running:
+            self._running.remove(task)
+            self.remove()
+
+    def _resume(self, task: asyncio.Task):
+        if not task.done():
+            self._running.add(task)
+            self.add()
+
+    async def wait_for(self, future: asyncio.Future, timeout: float | None):
+        """`asyncio.wait_for` with `timeout` on the simulated clock"""
+        if future.done():
+            return future.result()
+        if timeout is not None and timeout <= 0:
+            future.cancel()
+            raise asyncio.TimeoutError
+
+        wakeup = asyncio.get_running_loop().create_future()
+
+        def wake(_=None):
+            if not wakeup.done():
+                wakeup.set_result(None)
+
+        future.add_done_callback(wake)
+        timer = None
+        if timeout is not None:
+            now = datetime.fromtimestamp(self._clock.timestamp_ns() / 1_000_000_000, tz=timezone.utc)
+            timer = _Timer(wake, now + timedelta(seconds=timeout), lambda t: None)
+            self._timers.append(timer)
+
+        task = asyncio.current_task()
+        if task in self._running:
+            # also resumed by a cancel, the wake up cancels `wakeup`
+            self._running.remove(task)
+            wakeup.add_done_callback(lambda _: self._resume(task))
+            self.remove()
+        try:
+            await wakeup
+        finally:
+            future.remove_done_callback(wake)
+            if timer in self._timers:
+                self._timers.remove(timer)
+
+        if not future.done():
+            future.cancel()
+            raise asyncio.TimeoutError
+        return future.result()
+
+    async def sleep(self, seconds: float):
+        try:
+            await self.wait_for(asyncio.get_running_loop().create_future(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+class _CountedQueue(asyncio.Queue):
+    """A queue whose unfinished items are pending work of `_SimulatedWaits`"""
+
+    def __init__(self, waits: _SimulatedWaits):
+        super().__init__()
+        self._waits = waits
+
+    def put_nowait(self, item):
+        super().put_nowait(item)
+        self._waits.add()
+
+    def task_done(self):
+        super().task_done()
+        self._waits.remove()
+
+
+class BacktestEngine(Engine):
+    """
+    Replay market data recorded by `MarketDataRecorder` through the strategy.
+
+    The recorded BookL1 / Trade / Kline of the subscribed symbols are merged by
+    timestamp and published on the same `MessageBus` topics as the public
+    connectors, so the `Strategy.on_*` callbacks, the EMS and the mock
+    connectors run unchanged. Every component shares one `TestClock` set to
+    the timestamp of the current event, and the order submits and order updates
+    caused by an event are handled before the next one is published. The run
+    is deterministic and as fast as the callbacks allow.
+
+    Jobs added with `Strategy.schedule` fire on the simulated clock, and so do
+    the waits of the algo orders (TWAP wait, ADP maker check interval, order
+    timeouts): a wait ends at the first event past its end time.
+
+    Example:
+        >>> engine = BacktestEngine(config, data_dir="data/market", start=..., end=...)
+        >>> result = engine.run()
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        data_dir: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        data: ReplayData | None = None,
+    ):
+        """
+        Args:
+            config: The live config, all private connectors must be mock connectors
+            data_dir: Directory of the recorded market data, `RecorderConfig.directory`
+            start: First timestamp replayed in ms
+            end: Last timestamp replayed in ms
+            data: Data decoded by `ReplayData.load`, replayed instead of `data_dir`
+        """
+        if (data_dir is None) == (data is None):
+            raise EngineBuildError("Please set either `data_dir` or `data`.")
+        if not config.is_mock:
+            raise EngineBuildError("Backtest needs mock private connectors, please use `MockConnectorConfig`.")
+
+        # every run starts from the initial balances in a storage of its own
+        self._tmp_dir = tempfile.TemporaryDirectory(prefix="nexustrader-backtest-")
+        config = replace(
+            config,
+            storage_backend=StorageBackend.SQLITE,
+            db_path=str(Path(self._tmp_dir.name) / "cache.db"),
+            journal_dir=None,
+            recorder_config=None,
+            zero_mq_signal_config=None,
+        )
+        self._clock = TestClock()
+        super().__init__(config)
+
+        self._data_dir = data_dir
+        self._data = data
+        self._start_time = start
+        self._end_time = end
+        self._timers: List[_Timer] = []
+        self._waits: _SimulatedWaits | None = None
+        self._result = BacktestResult()
+
+    def _create_clock(self) -> TestClock:
+        return self._clock
+
+    def _build(self):
+        self._build_exchanges()
+        self._build_private_connectors()
+        self._build_ems()
+        self._build_oms()
+        self._is_built = True
+
+    def _use_simulated_clock(self):
+        # the components keep a `LiveClock` of their own
+        components = [self._cache, *self._ems.values(), *self._private_connectors.values()]
+        for component in components:
+            component._clock = self._clock
+        self._strategy.clock = self._clock
+
+    def _use_simulated_waits(self):
+        self._waits = _SimulatedWaits(self._clock, self._timers)
+        self._cache._wait = self._waits.wait_for
+        for oms in self._oms.values():
+            oms._order_msg_queue = _CountedQueue(self._waits)
+        for ems in self._ems.values():
+            ems._sleep = self._waits.sleep
+            for account_type in ems._order_submit_queues:
+                ems._order_submit_queues[account_type] = _CountedQueue(self._waits)
+
+    def _track_tasks(self):
+        # the submits and algo orders started from now on are waited for by `_drain`
+        create_task = self._task_manager.create_task
+
+        def create_tracked_task(coro, name: str = None) -> asyncio.Task:
+            task = create_task(coro, name=name)
+            self._waits.track(task)
+            return task
+
+        self._task_manager.create_task = create_tracked_task
+
+    def _records(self) -> Iterator[Tuple[int, int, str, msgspec.Struct]]:
+        subscriptions = self._strategy._subscriptions
+        streams = []
+
+        def add_stream(data_type: DataType, symbols, interval=None):
+            if self._data is not None:
+                read = self._data.read
+            else:
+                read = functools.partial(read_records, self._data_dir)
+            records = read(
+                data_type,
+                sorted(symbols),
+                start=self._start_time,
+                end=self._end_time,
+                interval=interval,
+            )
+            # the stream index keeps the order of equal timestamps stable
+            index = len(streams)
+            if data_type == DataType.KLINE:
+                topic = f"kline.{interval}."
+            else:
+                topic = f"{data_type.value}."
+            streams.append(
+                ((record.timestamp, index, f"{topic}{record.symbol}", record) for record in records)
+            )
+
+        add_stream(DataType.BOOKL1, subscriptions[DataType.BOOKL1])
+        add_stream(DataType.TRADE, subscriptions[DataType.TRADE])
+        for interval, symbols in subscriptions[DataType.KLINE].items():
+            add_stream(DataType.KLINE, symbols, interval.value)
+        if subscriptions[DataType.BOOKL2]:
+            self._strategy.log.warn("BookL2 is not recorded, the `bookl2` subscriptions get no data")
+        return heapq.merge(*streams, key=lambda item: item[:2])
+
+    def _build_timers(self, start: datetime):
+        for job in self._strategy._scheduler.get_jobs():
+            trigger = job.trigger
+            callback = job.func
+            if job.args or job.kwargs:
+                callback = functools.partial(job.func, *job.args, **job.kwargs)
+            if isinstance(trigger, IntervalTrigger):
+                # its start date is taken from the wall clock
+                interval = trigger.interval
+                self._timers.append(_Timer(callback, start + interval, lambda t, interval=interval: t + interval))
+            elif first := trigger.get_next_fire_time(None, start):
+                self._timers.append(
+                    _Timer(callback, first, lambda t, trigger=trigger: trigger.get_next_fire_time(t, t + timedelta(microseconds=1)))
+                )
+
+        for account_type, connector in self._private_connectors.items():
+            interval = connector._update_interval
+            self._result.pnl[account_type] = []
+            self._timers.append(
+                _Timer(
+                    lambda account_type=account_type, connector=connector: self._sample_pnl(account_type, connector),
+                    start,
+                    lambda t, interval=interval: t + timedelta(seconds=interval),
+                )
+            )
+
+        cleanup_interval = self._config.cache_sync_interval
+        self._timers.append(
+            _Timer(
+                self._cache._cleanup_expired_data,
+                start + timedelta(seconds=cleanup_interval),
+                lambda t: t + timedelta(seconds=cleanup_interval),
+            )
+        )
+
+    def _sample_pnl(self, account_type: AccountType, connector):
+        connector._update_unrealized_pnl()
+        self._result.pnl[account_type].append(
+            (self._clock.timestamp_ms(), connector.pnl, connector.unrealized_pnl)
+        )
+
+    async def _fire_timers(self, until: datetime):
+        while self._timers:
+            timer = min(self._timers, key=lambda timer: timer.next_time)
+            if timer.next_time > until:
+                return
+            self._clock.set_time(int(timer.next_time.timestamp() * 1_000_000_000))
+            result = timer.callback()
+            if asyncio.iscoroutine(result):
+                await result
+            await self._drain()
+            timer.advance()
+            # the timer of a wait is removed by the waiting task once it resumes
+            if timer.next_time is None and timer in self._timers:
+                self._timers.remove(timer)
+
+    async def _drain(self):
+        """Run the order submits, order updates and algo order steps caused by the last event"""
+        await self._waits.join()
+
+    async def _replay(self) -> BacktestResult:
+        await self._cache._init_storage()
+        self._use_simulated_clock()
+        self._use_simulated_waits()
+        await self._start_oms()
+        await self._start_ems()
+        self._track_tasks()
+        for connector in self._private_connectors.values():
+            await connector._init_position()
+            await connector._init_balance()
+
+        wall_start = time.perf_counter()
+        for timestamp, _, topic, record in self._records():
+            now = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
+            if not self._result.events:
+                self._build_timers(now)
+            await self._fire_timers(now)
+            self._clock.set_time(timestamp * 1_000_000)
+            self._msgbus.publish(topic=topic, msg=record)
+            await self._drain()
+            self._result.events += 1
+
+        self._result.elapsed = time.perf_counter() - wall_start
+        return self._result
+
+    def run(self) -> BacktestResult:
+        """Replay the data and return the result, the engine is disposed afterwards"""
+        self._build()
+        self._strategy.on_start()
+        try:
+            return self._loop.run_until_complete(self._replay())
+        finally:
+            self._loop.run_until_complete(self._dispose())
+            self._loop.close()
+            self._tmp_dir.cleanup()
+
+    def start(self) -> BacktestResult:
+        """Same as `run`"""
+        return self.run()
+
+
+def _run_sweep_job(build_config: Callable[..., Config], params: Dict[str, Any], data_dir: str, start, end) -> Dict[str, Any]:
+    engine = BacktestEngine(build_config(**params), start=start, end=end, data=ReplayData(data_dir))
+    return {**params, **engine.run().summary()}
+
+
+def run_sweep(
+    build_config: Callable[..., Config],
+    grid: Dict[str, List[Any]],
+    data_dir: str,
+    symbols: List[str],
+    data_types: List[DataType] = (DataType.BOOKL1, DataType.TRADE, DataType.KLINE),
+    start: int | None = None,
+    end: int | None = None,
+    max_workers: int | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Backtest every combination of the parameters in `grid` on a process pool.
+
+    The recorded data of `symbols` is decoded once by `ReplayData` and shared
+    by the workers. Each worker builds its config with `build_config(**params)`,
+    so `build_config` has to be a module level function.
+
+    Example:
+        >>> def build_config(tp_ratio: float, duration: int) -> Config: ...
+        >>> rows = run_sweep(build_config, {"tp_ratio": [0.01, 0.02], "duration": [60, 300]}, "data/market", symbols)
+
+    Returns:
+        One row per combination in the order of the grid: the parameters and
+        the `BacktestResult.summary`
+    """
+    names = list(grid)
+    combinations = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+    with tempfile.TemporaryDirectory(prefix="nexustrader-sweep-") as directory:
+        ReplayData.load(data_dir, directory, symbols, data_types, start, end)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_sweep_job, build_config, params, directory, start, end)
+                for params in combinations
+            ]
+            return [future.result() for future in futures]
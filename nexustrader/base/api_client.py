@@ -1,11 +1,218 @@
-from abc import ABC
-from typing import Optional
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urljoin
+import re
 import ssl
+import hmac
+import base64
+import hashlib
+import asyncio
 import certifi
+import msgspec
 import orjson
-import aiohttp
+from nexustrader.constants import HttpTransportType
 from nexustrader.core.log import SpdLog
-from nexustrader.core.nautilius_core import LiveClock
+from nexustrader.core.nautilius_core import LiveClock, HttpClient, HttpMethod, HttpTimeoutError
+
+
+_UNSAFE_QUERY_CHARS = re.compile(r"[^A-Za-z0-9_.\-~]")
+
+
+def encode_query(params: Dict[str, Any]) -> str:
+    """
+    Same output as `urllib.parse.urlencode`, but only values that contain
+    reserved characters go through `quote_plus`. Keys are API field names
+    and are never quoted.
+    """
+    parts = []
+    for key, value in params.items():
+        value = str(value)
+        if _UNSAFE_QUERY_CHARS.search(value):
+            value = quote_plus(value)
+        parts.append(f"{key}={value}")
+    return "&".join(parts)
+
+
+class HmacSigner:
+    """HMAC-SHA256 keyed once with the api secret, signing only hashes the message"""
+
+    __slots__ = ("_hmac",)
+
+    def __init__(self, secret: str):
+        self._hmac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def _sign(self, message: str | bytes):
+        mac = self._hmac.copy()
+        mac.update(message.encode("utf-8") if isinstance(message, str) else message)
+        return mac
+
+    def hexdigest(self, message: str | bytes) -> str:
+        return self._sign(message).hexdigest()
+
+    def b64digest(self, message: str | bytes) -> str:
+        return base64.b64encode(self._sign(message).digest()).decode()
+
+
+class HttpTransportResponse(msgspec.Struct):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class HttpTransport(ABC):
+    """HTTP backend of an `ApiClient`.
+
+    Implementations raise `asyncio.TimeoutError` when a request times out and
+    `ConnectionError` for any other transport failure, so the exchange clients
+    map errors the same way whatever the backend.
+    """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        data: bytes | str | None = None,
+    ) -> HttpTransportResponse:
+        pass
+
+    @abstractmethod
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(HttpTransport):
+    def __init__(
+        self,
+        timeout: int,
+        pool_size: int,
+        keepalive_timeout: float,
+        dns_cache_ttl: int,
+        ssl_context: ssl.SSLContext,
+    ):
+        import aiohttp
+
+        self._client_error = aiohttp.ClientError
+        # aiohttp already sets TCP_NODELAY on every connection
+        tcp_connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            enable_cleanup_closed=True,
+            limit_per_host=pool_size,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=tcp_connector,
+            json_serialize=orjson.dumps,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+
+    async def request(self, method, url, headers=None, data=None):
+        try:
+            async with self._session.request(
+                method=method, url=url, headers=headers, data=data
+            ) as response:
+                body = await response.read()
+                return HttpTransportResponse(
+                    status=response.status,
+                    headers=dict(response.headers),
+                    body=body,
+                )
+        except self._client_error as e:
+            raise ConnectionError(str(e)) from e
+
+    async def close(self):
+        await self._session.close()
+
+
+class AiosonicTransport(HttpTransport):
+    def __init__(
+        self,
+        timeout: int,
+        pool_size: int,
+        dns_cache_ttl: int,
+        ssl_context: ssl.SSLContext,
+    ):
+        import aiosonic
+        from aiosonic.timeout import Timeouts
+
+        self._aiosonic = aiosonic
+        self._ssl_context = ssl_context
+        self._timeouts = Timeouts(request_timeout=timeout)
+        # aiosonic keeps connections alive in its pool until the server closes them
+        self._client = aiosonic.HTTPClient(
+            aiosonic.TCPConnector(pool_size=pool_size, ttl_dns_cache=dns_cache_ttl * 1000)
+        )
+
+    async def request(self, method, url, headers=None, data=None):
+        exceptions = self._aiosonic.exceptions
+        try:
+            response = await self._client.request(
+                url,
+                method=method,
+                headers=headers,
+                data=data,
+                # aiosonic starts TLS whenever a context is given, even for http urls
+                ssl=self._ssl_context if url.startswith("https") else None,
+                timeouts=self._timeouts,
+            )
+            body = await response.content()
+        except asyncio.TimeoutError:
+            raise
+        except exceptions.BaseTimeout as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except (
+            OSError,
+            exceptions.HttpParsingError,
+            exceptions.ConnectionDisconnected,
+        ) as e:
+            raise ConnectionError(str(e)) from e
+        return HttpTransportResponse(
+            status=response.status_code,
+            headers=dict(response.headers),
+            body=body,
+        )
+
+    async def close(self):
+        await self._client.connector.cleanup()
+
+
+class NautilusHttpTransport(HttpTransport):
+    """Rust `reqwest` client from nautilus_pyo3, it manages its own connection pool.
+
+    The pyo3 response does not carry the response headers, `headers` is empty.
+    """
+
+    def __init__(self, timeout: int):
+        self._timeout = timeout
+        self._client = HttpClient()
+
+    async def request(self, method, url, headers=None, data=None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        # `HttpMethod` is a pyo3 class, its members are attributes
+        http_method = getattr(HttpMethod, method)
+        try:
+            response = await self._client.request(
+                method=http_method,
+                url=url,
+                headers=headers,
+                body=data,
+                timeout_secs=self._timeout,
+            )
+        except HttpTimeoutError as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except Exception as e:
+            raise ConnectionError(str(e)) from e
+        return HttpTransportResponse(
+            status=response.status,
+            headers=dict(response.headers),
+            body=bytes(response.body),
+        )
+
+    async def close(self):
+        pass
 
 
 class ApiClient(ABC):
@@ -14,28 +221,93 @@ class ApiClient(ABC):
         api_key: str = None,
         secret: str = None,
         timeout: int = 10,
+        pool_size: int = 10,
+        keepalive_timeout: float = 60,
+        warmup_interval: float | None = 30,
+        dns_cache_ttl: int = 300,
+        transport: HttpTransportType = HttpTransportType.AIOHTTP,
     ):
+        """
+        Args:
+            pool_size: Max pooled connections per host
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            warmup_interval: Seconds between requests to `_warmup_urls` in
+                `keep_warm`, it should stay below `keepalive_timeout` so the
+                pooled connections are never closed for being idle. None
+                disables the warm-up.
+            dns_cache_ttl: Seconds a resolved host is cached
+            transport: HTTP backend the requests are sent with
+        """
         self._api_key = api_key
         self._secret = secret
         self._timeout = timeout
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._warmup_interval = warmup_interval
+        self._dns_cache_ttl = dns_cache_ttl
+        self._transport_type = transport
+        # cheap public endpoints, one per host the client trades on
+        self._warmup_urls: List[str] = []
         self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+        # request logs are only formatted when a sink writes them
+        self._log_debug = SpdLog.is_enabled("DEBUG", "DEBUG")
+        self._signer = HmacSigner(secret) if secret else None
+        self._urls: Dict[Tuple[str, str], str] = {}
         self._ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._transport: Optional[HttpTransport] = None
         self._clock = LiveClock()
 
     def _init_session(self):
-        """Initialize the session"""
-        if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=self._timeout)
-            tcp_connector = aiohttp.TCPConnector(
-                ssl=self._ssl_context, enable_cleanup_closed=True
-            )
-            self._session = aiohttp.ClientSession(
-                connector=tcp_connector, json_serialize=orjson.dumps, timeout=timeout
-            )
+        """Initialize the transport"""
+        if self._transport is None:
+            match self._transport_type:
+                case HttpTransportType.AIOHTTP:
+                    self._transport = AiohttpTransport(
+                        timeout=self._timeout,
+                        pool_size=self._pool_size,
+                        keepalive_timeout=self._keepalive_timeout,
+                        dns_cache_ttl=self._dns_cache_ttl,
+                        ssl_context=self._ssl_context,
+                    )
+                case HttpTransportType.AIOSONIC:
+                    self._transport = AiosonicTransport(
+                        timeout=self._timeout,
+                        pool_size=self._pool_size,
+                        dns_cache_ttl=self._dns_cache_ttl,
+                        ssl_context=self._ssl_context,
+                    )
+                case HttpTransportType.NAUTILUS:
+                    self._transport = NautilusHttpTransport(timeout=self._timeout)
+
+    def _url(self, base_url: str, endpoint: str) -> str:
+        """`urljoin` of the base url and endpoint, cached per endpoint"""
+        key = (base_url, endpoint)
+        url = self._urls.get(key)
+        if url is None:
+            url = self._urls[key] = urljoin(base_url, endpoint)
+        return url
+
+    async def _warmup(self, url: str):
+        try:
+            await self._transport.request("GET", url)
+        except Exception as e:
+            self._log.warn(f"Warm-up request to {url} failed: {e}")
+
+    async def warmup(self):
+        """Open or refresh a pooled connection to each host in `_warmup_urls`"""
+        self._init_session()
+        await asyncio.gather(*(self._warmup(url) for url in self._warmup_urls))
+
+    async def keep_warm(self):
+        """Warm up the pool now and every `warmup_interval` seconds after that"""
+        if not self._warmup_interval or not self._warmup_urls:
+            return
+        while True:
+            await self.warmup()
+            await asyncio.sleep(self._warmup_interval)
 
     async def close_session(self):
-        """Close the session"""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Close the transport"""
+        if self._transport:
+            await self._transport.close()
+            self._transport = None
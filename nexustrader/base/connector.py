@@ -1,19 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 from decimal import Decimal
 import asyncio
+import msgspec
 
 from aiolimiter import AsyncLimiter
 
 from nexustrader.base.ws_client import WSClient
 from nexustrader.base.api_client import ApiClient
 from nexustrader.base.exchange import ExchangeManager
-from nexustrader.schema import Order, BaseMarket, Kline, Position, Balance
+from nexustrader.base.matching import OrderMatcher, RestingOrder, Fill
+from nexustrader.schema import Order, BaseMarket, Kline, Position, Balance, BatchOrder, BookL1, Trade
 from nexustrader.constants import ExchangeType, AccountType
 from nexustrader.core.log import SpdLog
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.entity import RateLimit, TaskManager
-from nexustrader.error import OrderError
+from nexustrader.error import OrderError, WSNotConnectedError
 from nexustrader.constants import (
     OrderSide,
     OrderType,
@@ -88,6 +90,11 @@ class PublicConnector(ABC):
         """Subscribe to the kline data"""
         pass
 
+    @abstractmethod
+    async def subscribe_bookl2(self, symbol: str | List[str], depth: int):
+        """Subscribe to the bookl2 data, published as top `depth` levels of the local order book"""
+        pass
+
     async def disconnect(self):
         """Disconnect from the exchange"""
         self._ws_client.disconnect()  # not needed to await
@@ -105,7 +112,9 @@ class PrivateConnector(ABC):
         api_client: ApiClient,
         msgbus: MessageBus,
         cache: AsyncCache,
+        task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        ws_api_client: WSClient | None = None,
     ):
         self._log = SpdLog.get_logger(
             name=type(self).__name__, level="DEBUG", flush=True
@@ -116,9 +125,13 @@ class PrivateConnector(ABC):
         self._exchange_id = exchange_id
         self._ws_client = ws_client
         self._api_client = api_client
+        # order entry over WS when set, REST is used while it is disconnected
+        self._ws_api_client = ws_api_client
         self._cache = cache
         self._clock = LiveClock()
         self._msgbus: MessageBus = msgbus
+        self._task_manager = task_manager
+        self._keep_warm_task: asyncio.Task | None = None
 
         if rate_limit:
             self._limiter = AsyncLimiter(rate_limit.max_rate, rate_limit.time_period)
@@ -193,31 +206,93 @@ class PrivateConnector(ABC):
         """Cancel an order"""
         pass
 
+    async def create_orders(self, orders: List[BatchOrder]) -> List[Order]:
+        """
+        Create a batch of orders, the results are in the same order as `orders`.
+        Connectors with a batch endpoint override this, the default sends the
+        single order requests concurrently.
+        """
+        return await asyncio.gather(
+            *(
+                self.create_order(
+                    symbol=order.symbol,
+                    side=order.side,
+                    type=order.type,
+                    amount=order.amount,
+                    price=order.price,
+                    time_in_force=order.time_in_force,
+                    position_side=order.position_side,
+                    **order.kwargs,
+                )
+                for order in orders
+            )
+        )
+
+    async def cancel_orders(
+        self, symbol: str, order_ids: List[str], **kwargs
+    ) -> List[Order]:
+        """
+        Cancel a batch of orders of `symbol`, the results are in the same order as `order_ids`
+        """
+        return await asyncio.gather(
+            *(
+                self.cancel_order(symbol=symbol, order_id=order_id, **kwargs)
+                for order_id in order_ids
+            )
+        )
+
+    async def _order_request(
+        self,
+        ws_request: Callable[[], Awaitable[Any]] | None,
+        rest_request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Send an order request over WS order entry, or REST while it is unavailable"""
+        if self._ws_api_client is not None and ws_request is not None:
+            try:
+                return await ws_request()
+            except WSNotConnectedError as e:
+                self._log.warn(f"WS order entry unavailable, falling back to REST: {e}")
+        return await rest_request()
+
     @abstractmethod
     async def connect(self):
         """Connect to the exchange"""
+        self._keep_warm_task = self._task_manager.create_task(self._api_client.keep_warm())
         await self._init_account_balance()
         await self._init_position()
+        if self._ws_api_client is not None:
+            await self._ws_api_client.connect()
 
     async def disconnect(self):
         """Disconnect from the exchange"""
         self._ws_client.disconnect()
+        if self._ws_api_client is not None:
+            self._ws_api_client.disconnect()
+        # a warm-up after the close would open a transport nothing closes
+        if self._keep_warm_task is not None:
+            self._keep_warm_task.cancel()
+            self._keep_warm_task = None
         await self._api_client.close_session()
 
 
-class MockLinearConnector:
+class MockConnector(ABC):
     """
-    open long -> cache.update_position
-    open short -> cache.update_position
+    Base of the mock connectors, the orders are filled against the market data.
 
-    close long -> cache.update_position -> cache.update_balance -> realized_pnl
-    close short -> cache.update_position -> cache.update_balance -> realized_pnl
+    Market orders, limit orders without a price and limit orders crossing the
+    book are filled at once at the touch as taker. The other limit orders rest
+    in an `OrderMatcher` and are filled as maker from the `bookl1` / `trade`
+    data, their ACCEPTED / PARTIALLY_FILLED / FILLED / CANCELED updates are
+    published on `<exchange>.order` like the ones of a live connector.
+
+    The subclasses check the orders and book the fills on the balances and
+    positions in the cache.
     """
 
     def __init__(
         self,
         initial_balance: Dict[str, float],
-        account_type: AccountType, # LINEAR_MOCK
+        account_type: AccountType, # LINEAR_MOCK, INVERSE_MOCK or SPOT_MOCK
         exchange: ExchangeManager,
         msgbus: MessageBus,
         cache: AsyncCache,
@@ -228,6 +303,7 @@ class MockLinearConnector:
         quote_currency: str = "USDT",
         update_interval: int = 60, # seconds
         leverage: int = 1,
+        maker_fee_rate: float | None = None, # defaults to `fee_rate`
     ):
         self._account_type = account_type
         self._market = exchange.market
@@ -244,12 +320,18 @@ class MockLinearConnector:
         self._clock = LiveClock()
         self._task_manager = task_manager
         self._leverage = leverage
+        self._maker_fee_rate = fee_rate if maker_fee_rate is None else maker_fee_rate
         self._log = SpdLog.get_logger(
             name=type(self).__name__, level="DEBUG", flush=True
         )
 
+        self._matcher = OrderMatcher()
+        self._open_orders: Dict[str, Order] = {}
+        self._msgbus.subscribe(topic="bookl1.*", handler=self._on_bookl1)
+        self._msgbus.subscribe(topic="trade.*", handler=self._on_trade)
+
     async def _init_position(self):
-        for _, position in self._cache._get_all_positions_from_db(self._exchange_id).items():
+        for _, position in (await self._cache._get_all_positions_from_db_async(self._exchange_id)).items():
             if not self._overwrite_position:
                 self._cache._apply_position(position)
         await self._cache.sync_positions()
@@ -257,7 +339,7 @@ class MockLinearConnector:
     async def _init_balance(self):
         balances = []
         if not self._overwrite_balance:
-            balances = self._cache._get_all_balances_from_db(self._account_type)
+            balances = await self._cache._get_all_balances_from_db_async(self._account_type)
     
         if not balances:
             balances = [
@@ -270,6 +352,45 @@ class MockLinearConnector:
         self._cache._apply_balance(self._account_type, balances)
         await self._cache.sync_balances()
 
+    @abstractmethod
+    def _check_market(self, symbol: str, market: BaseMarket):
+        """Raise `OrderError` if the symbol can not be traded by the connector"""
+        pass
+
+    @abstractmethod
+    def _check_order(
+        self,
+        symbol: str,
+        market: BaseMarket,
+        side: OrderSide,
+        amount: Decimal,
+        price: float,
+        book: BookL1,
+    ):
+        """Raise `OrderError` if the balance does not allow the order at `price`"""
+        pass
+
+    @abstractmethod
+    def _cost(self, market: BaseMarket, amount: Decimal, price: float) -> Decimal:
+        """Value of `amount` at `price` in the fee currency"""
+        pass
+
+    @abstractmethod
+    def _fee_currency(self, market: BaseMarket) -> str:
+        pass
+
+    @abstractmethod
+    def _apply_fill(self, order: Order, maker: bool):
+        """Book a fill of `order.amount` at `order.price` paying `order.fee`"""
+        pass
+
+    def _lock(self, order: Order):
+        """Lock the balance of an order resting in the book"""
+        pass
+
+    def _release(self, order: Order, remaining: Decimal):
+        """Release the balance locked for the `remaining` amount of a canceled order"""
+        pass
 
     async def create_order(
         self,
@@ -286,48 +407,32 @@ class MockLinearConnector:
             if not market:
                 raise OrderError(f"Symbol {symbol} not found")
 
-            if not market.linear:
-                raise OrderError(f"Symbol {symbol} is not a linear contract")
-            
-            if market.quote not in self._cache.get_balance(self._account_type).balances:
-                raise OrderError(f"Symbol {symbol}: Not enough balance for {market.quote}.")
+            self._check_market(symbol, market)
             
             book = self._cache.bookl1(symbol)
             if not book:
                 raise OrderError(
                     f"Please subscribe to the bookl1 data for {symbol} or data not ready"
                 )
-        
-        
-            quote_balance = float(self._cache.get_balance(self._account_type).balance_total[self._quote_currency])
-            
-            position = self._cache.get_position(symbol).value_or(None)
-            if position:
-                # If position exists, check direction
-                if (side.is_buy and position.side.is_long) or (side.is_sell and position.side.is_short):
-                    # Same direction, add
-                    total_notional = self.total_notional + float(amount) * book.mid
-                else:
-                    # Opposite direction, subtract
-                    total_notional = self.total_notional - float(amount) * book.mid
-            else:
-                # No existing position, just add
-                total_notional = self.total_notional + float(amount) * book.mid
-            
-            if abs(total_notional) / quote_balance > self._leverage:
-                raise OrderError(f"Symbol {symbol}: Not enough margin for leverage: {self._leverage}")
+
+            reduce_only = kwargs.get("reduce_only", False)
+
+            if type.is_limit and price is not None:
+                price = float(price)
+                if (side.is_buy and price < book.ask) or (side.is_sell and price > book.bid):
+                    self._check_order(symbol, market, side, amount, price, book)
+                    return self._rest_order(symbol, side, type, amount, price, time_in_force, reduce_only, book)
 
             if side == OrderSide.BUY: #NOTE: taker order
                 price = book.ask
             else:
                 price = book.bid
 
-            fee = amount * Decimal(str(price)) * Decimal(str(self._fee_rate))
-            fee_currency = market.quote
+            self._check_order(symbol, market, side, amount, price, book)
 
-            reduce_only = kwargs.get("reduce_only", False)
-
-            cost = amount * Decimal(str(price))
+            cost = self._cost(market, amount, price)
+            fee = cost * Decimal(str(self._fee_rate))
+            fee_currency = self._fee_currency(market)
 
             order = Order(
                 exchange=self._exchange_id,
@@ -350,28 +455,15 @@ class MockLinearConnector:
                 cum_cost=cost,
             )
             
-            order_filled = Order(
-                exchange=self._exchange_id,
-                symbol=symbol,
+            order_filled = msgspec.structs.replace(
+                order,
                 status=OrderStatus.FILLED,
-                id=order.id,
-                amount=amount,
                 filled=amount,
-                timestamp=self._clock.timestamp_ms(),
-                type=type,
-                side=side,
-                time_in_force=time_in_force,
-                price=price,
-                average=price,
                 remaining=Decimal(0),
-                reduce_only=reduce_only,
-                fee=fee,
-                fee_currency=fee_currency,
-                cost=cost,
-                cum_cost=cost,
+                timestamp=self._clock.timestamp_ms(),
             )
         
-            self._apply_position(order)
+            self._apply_fill(order, maker=False)
             self._msgbus.publish(topic=f"{self._exchange_id.value}.order", msg=order_filled)
             return order
         except OrderError as e:
@@ -389,11 +481,246 @@ class MockLinearConnector:
                 filled=Decimal(0),
                 remaining=amount,
             )
-            
+
+    def _rest_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        amount: Decimal,
+        price: float,
+        time_in_force: TimeInForce,
+        reduce_only: bool,
+        book: BookL1,
+    ) -> Order:
+        order = Order(
+            exchange=self._exchange_id,
+            symbol=symbol,
+            status=OrderStatus.PENDING,
+            id=UUID4().value,
+            amount=amount,
+            filled=Decimal(0),
+            timestamp=self._clock.timestamp_ms(),
+            type=type,
+            side=side,
+            time_in_force=time_in_force,
+            price=price,
+            remaining=amount,
+            reduce_only=reduce_only,
+            fee=Decimal(0),
+            fee_currency=self._fee_currency(self._market[symbol]),
+            cost=Decimal(0),
+            cum_cost=Decimal(0),
+        )
+        if time_in_force != TimeInForce.GTC:
+            # IOC / FOK orders that can not be filled at once
+            self._msgbus.publish(
+                topic=f"{self._exchange_id.value}.order",
+                msg=msgspec.structs.replace(order, status=OrderStatus.EXPIRED),
+            )
+            return order
+
+        self._open_orders[order.id] = order
+        self._lock(order)
+        self._matcher.add(RestingOrder(order.id, symbol, side, price, amount), book)
+        self._msgbus.publish(
+            topic=f"{self._exchange_id.value}.order",
+            msg=msgspec.structs.replace(order, status=OrderStatus.ACCEPTED),
+        )
+        return order
+
+    def _order_update(self, resting: RestingOrder, status: OrderStatus, **kwargs) -> Order:
+        return msgspec.structs.replace(
+            self._open_orders[resting.id],
+            status=status,
+            filled=resting.filled,
+            remaining=resting.remaining,
+            timestamp=self._clock.timestamp_ms(),
+            average=resting.price if resting.filled else None,
+            fee=resting.fee,
+            cum_cost=resting.cum_cost,
+            **kwargs,
+        )
+
+    def _apply_fills(self, fills: List[Fill]):
+        for resting, amount in fills:
+            cost = self._cost(self._market[resting.symbol], amount, resting.price)
+            fee = cost * Decimal(str(self._maker_fee_rate))
+            resting.cum_cost += cost
+            resting.fee += fee
+
+            template = self._open_orders[resting.id]
+            self._apply_fill(
+                msgspec.structs.replace(template, amount=amount, price=resting.price, fee=fee),
+                maker=True,
+            )
+            order = self._order_update(
+                resting,
+                OrderStatus.PARTIALLY_FILLED if resting.remaining else OrderStatus.FILLED,
+                last_filled=amount,
+                last_filled_price=resting.price,
+                cost=cost,
+            )
+            if not resting.remaining:
+                del self._open_orders[resting.id]
+            self._msgbus.publish(topic=f"{self._exchange_id.value}.order", msg=order)
+
+    def _on_bookl1(self, bookl1: BookL1):
+        if fills := self._matcher.on_bookl1(bookl1):
+            self._apply_fills(fills)
+
+    def _on_trade(self, trade: Trade):
+        if fills := self._matcher.on_trade(trade):
+            self._apply_fills(fills)
+
+    async def cancel_order(self, symbol: str, order_id: str, **kwargs) -> Order:
+        resting = self._matcher.cancel(order_id)
+        if resting is None:
+            self._log.error(f"Error canceling order: {order_id} is not open")
+            return Order(
+                exchange=self._exchange_id,
+                symbol=symbol,
+                id=order_id,
+                status=OrderStatus.CANCEL_FAILED,
+                timestamp=self._clock.timestamp_ms(),
+            )
+
+        order = self._order_update(resting, OrderStatus.CANCELING)
+        self._release(self._open_orders.pop(order_id), resting.remaining)
+        self._msgbus.publish(
+            topic=f"{self._exchange_id.value}.order",
+            msg=msgspec.structs.replace(order, status=OrderStatus.CANCELED),
+        )
+        return order
+
+    async def cancel_orders(self, symbol: str, order_ids: List[str], **kwargs) -> List[Order]:
+        return [await self.cancel_order(symbol, order_id, **kwargs) for order_id in order_ids]
+
+    async def create_orders(self, orders: List[BatchOrder]) -> List[Order]:
+        # filled one by one so that every order sees the margin used by the previous ones
+        return [
+            await self.create_order(
+                symbol=order.symbol,
+                side=order.side,
+                type=order.type,
+                amount=order.amount,
+                price=order.price,
+                time_in_force=order.time_in_force,
+                **order.kwargs,
+            )
+            for order in orders
+        ]
+
     @property
     def pnl(self) -> float:
         balances = self._cache.get_balance(self._account_type).balance_total
         return float(str(balances[self._quote_currency]))
+
+    @property
+    @abstractmethod
+    def unrealized_pnl(self) -> float:
+        pass
+
+    def _update_unrealized_pnl(self):
+        pass
+
+    def _apply_fee(self, order: Order):
+        """
+        apply fee to the balance
+        """
+        self._cache._update_free(self._account_type, order.fee_currency, -order.fee)
+        
+    async def _handle_pnl_update(self):
+        while True:
+            pnl, unrealized_pnl = self.pnl, self.unrealized_pnl
+            self._log.debug(f"Updating pnl: {pnl}, unrealized_pnl: {unrealized_pnl}")
+            await asyncio.sleep(self._update_interval)
+            self._update_unrealized_pnl()
+            await self._cache._sync_pnl(self._clock.timestamp_ms(), pnl, unrealized_pnl)
+    
+    async def connect(self):
+        self._log.debug(f"Starting mock connector for {self._account_type}")
+        await self._init_position()
+        await self._init_balance()
+        self._task_manager.create_task(self._handle_pnl_update())
+    
+    async def disconnect(self):
+        await self._cache._sync_pnl(self._clock.timestamp_ms(), self.pnl, self.unrealized_pnl)
+
+
+class MockLinearConnector(MockConnector):
+    """
+    open long -> cache.update_position
+    open short -> cache.update_position
+
+    close long -> cache.update_position -> cache.update_balance -> realized_pnl
+    close short -> cache.update_position -> cache.update_balance -> realized_pnl
+    """
+
+    def _check_market(self, symbol: str, market: BaseMarket):
+        if not market.linear:
+            raise OrderError(f"Symbol {symbol} is not a linear contract")
+
+        margin_asset = self._margin_asset(market)
+        if margin_asset not in self._cache.get_balance(self._account_type).balances:
+            raise OrderError(f"Symbol {symbol}: Not enough balance for {margin_asset}.")
+
+    def _check_order(
+        self,
+        symbol: str,
+        market: BaseMarket,
+        side: OrderSide,
+        amount: Decimal,
+        price: float,
+        book: BookL1,
+    ):
+        margin_balance = float(self._cache.get_balance(self._account_type).balance_total[self._margin_currency(market)])
+        notional = float(self._cost(market, amount, book.mid))
+
+        position = self._cache.get_position(symbol).value_or(None)
+        if position:
+            # If position exists, check direction
+            if (side.is_buy and position.side.is_long) or (side.is_sell and position.side.is_short):
+                # Same direction, add
+                total_notional = self._total_notional(market) + notional
+            else:
+                # Opposite direction, subtract
+                total_notional = self._total_notional(market) - notional
+        else:
+            # No existing position, just add
+            total_notional = self._total_notional(market) + notional
+        
+        if abs(total_notional) / margin_balance > self._leverage:
+            raise OrderError(f"Symbol {symbol}: Not enough margin for leverage: {self._leverage}")
+
+    def _margin_asset(self, market: BaseMarket) -> str:
+        """The asset the realized pnl is paid in"""
+        return market.quote
+
+    def _margin_currency(self, market: BaseMarket) -> str:
+        """The balance the leverage is checked against"""
+        return self._quote_currency
+
+    def _total_notional(self, market: BaseMarket) -> float:
+        return self.total_notional
+
+    def _cost(self, market: BaseMarket, amount: Decimal, price: float) -> Decimal:
+        return amount * Decimal(str(price))
+
+    def _fee_currency(self, market: BaseMarket) -> str:
+        return market.quote
+
+    def _position_pnl(self, market: BaseMarket, is_long: bool, entry_price: float, price: float, amount: Decimal) -> float:
+        price_diff = price - entry_price if is_long else entry_price - price
+        return float(amount) * price_diff
+
+    def _average_entry_price(self, market: BaseMarket, position: Position, order: Order, new_amount: Decimal) -> float:
+        return (
+            float(order.amount) * order.price + float(position.amount) * position.entry_price
+        ) / float(new_amount)
+
+    def _apply_fill(self, order: Order, maker: bool):
+        self._apply_position(order)
     
     @property
     def unrealized_pnl(self) -> float:
@@ -431,19 +758,10 @@ class MockLinearConnector:
                 )
                 return
 
-            if position.is_long:
-                unrealized_pnl = float(position.amount) * (book.mid - position.entry_price)
-            else:
-                unrealized_pnl = float(position.amount) * (position.entry_price - book.mid)
-            position.unrealized_pnl = unrealized_pnl
-    
-    def _apply_fee(self, order: Order):
-        """
-        apply fee to the balance
-        """
-        self._cache._mem_account_balance[self._account_type]._update_free(
-            order.fee_currency, -order.fee
-        )
+            position.unrealized_pnl = self._position_pnl(
+                self._market[symbol], position.is_long, position.entry_price, book.mid, position.amount
+            )
+            self._cache._apply_position(position)
 
     def _apply_position(self, order: Order):
         """Update position for perpetual contract"""
@@ -481,13 +799,14 @@ class MockLinearConnector:
 
             # Calculate realized PnL if closing or reducing position
             if not is_same_direction:
-                price_diff = order.price - position.entry_price if position.is_long else position.entry_price - order.price
                 closed_amount = min(position.amount, order.amount)
-                realized_pnl = float(closed_amount) * price_diff
+                realized_pnl = self._position_pnl(
+                    market, position.is_long, position.entry_price, order.price, closed_amount
+                )
                 
                 position.realized_pnl += realized_pnl
-                self._cache._mem_account_balance[self._account_type]._update_free(
-                    market.quote, Decimal(str(realized_pnl))
+                self._cache._update_free(
+                    self._account_type, self._margin_asset(market), Decimal(str(realized_pnl))
                 )
 
             # Update position details
@@ -495,9 +814,7 @@ class MockLinearConnector:
                 # Position maintains direction but with updated amount
                 if is_same_direction: # NOTE: add to position
                     # Average entry price when adding to position
-                    position.entry_price = (
-                        float(order.amount) * order.price + float(position.amount) * position.entry_price
-                    ) / float(new_amount)
+                    position.entry_price = self._average_entry_price(market, position, order, new_amount)
                 position.signed_amount = new_amount if position.is_long else -new_amount
             elif new_amount < Decimal('0'):
                 # Position flips direction
@@ -512,24 +829,178 @@ class MockLinearConnector:
 
         self._cache._apply_position(position)
         self._apply_fee(order)
-        
-    async def _handle_pnl_update(self):
-        while True:
-            pnl, unrealized_pnl = self.pnl, self.unrealized_pnl
-            self._log.debug(f"Updating pnl: {pnl}, unrealized_pnl: {unrealized_pnl}")
-            await asyncio.sleep(self._update_interval)
-            self._update_unrealized_pnl()
-            await self._cache._sync_pnl(self._clock.timestamp_ms(), pnl, unrealized_pnl)
-    
-    async def connect(self):
-        self._log.debug(f"Starting mock connector for {self._account_type}")
-        await self._init_position()
-        await self._init_balance()
-        self._task_manager.create_task(self._handle_pnl_update())
-    
-    async def disconnect(self):
-        await self._cache._sync_pnl(self._clock.timestamp_ms(), self.pnl, self.unrealized_pnl)
 
-    
-                
-            
+
+class MockInverseConnector(MockLinearConnector):
+    """
+    Coin margined contracts. The amount is in contracts of `market.contractSize`
+    quote currency, the margin, the fees and the pnl are in the settle coin:
+
+    long pnl = contracts * contract size * (1 / entry price - 1 / price)
+    short pnl = contracts * contract size * (1 / price - 1 / entry price)
+
+    `quote_currency` is the coin `pnl` is reported in, e.g. `BTC`.
+    """
+
+    def _check_market(self, symbol: str, market: BaseMarket):
+        if not market.inverse:
+            raise OrderError(f"Symbol {symbol} is not an inverse contract")
+
+        margin_asset = self._margin_asset(market)
+        if margin_asset not in self._cache.get_balance(self._account_type).balances:
+            raise OrderError(f"Symbol {symbol}: Not enough balance for {margin_asset}.")
+
+    def _margin_asset(self, market: BaseMarket) -> str:
+        return market.settle
+
+    def _margin_currency(self, market: BaseMarket) -> str:
+        return market.settle
+
+    def _total_notional(self, market: BaseMarket) -> float:
+        return self._coin_notional(market.settle)
+
+    @property
+    def total_notional(self) -> float:
+        """Notional in coin of the positions margined in `quote_currency`"""
+        return self._coin_notional(self._quote_currency)
+
+    def _coin_notional(self, coin: str) -> float:
+        notional = 0
+        for symbol, position in self._cache.get_all_positions(
+            self._exchange_id
+        ).items():
+            market = self._market[symbol]
+            if market.settle != coin:
+                continue
+            book = self._cache.bookl1(symbol)
+            if not book:
+                self._log.warn(
+                    f"Please subscribe to the `bookl1` data for {symbol} or data not ready"
+                )
+                continue
+            notional += float(self._cost(market, position.amount, book.mid))
+        return notional
+
+    def _cost(self, market: BaseMarket, amount: Decimal, price: float) -> Decimal:
+        return amount * Decimal(str(market.contractSize or 1)) / Decimal(str(price))
+
+    def _fee_currency(self, market: BaseMarket) -> str:
+        return market.settle
+
+    def _position_pnl(self, market: BaseMarket, is_long: bool, entry_price: float, price: float, amount: Decimal) -> float:
+        inverse_diff = 1 / entry_price - 1 / price if is_long else 1 / price - 1 / entry_price
+        return float(amount) * (market.contractSize or 1) * inverse_diff
+
+    def _average_entry_price(self, market: BaseMarket, position: Position, order: Order, new_amount: Decimal) -> float:
+        # the entry price that keeps the coin value of the contracts
+        return float(new_amount) / (
+            float(order.amount) / order.price + float(position.amount) / position.entry_price
+        )
+
+
+class MockSpotConnector(MockConnector):
+    """
+    buy -> pay the quote, receive the base
+    sell -> pay the base, receive the quote
+
+    An order resting in the book locks its balance as described in `Balance`:
+    a buy locks `amount * price` of the quote and a sell `amount` of the base,
+    the fills take from the locked balance and a cancel releases the rest. The
+    fees are paid in the quote.
+
+    There are no positions, `pnl` is the `quote_currency` balance and
+    `unrealized_pnl` the value of the other assets at the mid of their
+    `<asset>/<quote_currency>` book, their sum is the account value.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._asset_symbols: Dict[str, str] = {
+            market.base: symbol
+            for symbol, market in self._market.items()
+            if market.spot and market.quote == self._quote_currency
+        }
+
+    async def _init_position(self):
+        pass
+
+    def _check_market(self, symbol: str, market: BaseMarket):
+        if not market.spot:
+            raise OrderError(f"Symbol {symbol} is not a spot market")
+
+        balances = self._cache.get_balance(self._account_type).balances
+        for asset in (market.base, market.quote):
+            if asset not in balances:
+                raise OrderError(f"Symbol {symbol}: Not enough balance for {asset}.")
+
+    def _check_order(
+        self,
+        symbol: str,
+        market: BaseMarket,
+        side: OrderSide,
+        amount: Decimal,
+        price: float,
+        book: BookL1,
+    ):
+        free = self._cache.get_balance(self._account_type).balance_free
+        if side.is_buy:
+            asset = market.quote
+            required = self._cost(market, amount, price) * (1 + Decimal(str(self._fee_rate)))
+        else:
+            asset = market.base
+            required = amount
+        if free[asset] < required:
+            raise OrderError(f"Symbol {symbol}: Not enough balance for {asset}, free: {free[asset]}, required: {required}")
+
+    def _cost(self, market: BaseMarket, amount: Decimal, price: float) -> Decimal:
+        return amount * Decimal(str(price))
+
+    def _fee_currency(self, market: BaseMarket) -> str:
+        return market.quote
+
+    def _paid(self, order: Order) -> Tuple[str, Decimal]:
+        """The asset and the amount `order` pays"""
+        market = self._market[order.symbol]
+        if order.is_buy:
+            return market.quote, self._cost(market, order.amount, order.price)
+        return market.base, order.amount
+
+    def _lock(self, order: Order):
+        asset, amount = self._paid(order)
+        self._cache._update_free(self._account_type, asset, -amount)
+        self._cache._update_locked(self._account_type, asset, amount)
+
+    def _release(self, order: Order, remaining: Decimal):
+        asset, amount = self._paid(msgspec.structs.replace(order, amount=remaining))
+        self._cache._update_locked(self._account_type, asset, -amount)
+        self._cache._update_free(self._account_type, asset, amount)
+
+    def _apply_fill(self, order: Order, maker: bool):
+        market = self._market[order.symbol]
+        asset, amount = self._paid(order)
+        if maker:
+            self._cache._update_locked(self._account_type, asset, -amount)
+        else:
+            self._cache._update_free(self._account_type, asset, -amount)
+
+        if order.is_buy:
+            self._cache._update_free(self._account_type, market.base, order.amount)
+        else:
+            self._cache._update_free(self._account_type, market.quote, self._cost(market, order.amount, order.price))
+        self._apply_fee(order)
+
+    @property
+    def unrealized_pnl(self) -> float:
+        value = 0
+        for asset, total in self._cache.get_balance(self._account_type).balance_total.items():
+            if asset == self._quote_currency or not total:
+                continue
+            symbol = self._asset_symbols.get(asset)
+            book = self._cache.bookl1(symbol) if symbol else None
+            if not book:
+                self._log.warn(
+                    f"Please subscribe to the `bookl1` data of {asset}/{self._quote_currency} or data not ready"
+                )
+                continue
+            value += float(total) * book.mid
+        return value
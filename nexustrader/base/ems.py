@@ -1,6 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Callable, Awaitable
+from collections import defaultdict
 from typing import Literal
 from decimal import Decimal
 from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
@@ -16,12 +17,24 @@ from nexustrader.constants import (
     SubmitType,
     OrderType,
     OrderSide,
+    OrderStatus,
     AlgoOrderStatus,
 )
-from nexustrader.schema import OrderSubmit, AlgoOrder
+from nexustrader.schema import OrderSubmit, AlgoOrder, BatchOrderSubmit
 from nexustrader.base.connector import PrivateConnector
 from nexustrader.error import OrderError
 
+# statuses in which a twap child order is no longer in flight
+TWAP_SETTLED_STATUSES = frozenset(
+    (
+        OrderStatus.ACCEPTED,
+        OrderStatus.PARTIALLY_FILLED,
+        OrderStatus.FILLED,
+        OrderStatus.CANCELED,
+        OrderStatus.EXPIRED,
+    )
+)
+
 class ExecutionManagementSystem(ABC):
     def __init__(
         self,
@@ -44,9 +57,16 @@ class ExecutionManagementSystem(ABC):
         self._clock = LiveClock()
         self._order_submit_queues: Dict[AccountType, asyncio.Queue[OrderSubmit]] = {}
         self._private_connectors: Dict[AccountType, PrivateConnector] | None = None
+        self._max_inflight_orders: Dict[AccountType, int] = {}
         self._is_mock = is_mock
-    def _build(self, private_connectors: Dict[AccountType, PrivateConnector]):
+
+    def _build(
+        self,
+        private_connectors: Dict[AccountType, PrivateConnector],
+        max_inflight_orders: Dict[AccountType, int] | None = None,
+    ):
         self._private_connectors = private_connectors
+        self._max_inflight_orders = max_inflight_orders or {}
         self._build_order_submit_queues()
         self._set_account_type()
 
@@ -119,6 +139,12 @@ class ExecutionManagementSystem(ABC):
             ) * exp
         return format_price
 
+    async def _sleep(self, seconds: float):
+        """
+        Sleep of the algo orders, the backtest engine sleeps on its simulated clock
+        """
+        await asyncio.sleep(seconds)
+
     @abstractmethod
     def _build_order_submit_queues(self):
         """
@@ -135,7 +161,7 @@ class ExecutionManagementSystem(ABC):
 
     @abstractmethod
     def _submit_order(
-        self, order: OrderSubmit, account_type: AccountType | None = None
+        self, order: OrderSubmit | BatchOrderSubmit, account_type: AccountType | None = None
     ):
         """
         Submit an order
@@ -190,6 +216,52 @@ class ExecutionManagementSystem(ABC):
             self._msgbus.send(endpoint="failed", msg=order)
         return order
 
+    async def _create_batch_orders(
+        self, batch_submit: BatchOrderSubmit, account_type: AccountType
+    ) -> List[Order]:
+        """
+        Create a batch of orders, each result is linked back to its BatchOrder uuid
+        """
+        orders: List[Order] = await self._private_connectors[
+            account_type
+        ].create_orders(batch_submit.orders)
+        for batch_order, order in zip(batch_submit.orders, orders):
+            order.uuid = batch_order.uuid
+            if order.success:
+                self._registry.register_order(order)
+                self._cache._order_initialized(order)  # INITIALIZED -> PENDING
+                self._msgbus.send(endpoint="pending", msg=order)
+            else:
+                self._cache._order_status_update(order)  # INITIALIZED -> FAILED
+                self._msgbus.send(endpoint="failed", msg=order)
+        return orders
+
+    async def _cancel_all_orders(
+        self, batch_submit: BatchOrderSubmit, account_type: AccountType
+    ) -> List[Order]:
+        """
+        Cancel all open orders of a symbol, the exchange order ids are mapped back to uuids through the registry
+        """
+        symbol = batch_submit.symbol
+        order_ids = []
+        for uuid in self._cache.get_open_orders(symbol=symbol).copy():
+            if order_id := self._registry.get_order_id(uuid):
+                order_ids.append(order_id)
+        if not order_ids:
+            return []
+
+        orders: List[Order] = await self._private_connectors[
+            account_type
+        ].cancel_orders(symbol=symbol, order_ids=order_ids, **batch_submit.kwargs)
+        for order_id, order in zip(order_ids, orders):
+            order.uuid = self._registry.get_uuid(order_id)
+            if order.success:
+                self._cache._order_status_update(order)  # SOME STATUS -> CANCELING
+                self._msgbus.send(endpoint="canceling", msg=order)
+            else:
+                self._msgbus.send(endpoint="cancel_failed", msg=order)
+        return orders
+
     async def _create_stop_loss_order(
         self, order_submit: OrderSubmit, account_type: AccountType
     ):
@@ -335,14 +407,14 @@ class ExecutionManagementSystem(ABC):
         self._log.info(f"CALCULATE LIMIT ORDER PRICE: symbol: {symbol}, side: {side}, price: {price}, ask: {book.ask}, bid: {book.bid}")
         return price
 
-    def _cal_filled_info(self, order_ids: List[str]) -> Dict[str, Decimal | float]:
+    async def _cal_filled_info(self, order_ids: List[str]) -> Dict[str, Decimal | float]:
         """
         Calculate the filled info
         """
         filled = Decimal(0)
         cost = 0
         for order_id in order_ids:
-            order = self._cache.get_order(order_id).unwrap()
+            order = (await self._cache.get_order_async(order_id)).unwrap()
             if order.is_closed:
                 filled += order.filled
                 cost += order.average * float(order.filled)
@@ -406,25 +478,16 @@ class ExecutionManagementSystem(ABC):
         order_make_id = order_make.uuid
         algo_order.orders.append(order_make_id)
         
-        # 4) wait for the order to be filled
-        await asyncio.sleep(wait)
-        
+        # 4) wait for the order to be filled, wakes up as soon as the order is closed
+        order = await self._cache.wait_for(order_make_id, timeout=wait)
+
         # 5) check the order the order status and the book price
         # 5.1) if side.is_buy and bid > price, then cancel the order
         # 5.2) if side.is_sell and ask < price, then cancel the order
         start_time = self._clock.timestamp_ms()
-        while True:
-            _order_make = self._cache.get_order(order_make_id)  # Maybe[Order] _ added before means the order is Maybe[Order]
-            is_opened = _order_make.bind_optional(lambda order: order.is_opened).value_or(
-                False
-            )
-            on_flight = _order_make.bind_optional(lambda order: order.on_flight).value_or(
-                False
-            )
-            is_closed = _order_make.bind_optional(lambda order: order.is_closed).value_or(
-                False
-            )
-            if is_opened and not on_flight:
+        while order is None:
+            _order_make = (await self._cache.get_order_async(order_make_id)).value_or(None)
+            if _order_make is not None and _order_make.is_opened and not _order_make.on_flight:
                 book = self._cache.bookl1(symbol)
                 if (
                     side.is_buy
@@ -443,41 +506,34 @@ class ExecutionManagementSystem(ABC):
                         ),
                         account_type=account_type,
                     )
-            elif is_closed:
-                # 6) closed has 2 status: FILLED and CANCELED
-                # 6.1) if FILLED, then remaining amount is 0 -> break
-                # 6.2) if CANCELED, then check the remaining amount
-                # 6.3) if remaining amount is greater than min order amount, then create a market order
-                # 6.4) if remaining amount is less than min order amount, then break
-                # 6.5) if reduce_only is True, then no need to follow the min order amount filter
-                remaining = _order_make.unwrap().remaining
-                if remaining >= min_order_amount or (kwargs.get('reduce_only', False) and remaining > Decimal(0)): 
-                    order_take = await self._create_order(
-                        order_submit=OrderSubmit(
-                            symbol=symbol,
-                            instrument_id=instrument_id,
-                            submit_type=SubmitType.CREATE,
-                            side=side,
-                            type=OrderType.MARKET,
-                            amount=remaining,
-                            kwargs=kwargs,
-                        ),
-                        account_type=account_type,
-                    )
-                    if order_take.success:
-                        algo_order.orders.append(order_take.uuid)
-                        # 6.5) wait for the order to be closed
-                        while True:
-                            _order_taker = self._cache.get_order(order_take.uuid)
-                            is_closed = _order_taker.bind_optional(
-                                lambda order: order.is_closed
-                            ).value_or(False)
-                            if is_closed:
-                                break
-                            await asyncio.sleep(check_interval)
-                break
-            await asyncio.sleep(check_interval)
-        
+            # the book is re-checked every check_interval, a status update ends the wait at once
+            order = await self._cache.wait_for(order_make_id, timeout=check_interval)
+
+        # 6) closed has 2 status: FILLED and CANCELED
+        # 6.1) if FILLED, then remaining amount is 0
+        # 6.2) if CANCELED, then check the remaining amount
+        # 6.3) if remaining amount is greater than min order amount, then create a market order
+        # 6.4) if remaining amount is less than min order amount, then finish
+        # 6.5) if reduce_only is True, then no need to follow the min order amount filter
+        remaining = order.remaining
+        if remaining >= min_order_amount or (kwargs.get('reduce_only', False) and remaining > Decimal(0)):
+            order_take = await self._create_order(
+                order_submit=OrderSubmit(
+                    symbol=symbol,
+                    instrument_id=instrument_id,
+                    submit_type=SubmitType.CREATE,
+                    side=side,
+                    type=OrderType.MARKET,
+                    amount=remaining,
+                    kwargs=kwargs,
+                ),
+                account_type=account_type,
+            )
+            if order_take.success:
+                algo_order.orders.append(order_take.uuid)
+                # 6.6) wait for the order to be closed
+                await self._cache.wait_for(order_take.uuid)
+
         make_ratio = 1 - float(remaining) / float(amount)
         return make_ratio
     
@@ -555,7 +611,7 @@ class ExecutionManagementSystem(ABC):
 
             # 2) calculate the filled info
             # 2.1) if the filled is 0, then the order is failed
-            filled_info = self._cal_filled_info(algo_order.orders)
+            filled_info = await self._cal_filled_info(algo_order.orders)
             
             open_filled = filled_info["filled"]
             open_cost = filled_info["cost"]
@@ -638,16 +694,16 @@ class ExecutionManagementSystem(ABC):
                     
                 if self._clock.timestamp_ms() - start_time > sl_tp_duration * 1000:
                     break
-                await asyncio.sleep(check_interval)
+                await self._sleep(check_interval)
             
             # 4) cancel the tp and sl orders
             # 4.1) if the break loop time is earlier than the sl_tp_duration, then wait for the rest of the time
+            # 4.2) the wait ends early once the tp or sl order is closed
             time_elapsed = self._clock.timestamp_ms() - start_time
-            await asyncio.sleep(max(0, sl_tp_duration * 1000 - time_elapsed) / 1000)
+            time_left = max(0, sl_tp_duration * 1000 - time_elapsed) / 1000
             
             if tp_order_id:
-                tp_order = self._cache.get_order(tp_order_id).unwrap()
-                if tp_order.is_opened:
+                if not await self._cache.wait_for(tp_order_id, timeout=time_left):
                     await self._cancel_order(
                         order_submit=OrderSubmit(
                             symbol=symbol,
@@ -661,8 +717,7 @@ class ExecutionManagementSystem(ABC):
                         f"ADAPTIVE MAKER ORDER: symbol: {symbol}, uuid: {adp_maker_order_uuid} tp hit but not filled, cancel tp order: {tp_order_id}"
                     )
             if sl_order_id:
-                sl_order = self._cache.get_order(sl_order_id).unwrap()
-                if sl_order.is_opened:
+                if not await self._cache.wait_for(sl_order_id, timeout=time_left):
                     await self._cancel_order(
                         order_submit=OrderSubmit(
                             symbol=symbol,
@@ -719,7 +774,7 @@ class ExecutionManagementSystem(ABC):
                     account_type=account_type,
                 )
 
-            filled_info = self._cal_filled_info(algo_order.orders)
+            filled_info = await self._cal_filled_info(algo_order.orders)
             algo_order.filled = filled_info["filled"]
             algo_order.cost = filled_info["cost"]
             algo_order.average = filled_info["average"]
@@ -776,20 +831,14 @@ class ExecutionManagementSystem(ABC):
         try:
             while amount_list:
                 if order_id:
-                    order = self._cache.get_order(order_id)
-
-                    is_opened = order.bind_optional(
-                        lambda order: order.is_opened
-                    ).value_or(False)
-                    on_flight = order.bind_optional(
-                        lambda order: order.on_flight
-                    ).value_or(False)
-                    is_closed = order.bind_optional(
-                        lambda order: order.is_closed
-                    ).value_or(False)
+                    check_start = self._clock.timestamp_ms()
+                    # wait for the in-flight request to settle, a closed order returns at once
+                    order = await self._cache.wait_for(
+                        order_id, statuses=TWAP_SETTLED_STATUSES, timeout=check_interval
+                    )
 
                     # 检查现价单是否已成交，不然的话立刻下市价单成交 或者 把remaining amount加到下一个市价单上
-                    if is_opened and not on_flight:
+                    if order is not None and order.is_opened:
                         await self._cancel_order(
                             order_submit=OrderSubmit(
                                 symbol=symbol,
@@ -799,9 +848,11 @@ class ExecutionManagementSystem(ABC):
                             ),
                             account_type=account_type,
                         )
-                    elif is_closed:
+                        order = await self._cache.wait_for(order_id, timeout=check_interval)
+
+                    if order is not None and order.is_closed:
                         order_id = None
-                        remaining = order.unwrap().remaining
+                        remaining = order.remaining
                         if remaining >= min_order_amount or (reduce_only and remaining > 0):
                             order = await self._create_order(
                                 order_submit=OrderSubmit(
@@ -829,8 +880,7 @@ class ExecutionManagementSystem(ABC):
                         else:
                             if amount_list:
                                 amount_list[-1] += remaining
-                    await asyncio.sleep(check_interval)
-                    elapsed_time += check_interval
+                    elapsed_time += (self._clock.timestamp_ms() - check_start) / 1000
                 else:
                     price = self._cal_limit_order_price(
                         symbol=symbol,
@@ -866,7 +916,7 @@ class ExecutionManagementSystem(ABC):
                         order_id = order.uuid
                         algo_order.orders.append(order_id)
                         self._cache._order_status_update(algo_order)
-                        await asyncio.sleep(wait - elapsed_time)
+                        await self._sleep(wait - elapsed_time)
                         elapsed_time = 0
                     else:
                         algo_order.status = AlgoOrderStatus.FAILED
@@ -947,7 +997,7 @@ class ExecutionManagementSystem(ABC):
         self._task_manager.cancel_task(uuid)
 
     async def _handle_submit_order(
-        self, account_type: AccountType, queue: asyncio.Queue[OrderSubmit]
+        self, account_type: AccountType, queue: asyncio.Queue[OrderSubmit | BatchOrderSubmit]
     ):
         """
         Handle the order submit
@@ -961,14 +1011,89 @@ class ExecutionManagementSystem(ABC):
             SubmitType.TAKE_PROFIT: self._create_take_profit_order,
             SubmitType.ADP_MAKER: self._create_adp_maker_order,
             SubmitType.CANCEL_ADP_MAKER: self._cancel_adp_maker_order,
+            SubmitType.BATCH_CREATE: self._create_batch_orders,
+            SubmitType.CANCEL_ALL: self._cancel_all_orders,
         }
 
+        # up to `max_inflight` submits are sent at once. Before taking a slot a
+        # submit waits for the in-flight submits it must follow: the previous
+        # submit of the same uuid (create -> cancel) and a pending CANCEL_ALL of
+        # its symbol. CANCEL_ALL itself waits for every submit of the symbol.
+        window = asyncio.Semaphore(self._max_inflight_orders.get(account_type, 1))
+        uuid_tasks: Dict[str, asyncio.Task] = {}  # uuid -> last submit of the uuid
+        symbol_tasks: Dict[str, Set[asyncio.Task]] = defaultdict(set)  # symbol -> in-flight submits
+        cancel_all_tasks: Dict[str, asyncio.Task] = {}  # symbol -> pending CANCEL_ALL
+
         self._log.debug(f"Handling orders for account type: {account_type}")
         while True:
             order_submit = await queue.get()
             self._log.debug(f"[ORDER SUBMIT]: {order_submit}")
-            handler = submit_handlers[order_submit.submit_type]
-            await handler(order_submit, account_type)
+
+            if isinstance(order_submit, BatchOrderSubmit):
+                uuids = [order.uuid for order in order_submit.orders]
+                symbols = {order.symbol for order in order_submit.orders} or {
+                    order_submit.symbol
+                }
+            else:
+                uuids = [order_submit.uuid]
+                symbols = {order_submit.symbol}
+
+            if order_submit.submit_type == SubmitType.CANCEL_ALL:
+                deps = set(symbol_tasks[order_submit.symbol])
+            else:
+                deps = {uuid_tasks[uuid] for uuid in uuids if uuid in uuid_tasks}
+                deps.update(
+                    cancel_all_tasks[symbol]
+                    for symbol in symbols
+                    if symbol in cancel_all_tasks
+                )
+
+            task = self._task_manager.create_task(
+                self._execute_submit(
+                    submit_handlers[order_submit.submit_type],
+                    order_submit,
+                    account_type,
+                    deps,
+                    window,
+                    queue,
+                )
+            )
+
+            for uuid in uuids:
+                uuid_tasks[uuid] = task
+            for symbol in symbols:
+                symbol_tasks[symbol].add(task)
+            if order_submit.submit_type == SubmitType.CANCEL_ALL:
+                cancel_all_tasks[order_submit.symbol] = task
+
+            def _on_done(task: asyncio.Task, uuids=uuids, symbols=symbols):
+                for uuid in uuids:
+                    if uuid_tasks.get(uuid) is task:
+                        del uuid_tasks[uuid]
+                for symbol in symbols:
+                    symbol_tasks[symbol].discard(task)
+                    if not symbol_tasks[symbol]:
+                        del symbol_tasks[symbol]
+                    if cancel_all_tasks.get(symbol) is task:
+                        del cancel_all_tasks[symbol]
+
+            task.add_done_callback(_on_done)
+
+    async def _execute_submit(
+        self,
+        handler: Callable[[OrderSubmit | BatchOrderSubmit, AccountType], Awaitable],
+        order_submit: OrderSubmit | BatchOrderSubmit,
+        account_type: AccountType,
+        deps: Set[asyncio.Task],
+        window: asyncio.Semaphore,
+        queue: asyncio.Queue,
+    ):
+        try:
+            if deps:
+                await asyncio.wait(deps)
+            async with window:
+                await handler(order_submit, account_type)
+        finally:
             queue.task_done()
 
     async def start(self):
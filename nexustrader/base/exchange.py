@@ -1,16 +1,47 @@
+import time
+import asyncio
 import warnings
+from pathlib import Path
 
-import ccxt 
+import msgspec
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, Generic, List, Tuple, Type, TypeVar, TYPE_CHECKING
 from nexustrader.schema import BaseMarket
 from nexustrader.constants import ExchangeType
 from nexustrader.core.log import SpdLog
 
+if TYPE_CHECKING:
+    import ccxt
+
+
+MarketT = TypeVar("MarketT", bound=BaseMarket)
+
+
+class MarketSnapshot(msgspec.Struct, Generic[MarketT]):
+    """Markets of an exchange saved on disk, `timestamp` is in ms"""
+
+    timestamp: int
+    market: Dict[str, MarketT]
+    market_id: Dict[str, str]
 
 
 class ExchangeManager(ABC):
-    def __init__(self, config: Dict[str, Any]):
+    market_type: Type[BaseMarket] = BaseMarket
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        market_cache_dir: str | None = None,
+        market_cache_ttl: int = 86400,
+    ):
+        """
+        Args:
+            market_cache_dir: Directory of the market snapshot. The markets are
+                loaded from a snapshot younger than `market_cache_ttl` seconds
+                instead of the exchange, and `refresh_markets` reconciles them
+                later. None always loads from the exchange.
+            market_cache_ttl: Seconds a snapshot can be used for
+        """
         self.config = config
         self.api_key = config.get("apiKey", None)
         self.secret = config.get("secret", None)
@@ -23,16 +54,33 @@ class ExchangeManager(ABC):
         self.market: Dict[str, BaseMarket] = {}
         self.market_id: Dict[str, str] = {}
 
+        self._market_cache_path = None
+        if market_cache_dir:
+            suffix = "_testnet" if self.is_testnet else ""
+            self._market_cache_path = (
+                Path(market_cache_dir) / f"{self.exchange_id.value}{suffix}.msgpack"
+            )
+        self._market_cache_ttl = market_cache_ttl
+        self._snapshot_type = MarketSnapshot[self.market_type]
+        # True when the markets come from the snapshot and are not reconciled yet
+        self.market_from_cache = False
+
         if not self.api_key or not self.secret:
             warnings.warn(
                 "API Key and Secret not provided, So some features related to trading will not work"
             )
-        self.load_markets()
+        if self._load_market_cache():
+            self.market_from_cache = True
+        else:
+            self.load_markets()
+            self._save_market_cache()
 
-    def _init_exchange(self) -> ccxt.Exchange:
+    def _init_exchange(self) -> "ccxt.Exchange":
         """
         Initialize the exchange
         """
+        import ccxt  # slow to import, only needed once an exchange is built
+
         try:
             exchange_class = getattr(ccxt, self.config["exchange_id"])
         except AttributeError:
@@ -62,9 +110,82 @@ class ExchangeManager(ABC):
             return f"{mkt.base}{mkt.quote}-PERP.{exchange_suffix}"
 
     @abstractmethod
-    def load_markets(self):
+    def _parse_markets(
+        self, markets: Dict[str, Any]
+    ) -> Tuple[Dict[str, BaseMarket], Dict[str, str]]:
+        """Parse the ccxt markets into the `market` and `market_id` mappings"""
         pass
 
+    def _fetch_markets(self) -> Tuple[Dict[str, BaseMarket], Dict[str, str]]:
+        return self._parse_markets(self.api.load_markets(reload=True))
+
+    def load_markets(self):
+        """Load the markets from the exchange"""
+        market, market_id = self._fetch_markets()
+        self.market.update(market)
+        self.market_id.update(market_id)
+
+    async def refresh_markets(self):
+        """
+        Reload the markets from the exchange and update the snapshot. The
+        mappings are updated in place since the connectors hold them.
+        """
+        try:
+            market, market_id = await asyncio.to_thread(self._fetch_markets)
+        except Exception as e:
+            self._log.warn(f"Failed to refresh markets, keeping the cached ones: {e}")
+            return
+        self.market.update(market)
+        self.market_id.update(market_id)
+        self.market_from_cache = False
+        if self._market_cache_path:
+            await asyncio.to_thread(
+                self._write_market_cache, self._encode_market_cache()
+            )
+
+    def _load_market_cache(self) -> bool:
+        if not self._market_cache_path or not self._market_cache_path.exists():
+            return False
+        try:
+            snapshot = msgspec.msgpack.decode(
+                self._market_cache_path.read_bytes(), type=self._snapshot_type
+            )
+        except (OSError, msgspec.DecodeError) as e:
+            self._log.warn(f"Ignoring market snapshot {self._market_cache_path}: {e}")
+            return False
+        age = time.time() - snapshot.timestamp / 1000
+        if age > self._market_cache_ttl:
+            return False
+        self.market.update(snapshot.market)
+        self.market_id.update(snapshot.market_id)
+        self._log.debug(
+            f"Loaded {len(snapshot.market)} markets from {self._market_cache_path}, {age:.0f}s old"
+        )
+        return True
+
+    def _encode_market_cache(self) -> bytes:
+        return msgspec.msgpack.encode(
+            MarketSnapshot(
+                timestamp=int(time.time() * 1000),
+                market=self.market,
+                market_id=self.market_id,
+            )
+        )
+
+    def _write_market_cache(self, data: bytes):
+        path = self._market_cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)  # atomic, readers never see a partial snapshot
+        except OSError as e:
+            self._log.warn(f"Failed to write market snapshot {path}: {e}")
+
+    def _save_market_cache(self):
+        if self._market_cache_path:
+            self._write_market_cache(self._encode_market_cache())
+
 
     def linear(self, base: str | None = None, quote: str | None = None, exclude: List[str] | None = None) -> List[str]:
         symbols = []
@@ -0,0 +1,189 @@
+import heapq
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Tuple
+
+from nexustrader.constants import OrderSide
+from nexustrader.schema import BookL1, Trade
+
+
+class RestingOrder:
+    """
+    A limit order resting in the `OrderMatcher`.
+
+    `queue_ahead` is the estimated size ahead of the order at its price: the
+    visible size of the level when the order joined it, reduced by the trades
+    at the price and by the level shrinking. `None` while the level was not yet
+    seen at the top of the book. `filled` is updated by the matcher,
+    `cum_cost` and `fee` are kept by the connector.
+    """
+
+    __slots__ = ("id", "symbol", "side", "price", "amount", "filled", "cum_cost", "fee", "queue_ahead")
+
+    def __init__(self, id: str, symbol: str, side: OrderSide, price: float, amount: Decimal):
+        self.id = id
+        self.symbol = symbol
+        self.side = side
+        self.price = price
+        self.amount = amount
+        self.filled = Decimal(0)
+        self.cum_cost = Decimal(0)
+        self.fee = Decimal(0)
+        self.queue_ahead: float | None = None
+
+    @property
+    def remaining(self) -> Decimal:
+        return self.amount - self.filled
+
+
+Fill = Tuple[RestingOrder, Decimal]  # the order and the amount filled
+
+
+class _BookSide:
+    """Resting orders of one side of a symbol, FIFO queues indexed by price with a heap of the prices"""
+
+    def __init__(self, side: OrderSide):
+        self._sign = -1 if side.is_buy else 1  # the best price is the smallest key
+        self._levels: Dict[float, Deque[RestingOrder]] = {}
+        self._heap: List[float] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._levels)
+
+    def add(self, order: RestingOrder):
+        level = self._levels.get(order.price)
+        if level is None:
+            level = self._levels[order.price] = deque()
+            heapq.heappush(self._heap, self._sign * order.price)
+        level.append(order)
+
+    def remove(self, order: RestingOrder):
+        level = self._levels[order.price]
+        level.remove(order)
+        if not level:
+            # the heap entry is dropped lazily by `best`
+            del self._levels[order.price]
+
+    def best(self) -> float | None:
+        heap = self._heap
+        while heap:
+            price = self._sign * heap[0]
+            if price in self._levels:
+                return price
+            heapq.heappop(heap)
+        return None
+
+    def level(self, price: float) -> Deque[RestingOrder] | None:
+        return self._levels.get(price)
+
+    def pop_level(self, price: float) -> Deque[RestingOrder]:
+        return self._levels.pop(price)
+
+    def is_better(self, price: float, other: float) -> bool:
+        """Whether `price` is better than `other` for this side"""
+        return self._sign * price < self._sign * other
+
+
+class OrderMatcher:
+    """
+    Fill the resting limit orders of a mock connector from the market data.
+
+    - A BookL1 whose opposite side reaches the order price fills the whole price level.
+    - A trade through the order price fills the whole level. A trade at the
+      order price first consumes `queue_ahead` and fills the orders of the
+      level with the rest, in time priority.
+    - A BookL1 at the order price lowers `queue_ahead` to the visible size of
+      the level, the size that left the level may have been ahead of the order.
+
+    The orders are filled at their limit price. Only the best price level of
+    each side is looked at, an update costs O(log n) in the resting price
+    levels plus the orders filled.
+    """
+
+    def __init__(self):
+        self._books: Dict[str, Tuple[_BookSide, _BookSide]] = {}
+        self._orders: Dict[str, RestingOrder] = {}
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    def _side(self, symbol: str, side: OrderSide) -> _BookSide:
+        if symbol not in self._books:
+            self._books[symbol] = (_BookSide(OrderSide.BUY), _BookSide(OrderSide.SELL))
+        bids, asks = self._books[symbol]
+        return bids if side.is_buy else asks
+
+    def add(self, order: RestingOrder, book: BookL1):
+        book_price, book_size = (book.bid, book.bid_size) if order.side.is_buy else (book.ask, book.ask_size)
+        side = self._side(order.symbol, order.side)
+        if order.price == book_price:
+            order.queue_ahead = book_size
+        elif side.is_better(order.price, book_price):
+            order.queue_ahead = 0.0
+        side.add(order)
+        self._orders[order.id] = order
+
+    def cancel(self, order_id: str) -> RestingOrder | None:
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            self._side(order.symbol, order.side).remove(order)
+        return order
+
+    def _fill_through(self, side: _BookSide, reached, fills: List[Fill]):
+        """Fill the levels at or better than the opposite price"""
+        while (price := side.best()) is not None and reached(price):
+            for order in side.pop_level(price):
+                fills.append((order, order.remaining))
+                order.filled = order.amount
+                del self._orders[order.id]
+
+    def _fill_queue(self, side: _BookSide, price: float, size: float, fills: List[Fill]):
+        """Fill the level `price` with a trade of `size` at the price"""
+        level = side.level(price)
+        filled = []
+        for order in level:
+            if order.queue_ahead is None:
+                break
+            order.queue_ahead -= size
+            if order.queue_ahead >= 0:
+                continue
+            amount = min(order.remaining, Decimal(str(-order.queue_ahead)))
+            order.queue_ahead = 0.0
+            size -= float(amount)
+            fills.append((order, amount))
+            order.filled += amount
+            if not order.remaining:
+                filled.append(order)
+        for order in filled:
+            side.remove(order)
+            del self._orders[order.id]
+
+    def on_bookl1(self, book: BookL1) -> List[Fill]:
+        if book.symbol not in self._books:
+            return []
+        fills: List[Fill] = []
+        bids, asks = self._books[book.symbol]
+        for side, price, size, opposite in (
+            (bids, book.bid, book.bid_size, book.ask),
+            (asks, book.ask, book.ask_size, book.bid),
+        ):
+            if not side:
+                continue
+            self._fill_through(side, lambda p: not side.is_better(opposite, p), fills)
+            if level := side.level(price):
+                for order in level:
+                    if order.queue_ahead is None or order.queue_ahead > size:
+                        order.queue_ahead = size
+        return fills
+
+    def on_trade(self, trade: Trade) -> List[Fill]:
+        if trade.symbol not in self._books:
+            return []
+        fills: List[Fill] = []
+        for side in self._books[trade.symbol]:
+            if not side:
+                continue
+            self._fill_through(side, lambda p: side.is_better(p, trade.price), fills)
+            if side.level(trade.price):
+                self._fill_queue(side, trade.price, trade.size, fills)
+        return fills
@@ -1,13 +1,13 @@
 import asyncio
 import orjson
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict
 from typing import Callable, Literal
-import logging
 
 from aiolimiter import AsyncLimiter
 from nexustrader.core.log import SpdLog
 from nexustrader.core.entity import TaskManager
+from nexustrader.error import WSNotConnectedError
 from picows import (
     ws_connect,
     WSFrame,
@@ -31,23 +31,61 @@ from nexustrader.core.nautilius_core import LiveClock
 # picows_logger.setLevel(PICOWS_DEBUG_LL)
 # picows_logger.addHandler(file_handler)
 
+def peek_str_field(raw: bytes | memoryview, prefix: bytes, limit: int = 128) -> bytes | None:
+    """Read a leading JSON string field from a raw frame without decoding it.
+
+    Exchanges put the routing key (event type, topic, channel) at the start of
+    their push messages, so only a bounded head of the frame is inspected, a
+    memoryview copies that head and never the whole frame.
+
+    Args:
+        raw: Raw frame payload
+        prefix: Bytes preceding the value, e.g. ``b'{"e":"'``
+        limit: Number of leading bytes to scan
+
+    Returns:
+        The field value, or None if the frame does not start with ``prefix``
+    """
+    start = len(prefix)
+    if raw[:start] != prefix:
+        return None
+    stop = min(limit, len(raw))
+    if isinstance(raw, bytes):
+        end = raw.find(b'"', start, stop)
+        if end == -1:
+            return None
+        return raw[start:end]
+    # a memoryview has no `find`, only the bounded head is copied
+    head = bytes(raw[start:stop])
+    end = head.find(b'"')
+    if end == -1:
+        return None
+    return head[:end]
+
+
 class Listener(WSListener):
     """WebSocket listener implementation that handles connection events and message frames.
     
     Inherits from picows.WSListener to provide WebSocket event handling functionality.
     """
     
-    def __init__(self, callback, logger, specific_ping_msg=None, *args, **kwargs):
+    def __init__(
+        self, callback, logger, specific_ping_msg=None, zero_copy=False, *args, **kwargs
+    ):
         """Initialize the WebSocket listener.
         
         Args:
             logger: Logger instance for logging events
             specific_ping_msg: Optional custom ping message
+            zero_copy: If True, TEXT payloads are passed to the callback as a
+                memoryview over the frame buffer instead of a bytes copy. The
+                view is only valid for the duration of the callback.
         """
         super().__init__(*args, **kwargs)
         self._log = logger
         self._specific_ping_msg = specific_ping_msg
         self._callback = callback
+        self._zero_copy = zero_copy
         
     def send_user_specific_ping(self, transport: WSTransport) -> None:
         """Send a custom ping message or default ping frame.
@@ -93,8 +131,12 @@ class Listener(WSListener):
                     transport.send_pong(frame.get_payload_as_bytes())
                     return
                 case WSMsgType.TEXT:
-                    # Queue raw bytes for handler to decode
-                    self._callback(frame.get_payload_as_bytes())
+                    if self._zero_copy:
+                        # Hand the handler a view over the frame buffer, it must
+                        # not keep a reference to it after returning
+                        self._callback(frame.get_payload_as_memoryview())
+                    else:
+                        self._callback(frame.get_payload_as_bytes())
                     return
                 case WSMsgType.CLOSE:
                     close_code = frame.get_close_code()
@@ -123,6 +165,7 @@ class WSClient(ABC):
         ] = "ping_when_idle",
         enable_auto_ping: bool = True,
         enable_auto_pong: bool = False,
+        zero_copy: bool = False,
     ):
         self._clock = LiveClock()
         self._url = url
@@ -137,11 +180,14 @@ class WSClient(ABC):
         self._subscriptions = []
         self._limiter = limiter
         self._callback = handler
+        self._zero_copy = zero_copy
         if auto_ping_strategy == "ping_when_idle":
             self._auto_ping_strategy = WSAutoPingStrategy.PING_WHEN_IDLE
         elif auto_ping_strategy == "ping_periodically":
             self._auto_ping_strategy = WSAutoPingStrategy.PING_PERIODICALLY
         self._task_manager = task_manager
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._request_count = 0
         self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
 
     @property
@@ -149,7 +195,7 @@ class WSClient(ABC):
         return self._transport and self._listener
 
     async def _connect(self):
-        WSListenerFactory = lambda: Listener(self._callback, self._log, self._specific_ping_msg)  # noqa: E731
+        WSListenerFactory = lambda: Listener(self._callback, self._log, self._specific_ping_msg, self._zero_copy)  # noqa: E731
         self._transport, self._listener = await ws_connect(
             WSListenerFactory,
             self._url,
@@ -184,11 +230,56 @@ class WSClient(ABC):
         await self._limiter.acquire()
         self._transport.send(WSMsgType.TEXT, orjson.dumps(payload))
 
+    def _next_request_id(self) -> str:
+        self._request_count += 1
+        return str(self._request_count)
+
+    async def _request(
+        self,
+        req_id: str,
+        payload: dict,
+        timeout: float,
+        limiter: AsyncLimiter | None = None,
+    ) -> Any:
+        """Send a request and wait for the response carrying the same id.
+
+        The response is handed over by `_resolve_request` from the message handler.
+
+        Raises:
+            WSNotConnectedError: If the request could not be sent
+            ConnectionError: If the connection dropped before the response arrived
+            asyncio.TimeoutError: If no response arrived within `timeout` seconds
+        """
+        if self.connected:
+            await (limiter or self._limiter).acquire()
+        if not self.connected:
+            raise WSNotConnectedError(f"{self._url} is not connected")
+        fut = asyncio.get_running_loop().create_future()
+        self._pending_requests[req_id] = fut
+        try:
+            self._transport.send(WSMsgType.TEXT, orjson.dumps(payload))
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            self._pending_requests.pop(req_id, None)
+
+    def _resolve_request(self, req_id: str, response: Any) -> bool:
+        fut = self._pending_requests.get(req_id)
+        if fut is None or fut.done():
+            return False
+        fut.set_result(response)
+        return True
+
+    def _fail_pending_requests(self):
+        for fut in self._pending_requests.values():
+            if not fut.done():
+                fut.set_exception(ConnectionError(f"{self._url} disconnected"))
+
     def disconnect(self):
         if self.connected:
             self._log.debug("Disconnecting from websocket...")
             self._transport.disconnect()
             self._transport, self._listener = None, None
+        self._fail_pending_requests()
 
     @abstractmethod
     async def _resubscribe(self):
@@ -1,9 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
-from nexustrader.constants import AccountType, ExchangeType, StorageBackend
+from typing import Dict, List, TYPE_CHECKING
+from nexustrader.constants import AccountType, ExchangeType, StorageBackend, HttpTransportType, JournalFsync, DataType
 from nexustrader.core.entity import RateLimit
 from nexustrader.strategy import Strategy
-from zmq.asyncio import Socket
+
+if TYPE_CHECKING:
+    from zmq.asyncio import Socket
 
 @dataclass
 class BasicConfig:
@@ -21,6 +23,12 @@ class PublicConnectorConfig:
 class PrivateConnectorConfig:
     account_type: AccountType
     rate_limit: RateLimit | None = None
+    max_inflight_orders: int = 5  # order submits executed concurrently by the EMS
+    ws_order_entry: bool = False  # create/cancel orders over WS, REST is used while it is disconnected
+    http_pool_size: int = 10  # pooled REST connections per host
+    http_keepalive_timeout: float = 60  # seconds an idle pooled connection is kept open
+    http_warmup_interval: float | None = 30  # seconds between warm-up requests keeping the pool open, None disables it
+    http_transport: HttpTransportType = HttpTransportType.AIOHTTP  # REST backend: aiohttp, aiosonic or the nautilus Rust client
     
 @dataclass
 class ZeroMQSignalConfig:
@@ -39,8 +47,28 @@ class ZeroMQSignalConfig:
         >>> socket.setsockopt(zmq.SUBSCRIBE, b"")
         >>> config = ZeroMQSignalConfig(socket=socket)
     """
-    socket: Socket
+    socket: "Socket"
     
+@dataclass
+class RecorderConfig:
+    """Market Data Recorder Configuration Class.
+
+    Records the market data published by the public connectors to Parquet files
+    partitioned as `<directory>/<data type>/exchange=<exchange>/symbol=<symbol>/date=<YYYY-MM-DD>/`.
+
+    Attributes:
+        directory (`str`): Root directory of the recorded files
+        data_types (`List[DataType]`): Recorded data, `BOOKL2` is not supported
+        flush_interval (`float`): Seconds between two writes of the buffered data
+        max_batch_size (`int`): Buffered items of one data type that trigger a write
+    """
+    directory: str = "data/market"
+    data_types: List[DataType] = field(
+        default_factory=lambda: [DataType.BOOKL1, DataType.TRADE, DataType.KLINE]
+    )
+    flush_interval: float = 60
+    max_batch_size: int = 100_000
+
 @dataclass
 class MockConnectorConfig:
     initial_balance: Dict[str, float | int]
@@ -51,6 +79,7 @@ class MockConnectorConfig:
     overwrite_position: bool = False
     update_interval: int = 60
     leverage: float = 1.0
+    maker_fee_rate: float | None = None
     
     def __post_init__(self):
         if not self.account_type.is_mock:
@@ -65,10 +94,16 @@ class Config:
     public_conn_config: Dict[ExchangeType, List[PublicConnectorConfig]]
     private_conn_config: Dict[ExchangeType, List[PrivateConnectorConfig | MockConnectorConfig]] = field(default_factory=dict)
     zero_mq_signal_config: ZeroMQSignalConfig | None = None
+    recorder_config: RecorderConfig | None = None
     db_path: str = ".keys/cache.db"
     storage_backend: StorageBackend = StorageBackend.SQLITE
     cache_sync_interval: int = 60
     cache_expired_time: int = 3600
+    market_cache_dir: str | None = ".keys/markets"  # market snapshots for fast restarts, None always loads from the exchange
+    market_cache_ttl: int = 86400  # seconds a market snapshot can be started from
+    journal_dir: str | None = ".keys/journal"  # order journal replayed after a crash, None disables it
+    journal_fsync: JournalFsync = JournalFsync.INTERVAL
+    journal_fsync_interval: float = 1.0
     is_mock: bool = False
     
     def __post_init__(self):
@@ -92,6 +92,8 @@ class SubmitType(Enum):
     TAKE_PROFIT = 7
     ADP_MAKER = 8
     CANCEL_ADP_MAKER = 9
+    BATCH_CREATE = 10
+    CANCEL_ALL = 11
 
 
 class EventType(Enum):
@@ -286,3 +288,15 @@ class DataType(Enum):
 class StorageBackend(Enum):
     REDIS = "redis"
     SQLITE = "sqlite"
+
+
+class JournalFsync(Enum):
+    ALWAYS = "always"  # fsync after every record
+    INTERVAL = "interval"  # fsync in the background every `journal_fsync_interval` seconds
+    NEVER = "never"  # leave it to the OS, survives a process crash but not a power loss
+
+
+class HttpTransportType(Enum):
+    AIOHTTP = "aiohttp"
+    AIOSONIC = "aiosonic"
+    NAUTILUS = "nautilus"
@@ -1,12 +1,14 @@
 import msgspec
+import heapq
 import asyncio
 import aiosqlite
 import sqlite3
 import re
 from decimal import Decimal
-from typing import Dict, Set, Type, List, Optional
-from collections import defaultdict
-from returns.maybe import maybe
+from typing import Dict, Set, Type, List, Optional, Tuple
+from collections import defaultdict, OrderedDict
+from dataclasses import dataclass, field, fields
+from returns.maybe import Maybe, maybe
 from pathlib import Path
 
 from nexustrader.schema import (
@@ -21,12 +23,70 @@ from nexustrader.schema import (
     AccountBalance,
     Balance,
 )
-from nexustrader.constants import STATUS_TRANSITIONS, AccountType, KlineInterval
+from nexustrader.constants import (
+    STATUS_TRANSITIONS,
+    AccountType,
+    KlineInterval,
+    OrderStatus,
+)
 from nexustrader.core.entity import TaskManager, RedisClient
 from nexustrader.core.log import SpdLog
 from nexustrader.core.registry import OrderRegistry
+from nexustrader.core.journal import (
+    OrderJournal,
+    OrderEvent,
+    AlgoOrderEvent,
+    PositionEvent,
+)
 from nexustrader.core.nautilius_core import LiveClock, MessageBus
-from nexustrader.constants import StorageBackend
+from nexustrader.constants import StorageBackend, JournalFsync
+
+
+CLOSED_STATUSES = frozenset(
+    (OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.EXPIRED)
+)
+
+
+@dataclass
+class DirtyEntities:
+    """Keys of the in-memory entities changed since they were last persisted"""
+
+    orders: Set[str] = field(default_factory=set)  # uuid
+    algo_orders: Set[str] = field(default_factory=set)  # uuid
+    positions: Set[str] = field(default_factory=set)  # symbol, deleted once closed
+    balances: Set[Tuple[AccountType, str]] = field(default_factory=set)  # (account_type, asset)
+    open_orders: Set[ExchangeType] = field(default_factory=set)  # exchange
+    symbol_orders: Set[str] = field(default_factory=set)  # symbol
+
+    def merge(self, other: "DirtyEntities"):
+        for f in fields(self):
+            getattr(self, f.name).update(getattr(other, f.name))
+
+
+class LRUCache:
+    """Least recently used mapping holding at most `maxsize` items"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key):
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class AsyncCache:
@@ -41,6 +101,10 @@ class AsyncCache:
         db_path: str = ".keys/cache.db",
         sync_interval: int = 60,  # seconds
         expired_time: int = 3600,  # seconds
+        db_cache_size: int = 4096,  # orders read back from the storage kept in memory
+        journal_dir: str | None = None,  # None disables the order journal
+        journal_fsync: JournalFsync = JournalFsync.INTERVAL,
+        journal_fsync_interval: float = 1.0,  # seconds
     ):
         parent_dir = Path(db_path).parent
         if not parent_dir.exists():
@@ -70,9 +134,25 @@ class AsyncCache:
             set
         )  # symbol -> set(uuid)
         self._mem_positions: Dict[str, Position] = {}  # symbol -> Position
+        # orders read back from the storage, kept apart from the live orders so
+        # they are neither expired nor written back
+        self._db_orders = LRUCache(db_cache_size)  # uuid -> Order | AlgoOrder
         self._mem_account_balance: Dict[AccountType, AccountBalance] = defaultdict(
             AccountBalance
         )
+        self._order_waiters: Dict[
+            str, List[Tuple[Set[OrderStatus], asyncio.Future]]
+        ] = defaultdict(list)  # uuid -> [(statuses, future)]
+
+        # (timestamp, uuid) min-heaps, so the expiry only visits expired orders.
+        # An entry is checked against the order in memory when it is popped.
+        self._order_expiry: List[Tuple[int, str]] = []
+        self._algo_order_expiry: List[Tuple[int, str]] = []
+        self._cleanup_batch = 1000  # expired entries removed before yielding to the loop
+
+        # only the changed entities are written by the periodic sync
+        self._dirty = DirtyEntities()
+        self._positions_reconciled = False
 
         # set params
         self._sync_interval = sync_interval  # sync interval
@@ -84,15 +164,25 @@ class AsyncCache:
         self._trade_cache: Dict[str, Trade] = {}
 
         self._msgbus = msgbus
-        self._msgbus.subscribe(topic="kline", handler=self._update_kline_cache)
-        self._msgbus.subscribe(topic="bookl1", handler=self._update_bookl1_cache)
-        self._msgbus.subscribe(topic="trade", handler=self._update_trade_cache)
+        # market data is published on per-symbol topics, e.g. `bookl1.BTCUSDT-PERP.BINANCE`
+        self._msgbus.subscribe(topic="kline.*", handler=self._update_kline_cache)
+        self._msgbus.subscribe(topic="bookl1.*", handler=self._update_bookl1_cache)
+        self._msgbus.subscribe(topic="trade.*", handler=self._update_trade_cache)
 
         self._storage_initialized = False
         self._registry = registry
         
         self._table_prefix = self.safe_table_name(f"{self.strategy_id}_{self.user_id}")
 
+        # order and position events are journaled as they happen and replayed on
+        # start, so a crash between two syncs does not lose them
+        self._journal: OrderJournal | None = None
+        if journal_dir:
+            self._journal = OrderJournal(journal_dir, self._table_prefix, journal_fsync)
+        self._journal_fsync = journal_fsync
+        self._journal_fsync_interval = journal_fsync_interval
+        self._journal_open = False
+
     ################# # base functions ####################
     
     @staticmethod
@@ -113,6 +203,7 @@ class AsyncCache:
         if self._storage_backend == StorageBackend.REDIS:
             self._r_async = RedisClient.get_async_client()
             self._r = RedisClient.get_client()
+            await self._migrate_redis_keys()
         elif self._storage_backend == StorageBackend.SQLITE:
             db_path = Path(self._db_path)
             db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -121,6 +212,33 @@ class AsyncCache:
             await self._init_sqlite_tables()
         self._storage_initialized = True
 
+    async def _migrate_redis_keys(self):
+        """
+        Move the positions and balances stored one key each
+        (`...:symbol_positions:<symbol>`, `...:asset_balance:<asset>`) into the
+        per exchange / account type hashes. SCAN walks the keyspace in steps,
+        so other clients of the Redis are not blocked.
+        """
+        prefix = f"strategy:{self.strategy_id}:user_id:{self.user_id}:"
+        for pattern in ("exchange:*:symbol_positions:*", "account_type:*:asset_balance:*"):
+            keys = [
+                key async for key in self._r_async.scan_iter(match=f"{prefix}{pattern}", count=1000)
+            ]
+            if not keys:
+                continue
+            values = await self._r_async.mget(keys)
+            pipe = self._r_async.pipeline(transaction=True)
+            for key, value in zip(keys, values):
+                # <exchange|account_type>:<value>:<symbol_positions|asset_balance>:<field>
+                scope, scope_value, name, field = key.decode()[len(prefix):].split(":", 3)
+                if value:
+                    table = "positions" if name == "symbol_positions" else "balances"
+                    hash_key = f"{prefix}{scope}:{scope_value}:{table}"
+                    pipe.hsetnx(hash_key, field, value)
+                pipe.delete(key)
+            await pipe.execute()
+            self._log.info(f"migrated {len(keys)} redis keys of `{pattern}` into hashes")
+
     async def _init_sqlite_tables(self):
         """Initialize the SQLite tables"""
 
@@ -189,235 +307,363 @@ class AsyncCache:
     async def start(self):
         """Start the cache"""
         await self._init_storage()
+        if self._journal:
+            self._replay_journal()
+            self._journal.open()
+            self._journal_open = True
+            if self._journal_fsync == JournalFsync.INTERVAL:
+                self._task_manager.create_task(self._periodic_journal_fsync())
         self._task_manager.create_task(self._periodic_sync())
 
     async def _periodic_sync(self):
         """Periodically sync the cache"""
         while True:
-            if self._storage_backend == StorageBackend.REDIS:
-                await self._sync_to_redis()
-            elif self._storage_backend == StorageBackend.SQLITE:
-                await self._sync_to_sqlite()
-            self._cleanup_expired_data()
+            await self._sync_to_storage()
+            while self._cleanup_expired_data(limit=self._cleanup_batch):
+                await asyncio.sleep(0)
             await asyncio.sleep(self._sync_interval)
 
-    async def _sync_to_redis(self):
-        """Sync the cache to Redis"""
-        self._log.debug("syncing to redis")
-        for uuid, order in self._mem_orders.copy().items():
-            orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:orders"
-            await self._r_async.hset(orders_key, uuid, self._encode(order))
+    async def _sync_to_storage(self):
+        # the records of the sealed segment are covered by this sync, the ones
+        # appended while it runs go to the new segment
+        sealed = self._journal.rotate() if self._journal_open else None
+        if sealed is not None:
+            await asyncio.to_thread(self._journal.seal)
+        if self._storage_backend == StorageBackend.REDIS:
+            await self._sync_to_redis()
+        elif self._storage_backend == StorageBackend.SQLITE:
+            await self._sync_to_sqlite()
+        if sealed is not None:
+            self._journal.discard(sealed)
 
-        for uuid, algo_order in self._mem_algo_orders.copy().items():
-            algo_orders_key = (
-                f"strategy:{self.strategy_id}:user_id:{self.user_id}:algo_orders"
-            )
-            await self._r_async.hset(algo_orders_key, uuid, self._encode(algo_order))
+    async def _periodic_journal_fsync(self):
+        while True:
+            await asyncio.sleep(self._journal_fsync_interval)
+            await asyncio.to_thread(self._journal.flush)
+
+    def _replay_journal(self):
+        """Apply the events journaled after the last sync before a crash"""
+        count = 0
+        for event in self._journal.replay():
+            if isinstance(event, OrderEvent):
+                if event.initialized:
+                    self._order_initialized(event.order)
+                else:
+                    self._order_status_update(event.order)
+            elif isinstance(event, AlgoOrderEvent):
+                self._order_status_update(event.order)
+            elif isinstance(event, PositionEvent):
+                self._apply_position(event.position)
+            count += 1
+
+        # link the open orders again, so their updates from the exchange are matched
+        for order in self._mem_orders.values():
+            if order.id and not order.is_closed:
+                self._registry.register_order(order)
+        if count:
+            self._log.info(f"replayed {count} events from the order journal")
+
+    def _take_dirty(self) -> DirtyEntities:
+        dirty, self._dirty = self._dirty, DirtyEntities()
+        # algo orders are updated in place while running, so they are always written
+        dirty.algo_orders.update(
+            uuid
+            for uuid, algo_order in self._mem_algo_orders.items()
+            if not algo_order.is_closed
+        )
+        return dirty
 
-        for exchange, open_order_uuids in self._mem_open_orders.copy().items():
-            open_orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange.value}:open_orders"
+    async def _sync_to_redis(self):
+        """Write the changed entities to Redis in one pipeline"""
+        dirty = self._take_dirty()
+        self._log.debug("syncing to redis")
+        prefix = f"strategy:{self.strategy_id}:user_id:{self.user_id}"
+        pipe = self._r_async.pipeline(transaction=False)
 
-            await self._r_async.delete(open_orders_key)
+        orders = {
+            uuid: self._encode(order)
+            for uuid in dirty.orders
+            if (order := self._mem_orders.get(uuid))
+        }
+        if orders:
+            pipe.hset(f"{prefix}:orders", mapping=orders)
 
-            if open_order_uuids:
-                await self._r_async.sadd(open_orders_key, *open_order_uuids)
+        algo_orders = {
+            uuid: self._encode(algo_order)
+            for uuid in dirty.algo_orders
+            if (algo_order := self._mem_algo_orders.get(uuid))
+        }
+        if algo_orders:
+            pipe.hset(f"{prefix}:algo_orders", mapping=algo_orders)
+
+        for exchange in dirty.open_orders:
+            open_orders_key = f"{prefix}:exchange:{exchange.value}:open_orders"
+            pipe.delete(open_orders_key)
+            if open_order_uuids := self._mem_open_orders.get(exchange):
+                pipe.sadd(open_orders_key, *open_order_uuids)
+
+        for symbol in dirty.symbol_orders:
+            exchange = InstrumentId.from_str(symbol).exchange.value
+            for name, mem_orders in (
+                ("symbol_orders", self._mem_symbol_orders),
+                ("symbol_open_orders", self._mem_symbol_open_orders),
+            ):
+                key = f"{prefix}:exchange:{exchange}:{name}:{symbol}"
+                pipe.delete(key)
+                if uuids := mem_orders.get(symbol):
+                    pipe.sadd(key, *uuids)
+
+        for symbol in dirty.positions:
+            key = self._positions_redis_key(InstrumentId.from_str(symbol).exchange)
+            if position := self._mem_positions.get(symbol):
+                pipe.hset(key, symbol, self._encode(position))
+            else:
+                pipe.hdel(key, symbol)
 
-        for symbol, uuids in self._mem_symbol_orders.copy().items():
-            instrument_id = InstrumentId.from_str(symbol)
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{symbol}"
-            await self._r_async.delete(key)
-            if uuids:
-                await self._r_async.sadd(key, *uuids)
+        for account_type, asset in dirty.balances:
+            if balance := self._mem_account_balance[account_type].balances.get(asset):
+                pipe.hset(self._balances_redis_key(account_type), asset, self._encode(balance))
 
-        for symbol, uuids in self._mem_symbol_open_orders.copy().items():
-            instrument_id = InstrumentId.from_str(symbol)
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_open_orders:{symbol}"
-            await self._r_async.delete(key)
-            if uuids:
-                await self._r_async.sadd(key, *uuids)
-
-        # Add position sync
-        for symbol, position in self._mem_positions.copy().items():
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{position.exchange.value}:symbol_positions:{symbol}"
-            await self._r_async.set(key, self._encode(position))
-            
-        # Add balance sync
-        for account_type, balance in self._mem_account_balance.copy().items():
-            for asset, amount in balance.balances.items():
-                key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:account_type:{account_type.value}:asset_balance:{asset}"
-                await self._r_async.set(key, self._encode(amount))
+        try:
+            await pipe.execute()
+        except Exception:
+            self._dirty.merge(dirty)
+            raise
 
     async def _sync_to_sqlite(self):
-        """Sync the cache to SQLite"""
-        async with self._db_async.cursor() as cursor:
-            await self._sync_orders(cursor)
-            await self._sync_algo_orders(cursor)
-            await self._sync_positions(cursor)
-            await self._sync_open_orders(cursor)
-            await self._sync_balances(cursor)
-            await self._db_async.commit()
-    
+        """Write the changed entities to SQLite in one transaction"""
+        dirty = self._take_dirty()
+        try:
+            async with self._db_async.cursor() as cursor:
+                await self._sync_orders(cursor, dirty.orders)
+                await self._sync_algo_orders(cursor, dirty.algo_orders)
+                await self._sync_positions(cursor, dirty.positions)
+                await self._sync_open_orders(cursor, dirty.open_orders)
+                await self._sync_balances(cursor, dirty.balances)
+                await self._db_async.commit()
+        except Exception:
+            await self._db_async.rollback()
+            self._dirty.merge(dirty)
+            raise
+
     async def sync_orders(self):
+        uuids, self._dirty.orders = self._dirty.orders, set()
         async with self._db_async.cursor() as cursor:
-            await self._sync_orders(cursor)
+            await self._sync_orders(cursor, uuids)
             await self._db_async.commit()
-    
+
     async def sync_algo_orders(self):
+        uuids, self._dirty.algo_orders = self._dirty.algo_orders, set()
         async with self._db_async.cursor() as cursor:
-            await self._sync_algo_orders(cursor)
+            await self._sync_algo_orders(cursor, uuids)
             await self._db_async.commit()
 
     async def sync_positions(self):
+        symbols, self._dirty.positions = self._dirty.positions, set()
         async with self._db_async.cursor() as cursor:
-            await self._sync_positions(cursor)
+            await self._sync_positions(cursor, symbols)
             await self._db_async.commit()
-            
+
     async def sync_open_orders(self):
+        exchanges, self._dirty.open_orders = self._dirty.open_orders, set()
         async with self._db_async.cursor() as cursor:
-            await self._sync_open_orders(cursor)
+            await self._sync_open_orders(cursor, exchanges)
             await self._db_async.commit()
-            
+
     async def sync_balances(self):
+        balances, self._dirty.balances = self._dirty.balances, set()
         async with self._db_async.cursor() as cursor:
-            await self._sync_balances(cursor)
+            await self._sync_balances(cursor, balances)
             await self._db_async.commit()
-            
-    async def _sync_orders(self, cursor: aiosqlite.Cursor):
-        """Sync orders to SQLite"""
-        for uuid, order in self._mem_orders.copy().items():
-            await cursor.execute(
+
+    async def _sync_orders(self, cursor: aiosqlite.Cursor, uuids: Set[str]):
+        """Sync the changed orders to SQLite"""
+        rows = [
+            (
+                order.timestamp,
+                uuid,
+                order.symbol,
+                order.side.value,
+                order.type.value,
+                str(order.amount),  # sqlite does not support decimal
+                order.price,
+                order.status.value,
+                self._encode(order),
+            )
+            for uuid in uuids
+            if (order := self._mem_orders.get(uuid))
+        ]
+        if rows:
+            await cursor.executemany(
                 f"INSERT OR REPLACE INTO {self._table_prefix}_orders "
                 "(timestamp, uuid, symbol, side, type, amount, price, status, data) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    order.timestamp,
-                    uuid,
-                    order.symbol,
-                    order.side.value,
-                    order.type.value,
-                    str(order.amount),  # sqlite does not support decimal
-                    order.price,
-                    order.status.value,
-                    self._encode(order),
-                ),
+                rows,
             )
 
-    async def _sync_algo_orders(self, cursor: aiosqlite.Cursor):
-        """Sync algorithmic orders to SQLite"""
-        for uuid, algo_order in self._mem_algo_orders.copy().items():
-            await cursor.execute(
+    async def _sync_algo_orders(self, cursor: aiosqlite.Cursor, uuids: Set[str]):
+        """Sync the changed algorithmic orders to SQLite"""
+        rows = [
+            (
+                algo_order.timestamp,
+                uuid,
+                algo_order.symbol,
+                self._encode(algo_order),
+            )
+            for uuid in uuids
+            if (algo_order := self._mem_algo_orders.get(uuid))
+        ]
+        if rows:
+            await cursor.executemany(
                 f"INSERT OR REPLACE INTO {self._table_prefix}_algo_orders "
                 "(timestamp, uuid, symbol, data) VALUES (?, ?, ?, ?)",
-                (
-                    algo_order.timestamp,
-                    uuid,
-                    algo_order.symbol,
-                    self._encode(algo_order),
-                ),
+                rows,
             )
 
-    async def _sync_positions(self, cursor: aiosqlite.Cursor):
-        """Sync positions to SQLite
-        
-        1. Delete positions that no longer exist in memory
-        2. Insert or update current positions
+    async def _sync_positions(self, cursor: aiosqlite.Cursor, symbols: Set[str]):
+        """Sync the changed positions to SQLite
+
+        1. Delete the positions that were closed
+        2. Insert or update the others
         """
-        # First get all positions from database
-        await cursor.execute(f"SELECT symbol FROM {self._table_prefix}_positions")
-        db_positions = {row[0] for row in await cursor.fetchall()}
-        
-        # Delete positions that are in DB but not in memory
-        positions_to_delete = db_positions - set(self.get_all_positions().keys())
+        if not self._positions_reconciled:
+            # the positions left in the database by a previous run are checked once
+            await cursor.execute(f"SELECT symbol FROM {self._table_prefix}_positions")
+            symbols = symbols | {row[0] for row in await cursor.fetchall()}
+            self._positions_reconciled = True
+
+        positions_to_delete = []
+        rows = []
+        for symbol in symbols:
+            position = self._mem_positions.get(symbol)
+            if position is None or not position.is_opened:
+                positions_to_delete.append((symbol,))
+            else:
+                rows.append(
+                    (
+                        symbol,
+                        position.exchange.value,
+                        position.side.value if position.side else "FLAT",
+                        str(position.amount),
+                        self._encode(position),
+                    )
+                )
+
         if positions_to_delete:
             await cursor.executemany(
                 f"DELETE FROM {self._table_prefix}_positions WHERE symbol = ?",
-                [(symbol,) for symbol in positions_to_delete]
+                positions_to_delete,
             )
             self._log.debug(f"Deleted {len(positions_to_delete)} stale positions from database")
-
-        # Insert or update current positions
-        for symbol, position in self._mem_positions.copy().items():
-            await cursor.execute(
+        if rows:
+            await cursor.executemany(
                 f"INSERT OR REPLACE INTO {self._table_prefix}_positions "
                 "(symbol, exchange, side, amount, data) VALUES (?, ?, ?, ?, ?)",
-                (
-                    symbol,
-                    position.exchange.value,
-                    position.side.value if position.side else "FLAT",
-                    str(position.amount),
-                    self._encode(position),
-                ),
+                rows,
             )
 
-    async def _sync_open_orders(self, cursor: aiosqlite.Cursor):
-        """Sync open orders to SQLite"""
-        await cursor.execute(f"DELETE FROM {self._table_prefix}_open_orders")
-        
-        for exchange, uuids in self._mem_open_orders.copy().items():
-            for uuid in uuids:
-                order = self._mem_orders.get(uuid)
-                if order:
-                    await cursor.execute(
-                        f"INSERT INTO {self._table_prefix}_open_orders "
-                        "(uuid, exchange, symbol) VALUES (?, ?, ?)",
-                        (uuid, exchange.value, order.symbol),
-                    )
-
-    async def _sync_balances(self, cursor):
-        """Sync account balances to SQLite"""
-        for account_type, balance in self._mem_account_balance.copy().items():
-            for asset, amount in balance.balances.items():
-                await cursor.execute(
-                    f"INSERT OR REPLACE INTO {self._table_prefix}_balances "
-                    "(asset, account_type, free, locked) VALUES (?, ?, ?, ?)",
-                    (
-                        asset,
-                        account_type.value,
-                        str(amount.free),
-                        str(amount.locked),
-                    ),
+    async def _sync_open_orders(self, cursor: aiosqlite.Cursor, exchanges: Set[ExchangeType]):
+        """Sync the open orders of the changed exchanges to SQLite"""
+        for exchange in exchanges:
+            await cursor.execute(
+                f"DELETE FROM {self._table_prefix}_open_orders WHERE exchange = ?",
+                (exchange.value,),
+            )
+            rows = [
+                (uuid, exchange.value, order.symbol)
+                for uuid in self._mem_open_orders.get(exchange, ())
+                if (order := self._mem_orders.get(uuid))
+            ]
+            if rows:
+                await cursor.executemany(
+                    f"INSERT INTO {self._table_prefix}_open_orders "
+                    "(uuid, exchange, symbol) VALUES (?, ?, ?)",
+                    rows,
                 )
 
-    def _cleanup_expired_data(self):
-        """Cleanup expired data"""
-        current_time = self._clock.timestamp_ms()
-        expire_before = current_time - self._expired_time * 1000
-
-        expired_orders = []
-        for uuid, order in self._mem_orders.copy().items():
-            if order.timestamp < expire_before:
-                expired_orders.append(uuid)
+    async def _sync_balances(
+        self, cursor: aiosqlite.Cursor, balances: Set[Tuple[AccountType, str]]
+    ):
+        """Sync the changed account balances to SQLite"""
+        rows = [
+            (
+                asset,
+                account_type.value,
+                str(balance.free),
+                str(balance.locked),
+            )
+            for account_type, asset in balances
+            if (balance := self._mem_account_balance[account_type].balances.get(asset))
+        ]
+        if rows:
+            await cursor.executemany(
+                f"INSERT OR REPLACE INTO {self._table_prefix}_balances "
+                "(asset, account_type, free, locked) VALUES (?, ?, ?, ?)",
+                rows,
+            )
 
-                if not order.is_closed:
-                    self._log.warn(f"order {uuid} is not closed, but expired")
+    def _index_expiry(self, heap: List[Tuple[int, str]], order: Order | AlgoOrder):
+        # an order without timestamp is kept for `expired_time` from now
+        heapq.heappush(heap, (order.timestamp or self._clock.timestamp_ms(), order.uuid))
 
-                self._registry.remove_order(order)
+    def _cleanup_expired_data(self, limit: int | None = None) -> bool:
+        """
+        Remove the orders older than `expired_time` from memory.
 
-        for uuid in expired_orders:
+        At most `limit` heap entries are handled per call, returns True if
+        expired entries are left for the next call.
+        """
+        expire_before = self._clock.timestamp_ms() - self._expired_time * 1000
+        count = 0
+
+        heap = self._order_expiry
+        while heap and heap[0][0] < expire_before:
+            if limit is not None and count >= limit:
+                return True
+            count += 1
+            _, uuid = heapq.heappop(heap)
+            if (order := self._mem_orders.get(uuid)) is None:
+                continue
+            if order.timestamp and order.timestamp >= expire_before:
+                # updated since it was indexed
+                heapq.heappush(heap, (order.timestamp, uuid))
+                continue
+
+            if not order.is_closed:
+                self._log.warn(f"order {uuid} is not closed, but expired")
+            self._registry.remove_order(order)
             del self._mem_orders[uuid]
             self._mem_closed_orders.pop(uuid, None)
             self._log.debug(f"removing order {uuid} from memory")
-            for symbol, order_set in self._mem_symbol_orders.copy().items():
-                self._log.debug(f"removing order {uuid} from symbol {symbol}")
+            if order_set := self._mem_symbol_orders.get(order.symbol):
                 order_set.discard(uuid)
-
-        expired_algo_orders = [
-            uuid
-            for uuid, algo_order in self._mem_algo_orders.copy().items()
-            if algo_order.timestamp < expire_before
-        ]
-        for uuid in expired_algo_orders:
+                self._dirty.symbol_orders.add(order.symbol)
+
+        heap = self._algo_order_expiry
+        while heap and heap[0][0] < expire_before:
+            if limit is not None and count >= limit:
+                return True
+            count += 1
+            _, uuid = heapq.heappop(heap)
+            if (algo_order := self._mem_algo_orders.get(uuid)) is None:
+                continue
+            if algo_order.timestamp >= expire_before:
+                heapq.heappush(heap, (algo_order.timestamp, uuid))
+                continue
             del self._mem_algo_orders[uuid]
             self._log.debug(f"removing algo order {uuid} from memory")
+        return False
 
     async def close(self):
         """关闭缓存"""
         if self._storage_initialized:
+            await self._sync_to_storage()
+            if self._journal_open:
+                self._journal_open = False
+                await asyncio.to_thread(self._journal.close)
             if self._storage_backend == StorageBackend.REDIS:
-                await self._sync_to_redis()
                 await self._r_async.aclose()
             elif self._storage_backend == StorageBackend.SQLITE:
-                await self._sync_to_sqlite()
                 await self._db_async.close()
                 self._db.close()
 
@@ -481,9 +727,21 @@ class AsyncCache:
             self._mem_positions.pop(position.symbol, None)
         else:
             self._mem_positions[position.symbol] = position
+        self._dirty.positions.add(position.symbol)
+        if self._journal_open:
+            self._journal.append(PositionEvent(position))
 
     def _apply_balance(self, account_type: AccountType, balances: List[Balance]):
         self._mem_account_balance[account_type]._apply(balances)
+        self._dirty.balances.update((account_type, balance.asset) for balance in balances)
+
+    def _update_free(self, account_type: AccountType, asset: str, amount: Decimal):
+        self._mem_account_balance[account_type]._update_free(asset, amount)
+        self._dirty.balances.add((account_type, asset))
+
+    def _update_locked(self, account_type: AccountType, asset: str, amount: Decimal):
+        self._mem_account_balance[account_type]._update_locked(asset, amount)
+        self._dirty.balances.add((account_type, asset))
 
     def get_balance(self, account_type: AccountType) -> AccountBalance:
         return self._mem_account_balance[account_type]
@@ -502,73 +760,193 @@ class AsyncCache:
         return positions
 
     def _order_initialized(self, order: Order | AlgoOrder):
+        self._db_orders.pop(order.uuid)
         if isinstance(order, AlgoOrder):
+            if order.uuid not in self._mem_algo_orders:
+                self._index_expiry(self._algo_order_expiry, order)
             self._mem_algo_orders[order.uuid] = order
+            self._dirty.algo_orders.add(order.uuid)
+            if self._journal_open:
+                self._journal.append(AlgoOrderEvent(order))
         else:
             if not self._check_status_transition(order):
                 return
+            if self._journal_open:
+                self._journal.append(OrderEvent(True, order))
+            if order.uuid not in self._mem_orders:
+                self._index_expiry(self._order_expiry, order)
             self._mem_orders[order.uuid] = order
             self._mem_open_orders[order.exchange].add(order.uuid)
             self._mem_symbol_orders[order.symbol].add(order.uuid)
             self._mem_symbol_open_orders[order.symbol].add(order.uuid)
+            self._dirty.orders.add(order.uuid)
+            self._dirty.open_orders.add(order.exchange)
+            self._dirty.symbol_orders.add(order.symbol)
+            self._notify_order_waiters(order)
 
     def _order_status_update(self, order: Order | AlgoOrder):
+        self._db_orders.pop(order.uuid)
         if isinstance(order, AlgoOrder):
+            if order.uuid not in self._mem_algo_orders:
+                self._index_expiry(self._algo_order_expiry, order)
             self._mem_algo_orders[order.uuid] = order
+            self._dirty.algo_orders.add(order.uuid)
+            if self._journal_open:
+                self._journal.append(AlgoOrderEvent(order))
         else:
             if not self._check_status_transition(order):
                 return
+            if self._journal_open:
+                self._journal.append(OrderEvent(False, order))
+            if order.uuid not in self._mem_orders:
+                self._index_expiry(self._order_expiry, order)
             self._mem_orders[order.uuid] = order
+            self._dirty.orders.add(order.uuid)
             if order.is_closed:
                 self._mem_open_orders[order.exchange].discard(order.uuid)
                 self._mem_symbol_open_orders[order.symbol].discard(order.uuid)
-                
+                self._dirty.open_orders.add(order.exchange)
+                self._dirty.symbol_orders.add(order.symbol)
+            self._notify_order_waiters(order)
+
+    def _notify_order_waiters(self, order: Order):
+        if not (waiters := self._order_waiters.get(order.uuid)):
+            return
+        pending = []
+        for statuses, future in waiters:
+            if future.done():
+                continue
+            if order.status in statuses:
+                future.set_result(order)
+            else:
+                pending.append((statuses, future))
+        if pending:
+            self._order_waiters[order.uuid] = pending
+        else:
+            del self._order_waiters[order.uuid]
+
+    async def _wait(self, future: asyncio.Future, timeout: float | None):
+        # `asyncio.wait_for`, the backtest engine times out on its simulated clock
+        return await asyncio.wait_for(future, timeout)
+
+    async def wait_for(
+        self,
+        uuid: str,
+        statuses: Set[OrderStatus] | None = None,
+        timeout: float | None = None,
+    ) -> Optional[Order]:
+        """
+        Wait until the order `uuid` reaches one of `statuses` (closed by default).
+
+        Resolved by `_order_initialized` / `_order_status_update`, so the caller
+        wakes up on the status update itself instead of polling the cache.
+        Returns the order, or None if `timeout` (seconds) expires first.
+        """
+        if statuses is None:
+            statuses = CLOSED_STATUSES
+        order = self._mem_orders.get(uuid)
+        if order is not None and order.status in statuses:
+            return order
+
+        future = asyncio.get_running_loop().create_future()
+        self._order_waiters[uuid].append((statuses, future))
+        try:
+            return await self._wait(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if not future.done():
+                future.cancel()
+            if waiters := self._order_waiters.get(uuid):
+                waiters[:] = [w for w in waiters if w[1] is not future]
+                if not waiters:
+                    del self._order_waiters[uuid]
+
+
+    # The sync readers below block the event loop on a miss, the `*_async`
+    # variants read through `aiosqlite` (its own thread) or `redis.asyncio`.
+
+    def _positions_redis_key(self, exchange_id: ExchangeType) -> str:
+        return f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange_id.value}:positions"
+
+    def _balances_redis_key(self, account_type: AccountType) -> str:
+        return f"strategy:{self.strategy_id}:user_id:{self.user_id}:account_type:{account_type.value}:balances"
 
     def _get_all_positions_from_redis(self, exchange_id: ExchangeType) -> Dict[str, Position]:
+        raw_positions = self._r.hgetall(self._positions_redis_key(exchange_id))
+        return {
+            symbol.decode(): self._decode(raw_position, Position)
+            for symbol, raw_position in raw_positions.items()
+        }
+
+    async def _get_all_positions_from_redis_async(self, exchange_id: ExchangeType) -> Dict[str, Position]:
+        raw_positions = await self._r_async.hgetall(self._positions_redis_key(exchange_id))
+        return {
+            symbol.decode(): self._decode(raw_position, Position)
+            for symbol, raw_position in raw_positions.items()
+        }
+
+    def _positions_from_rows(self, rows) -> Dict[str, Position]:
         positions = {}
-        pattern = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange_id.value}:symbol_positions:*"
-        keys = self._r.keys(pattern)
-        for key in keys:
-            if raw_position := self._r.get(key):
-                position = self._decode(raw_position, Position)
+        for row in rows:
+            position = self._decode(row[1], Position)
+            if position.side:
                 positions[position.symbol] = position
         return positions
-    
+
     def _get_all_positions_from_sqlite(self, exchange_id: ExchangeType) -> Dict[str, Position]:
-        positions = {}
         cursor = self._db.cursor()
         cursor.execute(f"SELECT symbol, data FROM {self._table_prefix}_positions WHERE exchange = ?", (exchange_id.value,))
-        for row in cursor.fetchall():
-            position = self._decode(row[1], Position)
-            if position.side:
-                positions[position.symbol] = position
-        return positions
-    
+        return self._positions_from_rows(cursor.fetchall())
+
+    async def _get_all_positions_from_sqlite_async(self, exchange_id: ExchangeType) -> Dict[str, Position]:
+        async with self._db_async.execute(
+            f"SELECT symbol, data FROM {self._table_prefix}_positions WHERE exchange = ?",
+            (exchange_id.value,),
+        ) as cursor:
+            return self._positions_from_rows(await cursor.fetchall())
+
+    @staticmethod
+    def _balances_from_rows(rows) -> List[Balance]:
+        return [
+            Balance(asset=row[0], free=Decimal(row[1]), locked=Decimal(row[2]))
+            for row in rows
+        ]
+
     def _get_balance_from_sqlite(self, account_type: AccountType) -> List[Balance]:
-        balances = []
         cursor = self._db.cursor()
         cursor.execute(f"SELECT asset, free, locked FROM {self._table_prefix}_balances WHERE account_type = ?", (account_type.value,))
-        for row in cursor.fetchall():
-            balances.append(Balance(asset=row[0], free=Decimal(row[1]), locked=Decimal(row[2])))
-        return balances
-    
+        return self._balances_from_rows(cursor.fetchall())
+
+    async def _get_balance_from_sqlite_async(self, account_type: AccountType) -> List[Balance]:
+        async with self._db_async.execute(
+            f"SELECT asset, free, locked FROM {self._table_prefix}_balances WHERE account_type = ?",
+            (account_type.value,),
+        ) as cursor:
+            return self._balances_from_rows(await cursor.fetchall())
+
     def _get_balance_from_redis(self, account_type: AccountType) -> List[Balance]:
-        balances = []
-        pattern = f"strategy:{self.strategy_id}:user_id:{self.user_id}:account_type:{account_type.value}:asset_balance:*"
-        keys = self._r.keys(pattern)
-        for key in keys:
-            if raw_balance := self._r.get(key):
-                balance: Balance = self._decode(raw_balance, Balance)
-                balances.append(balance)
-        return balances
-    
+        raw_balances = self._r.hgetall(self._balances_redis_key(account_type))
+        return [self._decode(raw_balance, Balance) for raw_balance in raw_balances.values()]
+
+    async def _get_balance_from_redis_async(self, account_type: AccountType) -> List[Balance]:
+        raw_balances = await self._r_async.hgetall(self._balances_redis_key(account_type))
+        return [self._decode(raw_balance, Balance) for raw_balance in raw_balances.values()]
+
     #NOTE: this function is not for user to call, it is for internal use
     def _get_all_balances_from_db(self, account_type: AccountType) -> List[Balance]:
         if self._storage_backend == StorageBackend.REDIS:
             return self._get_balance_from_redis(account_type)
         elif self._storage_backend == StorageBackend.SQLITE:
             return self._get_balance_from_sqlite(account_type)
-    
+
+    #NOTE: this function is not for user to call, it is for internal use
+    async def _get_all_balances_from_db_async(self, account_type: AccountType) -> List[Balance]:
+        if self._storage_backend == StorageBackend.REDIS:
+            return await self._get_balance_from_redis_async(account_type)
+        elif self._storage_backend == StorageBackend.SQLITE:
+            return await self._get_balance_from_sqlite_async(account_type)
+
     #NOTE: this function is not for user to call, it is for internal use
     def _get_all_positions_from_db(self, exchange_id: ExchangeType) -> Dict[str, Position]:
         if self._storage_backend == StorageBackend.REDIS:
@@ -576,60 +954,71 @@ class AsyncCache:
         elif self._storage_backend == StorageBackend.SQLITE:
             return self._get_all_positions_from_sqlite(exchange_id)
 
+    #NOTE: this function is not for user to call, it is for internal use
+    async def _get_all_positions_from_db_async(self, exchange_id: ExchangeType) -> Dict[str, Position]:
+        if self._storage_backend == StorageBackend.REDIS:
+            return await self._get_all_positions_from_redis_async(exchange_id)
+        elif self._storage_backend == StorageBackend.SQLITE:
+            return await self._get_all_positions_from_sqlite_async(exchange_id)
+
+    def _get_order_from_mem(self, uuid: str) -> Optional[Order | AlgoOrder]:
+        mem_dict = self._mem_algo_orders if uuid.startswith("ALGO-") else self._mem_orders
+        if order := mem_dict.get(uuid):
+            return order
+        return self._db_orders.get(uuid)
+
+    def _load_db_order(self, uuid: str, raw_order: bytes) -> Order | AlgoOrder:
+        obj_type = AlgoOrder if uuid.startswith("ALGO-") else Order
+        order = self._decode(raw_order, obj_type)
+        self._db_orders.put(uuid, order)
+        return order
+
+    def _order_redis_key(self, uuid: str) -> str:
+        table = "algo_orders" if uuid.startswith("ALGO-") else "orders"
+        return f"strategy:{self.strategy_id}:user_id:{self.user_id}:{table}"
+
+    def _order_sqlite_query(self, uuid: str) -> str:
+        table = "algo_orders" if uuid.startswith("ALGO-") else "orders"
+        return f"SELECT data FROM {self._table_prefix}_{table} WHERE uuid = ?"
+
     def _get_order_from_redis(self, uuid: str) -> Optional[Order | AlgoOrder]:
         # find in memory first
-        if uuid.startswith("ALGO-"):
-            if order := self._mem_algo_orders.get(uuid):
-                return order
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:algo_orders"
-            obj_type = AlgoOrder
-            mem_dict = self._mem_algo_orders
-        else:
-            if order := self._mem_orders.get(uuid):
-                return order
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:orders"
-            obj_type = Order
-            mem_dict = self._mem_orders
-
-        if raw_order := self._r.hget(key, uuid):
-            order = self._decode(raw_order, obj_type)
-            mem_dict[uuid] = order
+        if order := self._get_order_from_mem(uuid):
             return order
+        if raw_order := self._r.hget(self._order_redis_key(uuid), uuid):
+            return self._load_db_order(uuid, raw_order)
+        return None
+
+    async def _get_order_from_redis_async(self, uuid: str) -> Optional[Order | AlgoOrder]:
+        if order := self._get_order_from_mem(uuid):
+            return order
+        if raw_order := await self._r_async.hget(self._order_redis_key(uuid), uuid):
+            return self._load_db_order(uuid, raw_order)
         return None
 
     def _get_order_from_sqlite(self, uuid: str) -> Optional[Order | AlgoOrder]:
+        if order := self._get_order_from_mem(uuid):
+            return order
         try:
-            # determine the table and object type to query
-            if uuid.startswith("ALGO-"):
-                table = f"{self._table_prefix}_algo_orders"
-                obj_type = AlgoOrder
-                mem_dict = self._mem_algo_orders
-            else:
-                table = f"{self._table_prefix}_orders"
-                obj_type = Order
-                mem_dict = self._mem_orders
-
-            # find in memory
-            if order := mem_dict.get(uuid):
-                return order
-
-            # query SQLite
             cursor = self._db.cursor()
-            cursor.execute(
-                f"""
-                SELECT data FROM {table}
-                WHERE uuid = ?
-                """,
-                (uuid,),
-            )
-
+            cursor.execute(self._order_sqlite_query(uuid), (uuid,))
             if row := cursor.fetchone():
-                order = self._decode(row[0], obj_type)
-                mem_dict[uuid] = order  # Cache in memory
-                return order
-
+                return self._load_db_order(uuid, row[0])
+            return None
+        except sqlite3.Error as e:
+            self._log.error(f"Error getting order from SQLite: {e}")
             return None
 
+    async def _get_order_from_sqlite_async(self, uuid: str) -> Optional[Order | AlgoOrder]:
+        if order := self._get_order_from_mem(uuid):
+            return order
+        try:
+            async with self._db_async.execute(
+                self._order_sqlite_query(uuid), (uuid,)
+            ) as cursor:
+                if row := await cursor.fetchone():
+                    return self._load_db_order(uuid, row[0])
+            return None
         except sqlite3.Error as e:
             self._log.error(f"Error getting order from SQLite: {e}")
             return None
@@ -641,9 +1030,24 @@ class AsyncCache:
         elif self._storage_backend == StorageBackend.SQLITE:
             return self._get_order_from_sqlite(uuid)
 
+    async def get_order_async(self, uuid: str) -> Maybe[Order | AlgoOrder]:
+        """Same as `get_order`, but an order not in memory is read without blocking the event loop"""
+        if self._storage_backend == StorageBackend.REDIS:
+            order = await self._get_order_from_redis_async(uuid)
+        elif self._storage_backend == StorageBackend.SQLITE:
+            order = await self._get_order_from_sqlite_async(uuid)
+        return Maybe.from_optional(order)
+
+    def _symbol_orders_redis_key(self, instrument_id: InstrumentId) -> str:
+        return f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{instrument_id.symbol}"
+
     def _get_symbol_orders_from_redis(self, instrument_id: InstrumentId) -> Set[str]:
-        key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{instrument_id.symbol}"
-        if redis_orders := self._r.smembers(key):
+        if redis_orders := self._r.smembers(self._symbol_orders_redis_key(instrument_id)):
+            return {uuid.decode() for uuid in redis_orders}
+        return set()
+
+    async def _get_symbol_orders_from_redis_async(self, instrument_id: InstrumentId) -> Set[str]:
+        if redis_orders := await self._r_async.smembers(self._symbol_orders_redis_key(instrument_id)):
             return {uuid.decode() for uuid in redis_orders}
         return set()
 
@@ -657,6 +1061,13 @@ class AsyncCache:
         )
         return {row[0] for row in cursor.fetchall()}
 
+    async def _get_symbol_orders_from_sqlite_async(self, instrument_id: InstrumentId) -> Set[str]:
+        async with self._db_async.execute(
+            f"SELECT uuid FROM {self._table_prefix}_orders WHERE symbol = ?",
+            (instrument_id.symbol,),
+        ) as cursor:
+            return {row[0] for row in await cursor.fetchall()}
+
     def get_symbol_orders(self, symbol: str, in_mem: bool = True) -> Set[str]:
         """Get all orders for a symbol from memory and Redis"""
         memory_orders = self._mem_symbol_orders.get(symbol, set())
@@ -669,6 +1080,18 @@ class AsyncCache:
             return memory_orders.union(orders)
         return memory_orders
 
+    async def get_symbol_orders_async(self, symbol: str, in_mem: bool = True) -> Set[str]:
+        """Same as `get_symbol_orders`, but the storage is read without blocking the event loop"""
+        memory_orders = self._mem_symbol_orders.get(symbol, set())
+        if not in_mem:
+            instrument_id = InstrumentId.from_str(symbol)
+            if self._storage_backend == StorageBackend.REDIS:
+                orders = await self._get_symbol_orders_from_redis_async(instrument_id)
+            elif self._storage_backend == StorageBackend.SQLITE:
+                orders = await self._get_symbol_orders_from_sqlite_async(instrument_id)
+            return memory_orders.union(orders)
+        return memory_orders
+
     def get_open_orders(
         self, symbol: str | None = None, exchange: ExchangeType | None = None
     ) -> Set[str]:
@@ -2,10 +2,9 @@ import signal
 import asyncio
 import socket
 from typing import Callable
-from typing import Dict, List
+from typing import Any, Dict, List, TYPE_CHECKING
 import warnings
 
-import redis
 import time
 
 from dataclasses import dataclass
@@ -14,6 +13,10 @@ from nexustrader.core.log import SpdLog
 from nexustrader.core.nautilius_core import LiveClock
 from nexustrader.schema import Kline, BookL1, Trade
 
+if TYPE_CHECKING:
+    import redis
+    import redis.asyncio
+
 
 @dataclass
 class RateLimit:
@@ -37,6 +40,10 @@ class TaskManager:
         if enable_signal_handlers:
             self._setup_signal_handlers()    
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
     def _setup_signal_handlers(self):
         try:
             for sig in (signal.SIGINT, signal.SIGTERM):
@@ -104,6 +111,35 @@ class TaskManager:
         finally:
             self._tasks.clear()
 
+class DataConflator:
+    """
+    Latest-value delivery for market data streams.
+
+    `push` only stores the newest message per symbol and schedules a single
+    flush on the event loop, so a handler slower than the inter-arrival time
+    receives the latest value of every key once it is free instead of
+    working through a growing backlog.
+    """
+
+    def __init__(self, handler: Callable[[Any], None], loop: asyncio.AbstractEventLoop):
+        self._handler = handler
+        self._loop = loop
+        self._latest: Dict[str, Any] = {}
+        self._scheduled = False
+
+    def push(self, msg: Any) -> None:
+        self._latest[msg.symbol] = msg
+        if not self._scheduled:
+            self._scheduled = True
+            self._loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._scheduled = False
+        latest, self._latest = self._latest, {}
+        for msg in latest.values():
+            self._handler(msg)
+
+
 class RedisClient:
     _params = None
 
@@ -122,12 +158,18 @@ class RedisClient:
             cls._params = get_redis_config(in_docker)
         return cls._params
 
+    # redis is only imported by the processes that use it
+
     @classmethod
-    def get_client(cls) -> redis.Redis:
+    def get_client(cls) -> "redis.Redis":
+        import redis
+
         return redis.Redis(**cls._get_params())
 
     @classmethod
-    def get_async_client(cls) -> redis.asyncio.Redis:
+    def get_async_client(cls) -> "redis.asyncio.Redis":
+        import redis.asyncio
+
         return redis.asyncio.Redis(**cls._get_params())
 
 
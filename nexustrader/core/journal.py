@@ -0,0 +1,173 @@
+import os
+import mmap
+import zlib
+import struct
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+
+import msgspec
+
+from nexustrader.constants import JournalFsync
+from nexustrader.core.log import SpdLog
+from nexustrader.schema import Order, AlgoOrder, Position
+
+
+class OrderEvent(msgspec.Struct, tag="order", array_like=True):
+    initialized: bool  # `_order_initialized` or `_order_status_update`
+    order: Order
+
+
+class AlgoOrderEvent(msgspec.Struct, tag="algo_order", array_like=True):
+    order: AlgoOrder
+
+
+class PositionEvent(msgspec.Struct, tag="position", array_like=True):
+    position: Position
+
+
+JournalEvent = Union[OrderEvent, AlgoOrderEvent, PositionEvent]
+
+
+class OrderJournal:
+    """
+    Append-only journal of the order and position events of the cache.
+
+    Every record is framed as `length | crc32 | msgpack payload` and appended to
+    the active segment `<name>.<seq>.journal`. `rotate` seals the active segment
+    before the cache syncs to the storage and `seal` fsyncs and closes it off the
+    event loop, once the sync has committed the sealed segments are removed with
+    `discard`. Segments left over by a crash are read
+    back with `replay`, a torn record at the tail of a segment ends the segment.
+    """
+
+    _HEADER = struct.Struct("<II")
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        fsync: JournalFsync = JournalFsync.INTERVAL,
+    ):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._name = name
+        self._fsync = fsync
+        self._log = SpdLog.get_logger(
+            name=type(self).__name__, level="DEBUG", flush=True
+        )
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(JournalEvent)
+
+        segments = self._segments()
+        self._seq = segments[-1][0] + 1 if segments else 0
+        self._fd: int | None = None
+        self._sealed_fds: List[int] = []  # rotated out, not yet closed by `seal`
+        self._unsynced = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._fd is not None
+
+    def _segment_path(self, seq: int) -> Path:
+        return self._dir / f"{self._name}.{seq:08d}.journal"
+
+    def _segments(self) -> List[Tuple[int, Path]]:
+        segments = []
+        for path in self._dir.glob(f"{self._name}.*.journal"):
+            seq = path.name[len(self._name) + 1 : -len(".journal")]
+            if seq.isdigit():
+                segments.append((int(seq), path))
+        return sorted(segments)
+
+    def open(self):
+        self._fd = os.open(
+            self._segment_path(self._seq), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+
+    def append(self, event: JournalEvent):
+        payload = self._encoder.encode(event)
+        os.write(self._fd, self._HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        if self._fsync == JournalFsync.ALWAYS:
+            os.fsync(self._fd)
+        else:
+            self._unsynced = True
+
+    def flush(self):
+        """fsync the records appended since the last flush, safe to run in a thread"""
+        if not self._unsynced or (fd := self._fd) is None:
+            return
+        self._unsynced = False
+        try:
+            os.fsync(fd)
+        except OSError:
+            # the segment was sealed meanwhile, `rotate` synced it
+            pass
+
+    def rotate(self) -> int:
+        """Seal the active segment and start a new one, returns the sealed seq.
+
+        The sealed segment is fsynced and closed by `seal`.
+        """
+        sealed = self._seq
+        if self._fd is not None:
+            self._sealed_fds.append(self._fd)
+            self._fd = None
+        self._seq += 1
+        self.open()
+        return sealed
+
+    def seal(self):
+        """fsync and close the segments sealed by `rotate`, safe to run in a thread"""
+        while self._sealed_fds:
+            self._sync_close(self._sealed_fds.pop(0))
+
+    def discard(self, upto: int):
+        """Remove the sealed segments up to `upto`, their records are in the storage"""
+        for seq, path in self._segments():
+            if seq <= upto and seq != self._seq:
+                path.unlink(missing_ok=True)
+
+    def replay(self) -> Iterator[JournalEvent]:
+        """Yield the records of every segment in the order they were written"""
+        for seq, path in self._segments():
+            if seq == self._seq and self.is_open:
+                break
+            yield from self._read_segment(path)
+
+    def _read_segment(self, path: Path) -> Iterator[JournalEvent]:
+        size = path.stat().st_size
+        if not size:
+            return
+        header_size = self._HEADER.size
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset = 0
+            while offset < size:
+                start = offset + header_size
+                if start > size:
+                    self._log.warn(f"torn record at {path.name}:{offset}, dropped")
+                    return
+                length, crc = self._HEADER.unpack_from(mm, offset)
+                end = start + length
+                payload = mm[start:end]
+                if end > size or zlib.crc32(payload) != crc:
+                    self._log.warn(f"torn record at {path.name}:{offset}, dropped")
+                    return
+                yield self._decoder.decode(payload)
+                offset = end
+
+    def _sync_close(self, fd: int):
+        if self._fsync != JournalFsync.NEVER:
+            os.fsync(fd)
+        os.close(fd)
+
+    def close(self):
+        """Close the active and sealed segments, the active one is removed if
+        nothing was written to it. Blocks on fsync, run it in a thread."""
+        self.seal()
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        self._sync_close(fd)
+        path = self._segment_path(self._seq)
+        if path.exists() and not path.stat().st_size:
+            path.unlink()
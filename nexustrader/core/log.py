@@ -25,6 +25,8 @@ class SpdLog:
     error_logger = None
     sinks = None
     production_mode = False
+    sink_level = None  # lowest level written by the production sinks
+    LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
     @classmethod
     def setup_error_handling(cls):
@@ -93,6 +95,24 @@ class SpdLog:
             cls.loggers[name] = logger_instance
         return cls.loggers[name]
 
+    @classmethod
+    def is_enabled(
+        cls,
+        logger_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    ) -> bool:
+        """
+        Whether a `level` message of a logger created with `logger_level` is written by any sink.
+
+        :param logger_level: Level the logger was created with
+        :param level: Level of the message
+        :return: True if the message is written
+        """
+        threshold = cls.LEVELS.index(logger_level)
+        if cls.production_mode and cls.sink_level:
+            threshold = max(threshold, cls.LEVELS.index(cls.sink_level))
+        return cls.LEVELS.index(level) >= threshold
+
     @classmethod
     def parse_level(
         cls, level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -155,6 +175,7 @@ class SpdLog:
 
             stdout_sink = spd.stdout_color_sink_mt()
             stdout_sink.set_level(cls.parse_level(std_level))
+            cls.sink_level = min(level, std_level, key=cls.LEVELS.index)
 
             cls.sinks = [
                 daily_sink,
@@ -1,11 +1,13 @@
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import TestClock # noqa
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.core.uuid import UUID4
 
 from nautilus_trader.core.nautilus_pyo3 import HttpClient # noqa
 from nautilus_trader.core.nautilus_pyo3 import HttpMethod # noqa
 from nautilus_trader.core.nautilus_pyo3 import HttpResponse # noqa
+from nautilus_trader.core.nautilus_pyo3 import HttpTimeoutError # noqa
 
 from nautilus_trader.core.nautilus_pyo3 import WebSocketClient # noqa
 from nautilus_trader.core.nautilus_pyo3 import WebSocketClientError # noqa
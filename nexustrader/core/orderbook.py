@@ -0,0 +1,165 @@
+from bisect import bisect_left
+from typing import Iterable, List, Sequence, Tuple
+
+from nexustrader.constants import ExchangeType
+from nexustrader.schema import BookL1, BookL2
+
+
+class OrderBookSide:
+    """
+    One side of a price level book backed by two parallel sorted arrays.
+
+    Levels are kept sorted so that the best price sits at the end of the
+    arrays: bids are stored by ascending price, asks by descending price
+    (as negated keys). Most updates happen close to the touch, so the
+    memmove done by ``list.insert``/``del`` only shifts a handful of levels,
+    and ``best``/``top`` never need to sort.
+    """
+
+    __slots__ = ("_is_bid", "_keys", "_prices", "_sizes")
+
+    def __init__(self, is_bid: bool):
+        self._is_bid = is_bid
+        self._keys: List[float] = []
+        self._prices: List[float] = []
+        self._sizes: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, price: float) -> float:
+        return price if self._is_bid else -price
+
+    def update(self, price: float, size: float) -> None:
+        """Set the size at ``price``, a size of 0 removes the level"""
+        key = self._key(price)
+        keys = self._keys
+        idx = bisect_left(keys, key)
+        exists = idx < len(keys) and keys[idx] == key
+
+        if size == 0:
+            if exists:
+                del keys[idx]
+                del self._prices[idx]
+                del self._sizes[idx]
+        elif exists:
+            self._sizes[idx] = size
+        else:
+            keys.insert(idx, key)
+            self._prices.insert(idx, price)
+            self._sizes.insert(idx, size)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._prices.clear()
+        self._sizes.clear()
+
+    def truncate(self, depth: int) -> None:
+        """Drop every level worse than the best ``depth`` levels"""
+        excess = len(self._keys) - depth
+        if excess > 0:
+            del self._keys[:excess]
+            del self._prices[:excess]
+            del self._sizes[:excess]
+
+    def best(self) -> Tuple[float, float] | None:
+        if not self._keys:
+            return None
+        return self._prices[-1], self._sizes[-1]
+
+    def top(self, n: int) -> List[Tuple[float, float]]:
+        """Best ``n`` levels ordered from the touch outwards"""
+        start = max(len(self._keys) - n, 0)
+        return list(
+            zip(reversed(self._prices[start:]), reversed(self._sizes[start:]))
+        )
+
+    def size_at(self, price: float) -> float:
+        key = self._key(price)
+        idx = bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            return self._sizes[idx]
+        return 0.0
+
+
+class OrderBook:
+    """
+    Incrementally maintained L2 order book shared by all exchange connectors.
+
+    Connectors feed exchange snapshots/deltas as ``(price, size)`` pairs and
+    read the book back as ``BookL1`` or a top-N ``BookL2``.
+    """
+
+    def __init__(self, exchange: ExchangeType, symbol: str, max_depth: int | None = None):
+        self.exchange = exchange
+        self.symbol = symbol
+        self.max_depth = max_depth
+        self.bids = OrderBookSide(is_bid=True)
+        self.asks = OrderBookSide(is_bid=False)
+        self.update_id: int = 0
+        self.timestamp: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.bids and not self.asks
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Sequence[float | str]],
+        asks: Iterable[Sequence[float | str]],
+        timestamp: int,
+        update_id: int = 0,
+    ) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.apply_delta(bids, asks, timestamp, update_id)
+
+    def apply_delta(
+        self,
+        bids: Iterable[Sequence[float | str]],
+        asks: Iterable[Sequence[float | str]],
+        timestamp: int,
+        update_id: int = 0,
+    ) -> None:
+        # levels may carry extra fields (e.g. OKX order count), only price/size are used
+        bids_update = self.bids.update
+        for level in bids:
+            bids_update(float(level[0]), float(level[1]))
+        asks_update = self.asks.update
+        for level in asks:
+            asks_update(float(level[0]), float(level[1]))
+
+        if self.max_depth:
+            self.bids.truncate(self.max_depth)
+            self.asks.truncate(self.max_depth)
+
+        self.timestamp = timestamp
+        self.update_id = update_id
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.update_id = 0
+        self.timestamp = 0
+
+    def to_bookl1(self) -> BookL1:
+        bid, bid_size = self.bids.best() or (0, 0)
+        ask, ask_size = self.asks.best() or (0, 0)
+        return BookL1(
+            exchange=self.exchange,
+            symbol=self.symbol,
+            bid=bid,
+            ask=ask,
+            bid_size=bid_size,
+            ask_size=ask_size,
+            timestamp=self.timestamp,
+        )
+
+    def to_bookl2(self, depth: int) -> BookL2:
+        return BookL2(
+            exchange=self.exchange,
+            symbol=self.symbol,
+            bids=self.bids.top(depth),
+            asks=self.asks.top(depth),
+            timestamp=self.timestamp,
+        )
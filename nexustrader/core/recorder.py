@@ -0,0 +1,223 @@
+import asyncio
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, Type
+
+import msgspec
+import numpy as np
+
+from nexustrader.constants import DataType
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import MessageBus
+from nexustrader.schema import BookL1, Trade, Kline, MarkPrice, FundingRate, IndexPrice
+
+
+RECORDED_TYPES: Dict[DataType, Type[msgspec.Struct]] = {
+    DataType.BOOKL1: BookL1,
+    DataType.TRADE: Trade,
+    DataType.KLINE: Kline,
+    DataType.MARK_PRICE: MarkPrice,
+    DataType.FUNDING_RATE: FundingRate,
+    DataType.INDEX_PRICE: IndexPrice,
+}
+
+
+def _select_records(
+    directory: str,
+    data_type: DataType,
+    symbols: List[str],
+    start: int | None = None,
+    end: int | None = None,
+    interval: str | None = None,
+) -> Tuple[str, list] | None:
+    """The DuckDB query and its parameters selecting the recorded rows, `None` if nothing was recorded"""
+    path = Path(directory) / data_type.value
+    if not symbols or not any(path.glob("**/*.parquet")):
+        return None
+
+    fields = [field.name for field in msgspec.structs.fields(RECORDED_TYPES[data_type])]
+    conditions = [f"symbol IN ({', '.join('?' for _ in symbols)})"]
+    params: list = list(symbols)
+    if start is not None:
+        conditions.append("timestamp >= ?")
+        params.append(start)
+    if end is not None:
+        conditions.append("timestamp <= ?")
+        params.append(end)
+    if interval is not None:
+        conditions.append("interval = ?")
+        params.append(interval)
+
+    query = f"""
+        SELECT {', '.join(fields)}
+        FROM read_parquet('{path}/**/*.parquet', hive_partitioning = true)
+        WHERE {' AND '.join(conditions)}
+        ORDER BY timestamp
+    """
+    return query, params
+
+
+def read_records(
+    directory: str,
+    data_type: DataType,
+    symbols: List[str],
+    start: int | None = None,
+    end: int | None = None,
+    interval: str | None = None,
+    batch_size: int = 10_000,
+) -> Iterator[msgspec.Struct]:
+    """
+    Yield the records of `symbols` written by `MarketDataRecorder`, ordered by timestamp.
+
+    Args:
+        start: First timestamp in ms, inclusive
+        end: Last timestamp in ms, inclusive
+        interval: Only the klines of this interval, e.g. `KlineInterval.MINUTE_1.value`
+        batch_size: Rows fetched from DuckDB at once, the data is streamed
+    """
+    import duckdb
+
+    select = _select_records(directory, data_type, symbols, start, end, interval)
+    if select is None:
+        return
+
+    struct_type = RECORDED_TYPES[data_type]
+    fields = [field.name for field in msgspec.structs.fields(struct_type)]
+    conn = duckdb.connect()
+    try:
+        cursor = conn.execute(*select)
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield msgspec.convert(dict(zip(fields, row)), struct_type)
+    finally:
+        conn.close()
+
+
+def _to_column(values: list) -> np.ndarray:
+    column = np.array(values)
+    if column.dtype == object:  # optional numbers, None is stored as NaN
+        column = column.astype(float)
+    elif column.dtype.kind == "U":
+        column = column.astype(object)
+    return column
+
+
+class MarketDataRecorder:
+    """
+    Record the market data published on the message bus to Parquet files.
+
+    The handlers only append to a buffer on the event loop. Every
+    `flush_interval` seconds, or once a buffer holds `max_batch_size` items,
+    the buffer is handed to a writer thread which writes it with DuckDB as
+    ZSTD compressed Parquet, partitioned as
+    `<directory>/<data type>/exchange=<exchange>/symbol=<symbol>/date=<YYYY-MM-DD>/`.
+
+    The files can be read back with
+    `duckdb.read_parquet("<directory>/bookl1/**/*.parquet", hive_partitioning=True)`.
+    """
+
+    def __init__(
+        self,
+        msgbus: MessageBus,
+        task_manager: TaskManager,
+        directory: str,
+        data_types: List[DataType],
+        flush_interval: float = 60,
+        max_batch_size: int = 100_000,
+    ):
+        for data_type in data_types:
+            if data_type not in RECORDED_TYPES:
+                raise ValueError(f"Recording `{data_type.value}` is not supported")
+
+        self._log = SpdLog.get_logger(
+            name=type(self).__name__, level="DEBUG", flush=True
+        )
+        self._task_manager = task_manager
+        self._directory = Path(directory)
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+
+        self._buffers: Dict[DataType, list] = {data_type: [] for data_type in data_types}
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="MarketDataRecorder", daemon=True
+        )
+
+        for data_type in data_types:
+            msgbus.subscribe(topic=f"{data_type.value}.*", handler=self._handler(data_type))
+
+    def _handler(self, data_type: DataType):
+        buffers = self._buffers
+
+        def handler(data: msgspec.Struct):
+            buffer = buffers[data_type]
+            buffer.append(data)
+            if len(buffer) >= self._max_batch_size:
+                self._flush(data_type)
+
+        return handler
+
+    def _flush(self, data_type: DataType):
+        if self._buffers[data_type]:
+            self._queue.put((data_type, self._buffers[data_type]))
+            self._buffers[data_type] = []
+
+    def flush(self):
+        for data_type in self._buffers:
+            self._flush(data_type)
+
+    async def _periodic_flush(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            self.flush()
+
+    def start(self):
+        self._writer.start()
+        self._task_manager.create_task(self._periodic_flush())
+
+    async def stop(self):
+        """Write the buffered data and wait for the writer thread"""
+        self.flush()
+        self._queue.put(None)
+        if self._writer.is_alive():
+            await asyncio.to_thread(self._writer.join)
+
+    def _write_loop(self):
+        import duckdb
+
+        conn = duckdb.connect()
+        while (item := self._queue.get()) is not None:
+            data_type, batch = item
+            try:
+                self._write_batch(conn, data_type, batch)
+            except Exception as e:
+                self._log.error(f"Error writing {len(batch)} `{data_type.value}` records: {e}")
+        conn.close()
+
+    def _write_batch(self, conn, data_type: DataType, batch: list):
+        rows = msgspec.to_builtins(batch)
+        fields = msgspec.structs.fields(RECORDED_TYPES[data_type])
+        columns = {
+            field.name: _to_column([row[field.name] for row in rows]) for field in fields
+        }
+        path = self._directory / data_type.value
+        path.mkdir(parents=True, exist_ok=True)
+
+        conn.register("batch", columns)
+        try:
+            conn.execute(
+                f"""
+                COPY (SELECT *, CAST(epoch_ms(timestamp) AS DATE) AS date FROM batch)
+                TO '{path}' (
+                    FORMAT PARQUET,
+                    COMPRESSION ZSTD,
+                    PARTITION_BY (exchange, symbol, date),
+                    OVERWRITE_OR_IGNORE,
+                    FILENAME_PATTERN 'part_{{uuid}}'
+                )
+                """
+            )
+        finally:
+            conn.unregister("batch")
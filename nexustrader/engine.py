@@ -1,6 +1,6 @@
 import asyncio
 import platform
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 from collections import defaultdict
 from nexustrader.constants import AccountType, ExchangeType
 from nexustrader.config import Config
@@ -15,36 +15,26 @@ from nexustrader.base import (
     ExecutionManagementSystem,
     OrderManagementSystem,
     MockLinearConnector,
+    MockInverseConnector,
+    MockSpotConnector,
 )
-from nexustrader.exchange.bybit import (
-    BybitExchangeManager,
-    BybitPrivateConnector,
-    BybitPublicConnector,
-    BybitAccountType,
-    BybitExecutionManagementSystem,
-    BybitOrderManagementSystem,
-)
-from nexustrader.exchange.binance import (
-    BinanceExchangeManager,
-    BinanceAccountType,
-    BinancePublicConnector,
-    BinancePrivateConnector,
-    BinanceExecutionManagementSystem,
-    BinanceOrderManagementSystem,
-)
-from nexustrader.exchange.okx import (
-    OkxExchangeManager,
-    OkxAccountType,
-    OkxPublicConnector,
-    OkxPrivateConnector,
-    OkxExecutionManagementSystem,
-    OkxOrderManagementSystem,
-)
+# the exchange packages load their connectors on first attribute access, so
+# only the venues in the config are imported
+from nexustrader.exchange import bybit, binance, okx
+from nexustrader.exchange.bybit import BybitAccountType
+from nexustrader.exchange.binance import BinanceAccountType
+from nexustrader.exchange.okx import OkxAccountType
 from nexustrader.core.entity import TaskManager, ZeroMQSignalRecv
+from nexustrader.core.recorder import MarketDataRecorder
 from nexustrader.core.nautilius_core import MessageBus, TraderId, LiveClock
 from nexustrader.schema import InstrumentId
 from nexustrader.constants import DataType
 
+if TYPE_CHECKING:
+    from nexustrader.exchange.bybit import BybitExchangeManager
+    from nexustrader.exchange.binance import BinanceExchangeManager
+    from nexustrader.exchange.okx import OkxExchangeManager
+
 class Engine:
     @staticmethod
     def set_loop_policy():
@@ -64,14 +54,16 @@ class Engine:
         self._exchanges: Dict[ExchangeType, ExchangeManager] = {}
         self._public_connectors: Dict[AccountType, PublicConnector] = {}
         self._private_connectors: Dict[AccountType, PrivateConnector] = {}
+        self._max_inflight_orders: Dict[AccountType, int] = {}
 
         trader_id = f"{self._config.strategy_id}-{self._config.user_id}"
 
         self._custom_signal_recv = None
+        self._recorder: MarketDataRecorder | None = None
 
         self._msgbus = MessageBus(
             trader_id=TraderId(trader_id),
-            clock=LiveClock(),
+            clock=self._create_clock(),
         )
         
         self._registry = OrderRegistry()
@@ -86,6 +78,9 @@ class Engine:
             db_path=config.db_path,
             sync_interval=config.cache_sync_interval,
             expired_time=config.cache_expired_time,
+            journal_dir=config.journal_dir,
+            journal_fsync=config.journal_fsync,
+            journal_fsync_interval=config.journal_fsync_interval,
         )
 
 
@@ -103,6 +98,9 @@ class Engine:
             public_connectors=self._public_connectors,
         )
 
+    def _create_clock(self) -> LiveClock:
+        return LiveClock()
+
     def _public_connector_check(self):
         okx_public_conn_count = 0
 
@@ -173,7 +171,7 @@ class Engine:
                 if exchange_id == ExchangeType.BYBIT:
                     exchange: BybitExchangeManager = self._exchanges[exchange_id]
                     account_type: BybitAccountType = config.account_type
-                    public_connector = BybitPublicConnector(
+                    public_connector = bybit.BybitPublicConnector(
                         account_type=account_type,
                         exchange=exchange,
                         msgbus=self._msgbus,
@@ -185,7 +183,7 @@ class Engine:
                 elif exchange_id == ExchangeType.BINANCE:
                     exchange: BinanceExchangeManager = self._exchanges[exchange_id]
                     account_type: BinanceAccountType = config.account_type
-                    public_connector = BinancePublicConnector(
+                    public_connector = binance.BinancePublicConnector(
                         account_type=account_type,
                         exchange=exchange,
                         msgbus=self._msgbus,
@@ -198,7 +196,7 @@ class Engine:
                 elif exchange_id == ExchangeType.OKX:
                     exchange: OkxExchangeManager = self._exchanges[exchange_id]
                     account_type: OkxAccountType = config.account_type
-                    public_connector = OkxPublicConnector(
+                    public_connector = okx.OkxPublicConnector(
                         account_type=account_type,
                         exchange=exchange,
                         msgbus=self._msgbus,
@@ -223,30 +221,30 @@ class Engine:
                     
                     account_type = mock_conn_config.account_type
                     
-                    if mock_conn_config.account_type.is_linear_mock:
-                        private_connector = MockLinearConnector(
-                            initial_balance=mock_conn_config.initial_balance,
-                            account_type=account_type,
-                            exchange=self._exchanges[exchange_id],
-                            msgbus=self._msgbus,
-                            cache=self._cache,
-                            task_manager=self._task_manager,
-                            overwrite_balance=mock_conn_config.overwrite_balance,
-                            overwrite_position=mock_conn_config.overwrite_position,
-                            fee_rate=mock_conn_config.fee_rate,
-                            quote_currency=mock_conn_config.quote_currency,
-                            update_interval=mock_conn_config.update_interval,
-                            leverage=mock_conn_config.leverage,
-                        )
-                        self._private_connectors[account_type] = private_connector
-                    elif mock_conn_config.account_type.is_inverse_mock:
-                        #NOTE: currently not supported
-                        pass
-                    elif mock_conn_config.account_type.is_spot_mock:
-                        #NOTE: currently not supported
-                        pass
+                    if account_type.is_linear_mock:
+                        connector_cls = MockLinearConnector
+                    elif account_type.is_inverse_mock:
+                        connector_cls = MockInverseConnector
+                    elif account_type.is_spot_mock:
+                        connector_cls = MockSpotConnector
                     else:
                         raise EngineBuildError(f"Unsupported account type: {account_type} for mock connector.")
+
+                    self._private_connectors[account_type] = connector_cls(
+                        initial_balance=mock_conn_config.initial_balance,
+                        account_type=account_type,
+                        exchange=self._exchanges[exchange_id],
+                        msgbus=self._msgbus,
+                        cache=self._cache,
+                        task_manager=self._task_manager,
+                        overwrite_balance=mock_conn_config.overwrite_balance,
+                        overwrite_position=mock_conn_config.overwrite_position,
+                        fee_rate=mock_conn_config.fee_rate,
+                        quote_currency=mock_conn_config.quote_currency,
+                        update_interval=mock_conn_config.update_interval,
+                        leverage=mock_conn_config.leverage,
+                        maker_fee_rate=mock_conn_config.maker_fee_rate,
+                    )
             
         else:
             for (
@@ -268,15 +266,21 @@ class Engine:
                             else BybitAccountType.UNIFIED
                         )
 
-                        private_connector = BybitPrivateConnector(
+                        private_connector = bybit.BybitPrivateConnector(
                             exchange=exchange,
                             account_type=account_type,
                             cache=self._cache,
                             msgbus=self._msgbus,
                             rate_limit=config.rate_limit,
                             task_manager=self._task_manager,
+                            ws_order_entry=config.ws_order_entry,
+                            http_pool_size=config.http_pool_size,
+                            http_keepalive_timeout=config.http_keepalive_timeout,
+                            http_warmup_interval=config.http_warmup_interval,
+                            http_transport=config.http_transport,
                         )
                         self._private_connectors[account_type] = private_connector
+                        self._max_inflight_orders[account_type] = config.max_inflight_orders
 
                     case ExchangeType.OKX:
                         assert (
@@ -289,30 +293,42 @@ class Engine:
                             OkxAccountType.DEMO if exchange.is_testnet else OkxAccountType.LIVE
                         )
 
-                        private_connector = OkxPrivateConnector(
+                        private_connector = okx.OkxPrivateConnector(
                             exchange=exchange,
                             account_type=account_type,
                             cache=self._cache,
                             msgbus=self._msgbus,
                             rate_limit=config.rate_limit,
                             task_manager=self._task_manager,
+                            ws_order_entry=config.ws_order_entry,
+                            http_pool_size=config.http_pool_size,
+                            http_keepalive_timeout=config.http_keepalive_timeout,
+                            http_warmup_interval=config.http_warmup_interval,
+                            http_transport=config.http_transport,
                         )
                         self._private_connectors[account_type] = private_connector
+                        self._max_inflight_orders[account_type] = config.max_inflight_orders
 
                     case ExchangeType.BINANCE:
                         for config in private_conn_configs:
                             exchange: BinanceExchangeManager = self._exchanges[exchange_id]
                             account_type: BinanceAccountType = config.account_type
 
-                            private_connector = BinancePrivateConnector(
+                            private_connector = binance.BinancePrivateConnector(
                                 exchange=exchange,
                                 account_type=account_type,
                                 cache=self._cache,
                                 msgbus=self._msgbus,
                                 rate_limit=config.rate_limit,
                                 task_manager=self._task_manager,
+                                ws_order_entry=config.ws_order_entry,
+                                http_pool_size=config.http_pool_size,
+                                http_keepalive_timeout=config.http_keepalive_timeout,
+                                http_warmup_interval=config.http_warmup_interval,
+                                http_transport=config.http_transport,
                             )
                             self._private_connectors[account_type] = private_connector
+                            self._max_inflight_orders[account_type] = config.max_inflight_orders
 
     def _build_exchanges(self):
         for exchange_id, basic_config in self._config.basic_config.items():
@@ -323,13 +339,17 @@ class Engine:
             }
             if basic_config.passphrase:
                 config["password"] = basic_config.passphrase
+            market_cache = {
+                "market_cache_dir": self._config.market_cache_dir,
+                "market_cache_ttl": self._config.market_cache_ttl,
+            }
 
             if exchange_id == ExchangeType.BYBIT:
-                self._exchanges[exchange_id] = BybitExchangeManager(config)
+                self._exchanges[exchange_id] = bybit.BybitExchangeManager(config, **market_cache)
             elif exchange_id == ExchangeType.BINANCE:
-                self._exchanges[exchange_id] = BinanceExchangeManager(config)
+                self._exchanges[exchange_id] = binance.BinanceExchangeManager(config, **market_cache)
             elif exchange_id == ExchangeType.OKX:
-                self._exchanges[exchange_id] = OkxExchangeManager(config)
+                self._exchanges[exchange_id] = okx.OkxExchangeManager(config, **market_cache)
 
     def _build_custom_signal_recv(self):
         zmq_config = self._config.zero_mq_signal_config
@@ -343,12 +363,24 @@ class Engine:
                 zmq_config, self._strategy.on_custom_signal, self._task_manager
             )
 
+    def _build_recorder(self):
+        recorder_config = self._config.recorder_config
+        if recorder_config:
+            self._recorder = MarketDataRecorder(
+                msgbus=self._msgbus,
+                task_manager=self._task_manager,
+                directory=recorder_config.directory,
+                data_types=recorder_config.data_types,
+                flush_interval=recorder_config.flush_interval,
+                max_batch_size=recorder_config.max_batch_size,
+            )
+
     def _build_ems(self):
         for exchange_id in self._exchanges.keys():
             match exchange_id:
                 case ExchangeType.BYBIT:
                     exchange: BybitExchangeManager = self._exchanges[exchange_id]
-                    self._ems[exchange_id] = BybitExecutionManagementSystem(
+                    self._ems[exchange_id] = bybit.BybitExecutionManagementSystem(
                         market=exchange.market,
                         cache=self._cache,
                         msgbus=self._msgbus,
@@ -356,10 +388,10 @@ class Engine:
                         registry=self._registry,
                         is_mock=self._config.is_mock,
                     )
-                    self._ems[exchange_id]._build(self._private_connectors)
+                    self._ems[exchange_id]._build(self._private_connectors, self._max_inflight_orders)
                 case ExchangeType.BINANCE:
                     exchange: BinanceExchangeManager = self._exchanges[exchange_id]
-                    self._ems[exchange_id] = BinanceExecutionManagementSystem(
+                    self._ems[exchange_id] = binance.BinanceExecutionManagementSystem(
                         market=exchange.market,
                         cache=self._cache,
                         msgbus=self._msgbus,
@@ -367,10 +399,10 @@ class Engine:
                         registry=self._registry,
                         is_mock=self._config.is_mock,
                     )
-                    self._ems[exchange_id]._build(self._private_connectors)
+                    self._ems[exchange_id]._build(self._private_connectors, self._max_inflight_orders)
                 case ExchangeType.OKX:
                     exchange: OkxExchangeManager = self._exchanges[exchange_id]
-                    self._ems[exchange_id] = OkxExecutionManagementSystem(
+                    self._ems[exchange_id] = okx.OkxExecutionManagementSystem(
                         market=exchange.market,
                         cache=self._cache,
                         msgbus=self._msgbus,
@@ -378,27 +410,27 @@ class Engine:
                         registry=self._registry,
                         is_mock=self._config.is_mock,
                     )
-                    self._ems[exchange_id]._build(self._private_connectors)
+                    self._ems[exchange_id]._build(self._private_connectors, self._max_inflight_orders)
 
     def _build_oms(self):
         for exchange_id in self._exchanges.keys():
             match exchange_id:
                 case ExchangeType.BYBIT:
-                    self._oms[exchange_id] = BybitOrderManagementSystem(
+                    self._oms[exchange_id] = bybit.BybitOrderManagementSystem(
                         cache=self._cache,
                         msgbus=self._msgbus,
                         task_manager=self._task_manager,
                         registry=self._registry,
                     )
                 case ExchangeType.BINANCE:
-                    self._oms[exchange_id] = BinanceOrderManagementSystem(
+                    self._oms[exchange_id] = binance.BinanceOrderManagementSystem(
                         cache=self._cache,
                         msgbus=self._msgbus,
                         task_manager=self._task_manager,
                         registry=self._registry,
                     )
                 case ExchangeType.OKX:
-                    self._oms[exchange_id] = OkxOrderManagementSystem(
+                    self._oms[exchange_id] = okx.OkxOrderManagementSystem(
                         cache=self._cache,
                         msgbus=self._msgbus,
                         task_manager=self._task_manager,
@@ -412,6 +444,7 @@ class Engine:
         self._build_ems()
         self._build_oms()
         self._build_custom_signal_recv()
+        self._build_recorder()
         self._is_built = True
 
     def _instrument_id_to_account_type(
@@ -515,6 +548,24 @@ class Engine:
                                 f"Please add `{account_type}` public connector to the `config.public_conn_config`."
                             )
                         await connector.subscribe_bookl1(symbols)
+                case DataType.BOOKL2:
+                    for depth, symbols in sub.items():
+                        account_symbols = defaultdict(list)
+
+                        for symbol in symbols:
+                            instrument_id = InstrumentId.from_str(symbol)
+                            account_type = self._instrument_id_to_account_type(
+                                instrument_id
+                            )
+                            account_symbols[account_type].append(instrument_id.symbol)
+
+                        for account_type, symbols in account_symbols.items():
+                            connector = self._public_connectors.get(account_type, None)
+                            if connector is None:
+                                raise SubscriptionError(
+                                    f"Please add `{account_type}` public connector to the `config.public_conn_config`."
+                                )
+                            await connector.subscribe_bookl2(symbols, depth)
                 case DataType.TRADE:
                     account_symbols = defaultdict(list)
                     
@@ -569,8 +620,17 @@ class Engine:
         self._strategy._scheduler.start()
         self._scheduler_started = True
 
+    def _refresh_markets(self):
+        # markets started from a snapshot are reconciled with the exchange in the background
+        for exchange in self._exchanges.values():
+            if exchange.market_from_cache:
+                self._task_manager.create_task(exchange.refresh_markets())
+
     async def _start(self):
         await self._cache.start() #NOTE: this must be the first thing to call
+        self._refresh_markets()
+        if self._recorder:
+            self._recorder.start()
         await self._start_oms()
         await self._start_ems()
         await self._start_connectors()
@@ -590,6 +650,8 @@ class Engine:
         await asyncio.sleep(0.1) #NOTE: wait for the websocket to disconnect
 
         await self._task_manager.cancel()
+        if self._recorder:
+            await self._recorder.stop()
         await self._cache.close()
 
     def start(self):
@@ -22,3 +22,7 @@ class StrategyBuildError(NexusTraderError):
 class OrderError(NexusTraderError):
     def __init__(self, message: str):
         super().__init__(message)
+
+class WSNotConnectedError(NexusTraderError):
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -1,13 +1,26 @@
+import importlib
 from nexustrader.exchange.binance.constants import BinanceAccountType
-from nexustrader.exchange.binance.exchange import BinanceExchangeManager
-from nexustrader.exchange.binance.connector import (
-    BinancePublicConnector,
-    BinancePrivateConnector,
-)
-from nexustrader.exchange.binance.rest_api_v2 import BinanceHttpClient
-from nexustrader.exchange.binance.rest_api import BinanceApiClient
-from nexustrader.exchange.binance.ems import BinanceExecutionManagementSystem
-from nexustrader.exchange.binance.oms import BinanceOrderManagementSystem
+
+# the connectors pull in ccxt, aiohttp, picows and nautilus, they are only
+# imported when first used so loading the account types stays cheap
+_LAZY_IMPORTS = {
+    "BinanceExchangeManager": "nexustrader.exchange.binance.exchange",
+    "BinancePublicConnector": "nexustrader.exchange.binance.connector",
+    "BinancePrivateConnector": "nexustrader.exchange.binance.connector",
+    "BinanceHttpClient": "nexustrader.exchange.binance.rest_api_v2",
+    "BinanceApiClient": "nexustrader.exchange.binance.rest_api",
+    "BinanceExecutionManagementSystem": "nexustrader.exchange.binance.ems",
+    "BinanceOrderManagementSystem": "nexustrader.exchange.binance.oms",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BinanceAccountType",
@@ -1,9 +1,10 @@
 import asyncio
 import msgspec
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 from decimal import Decimal
 from nexustrader.base import PublicConnector, PrivateConnector
+from nexustrader.base.ws_client import peek_str_field
 from nexustrader.constants import (
     OrderSide,
     OrderStatus,
@@ -12,21 +13,25 @@ from nexustrader.constants import (
     TimeInForce,
     KlineInterval,
     TriggerType,
+    HttpTransportType,
 )
-from nexustrader.schema import Order, Position
+from nexustrader.schema import Order, Position, BatchOrder
 from nexustrader.schema import BookL1, Trade, Kline, MarkPrice, FundingRate, IndexPrice
 from nexustrader.exchange.binance.schema import BinanceMarket
 from nexustrader.exchange.binance.rest_api import BinanceApiClient
 from nexustrader.exchange.binance.constants import BinanceAccountType
-from nexustrader.exchange.binance.websockets import BinanceWSClient
+from nexustrader.exchange.binance.websockets import BinanceWSClient, BinanceWSApiClient
 from nexustrader.exchange.binance.exchange import BinanceExchangeManager
 from nexustrader.exchange.binance.constants import (
+    BINANCE_MAX_BATCH_ORDERS,
+    BINANCE_MAX_BATCH_CANCEL_ORDERS,
     BinanceWsEventType,
     BinanceUserDataStreamWsEventType,
     BinanceBusinessUnit,
     BinanceEnumParser,
 )
 from nexustrader.exchange.binance.schema import (
+    BinanceOrder,
     BinanceResponseKline,
     BinanceWsMessageGeneral,
     BinanceTradeData,
@@ -34,6 +39,7 @@ from nexustrader.exchange.binance.schema import (
     BinanceFuturesBookTicker,
     BinanceKline,
     BinanceMarkPrice,
+    BinanceWsDepthUpdate,
     BinanceUserDataStreamMsg,
     BinanceSpotOrderUpdateMsg,
     BinanceFuturesOrderUpdateMsg,
@@ -43,6 +49,7 @@ from nexustrader.exchange.binance.schema import (
     BinanceFuturesUpdateMsg,
 )
 from nexustrader.core.cache import AsyncCache
+from nexustrader.core.orderbook import OrderBook
 from nexustrader.core.nautilius_core import MessageBus
 from nexustrader.core.entity import TaskManager, RateLimit
 
@@ -76,6 +83,7 @@ class BinancePublicConnector(PublicConnector):
                 account_type=account_type,
                 handler=self._ws_msg_handler,
                 task_manager=task_manager,
+                zero_copy=True,
             ),
             msgbus=msgbus,
             api_client=BinanceApiClient(
@@ -92,6 +100,18 @@ class BinancePublicConnector(PublicConnector):
         )
         self._ws_kline_decoder = msgspec.json.Decoder(BinanceKline)
         self._ws_mark_price_decoder = msgspec.json.Decoder(BinanceMarkPrice)
+        self._ws_event_handlers = {
+            BinanceWsEventType.TRADE.value.encode(): self._parse_trade,
+            BinanceWsEventType.BOOK_TICKER.value.encode(): self._parse_futures_book_ticker,
+            BinanceWsEventType.KLINE.value.encode(): self._parse_kline,
+            BinanceWsEventType.MARK_PRICE_UPDATE.value.encode(): self._parse_mark_price,
+            BinanceWsEventType.DEPTH_UPDATE.value.encode(): self._parse_depth_update,
+        }
+        self._ws_depth_update_decoder = msgspec.json.Decoder(BinanceWsDepthUpdate)
+        self._orderbook: Dict[str, OrderBook] = {}
+        self._bookl2_depth: Dict[str, int] = {}
+        self._depth_buffer: Dict[str, List[BinanceWsDepthUpdate]] = {}
+        self._depth_synced: Set[str] = set()
 
     @property
     def market_type(self):
@@ -222,24 +242,156 @@ class BinancePublicConnector(PublicConnector):
             
         await self._ws_client.subscribe_kline(symbols, interval)
 
-    def _ws_msg_handler(self, raw: bytes):
+    async def subscribe_bookl2(self, symbol: str | List[str], depth: int):
+        symbols = []
+        if isinstance(symbol, str):
+            symbol = [symbol]
+
+        new_symbols = []
+        for s in symbol:
+            market = self._market.get(s)
+            if market is None:
+                raise ValueError(f"Symbol {s} not found")
+            if s not in self._orderbook:
+                self._orderbook[s] = OrderBook(exchange=self._exchange_id, symbol=s)
+                # buffer diff events until the rest snapshot is applied
+                self._depth_buffer[s] = []
+                new_symbols.append(s)
+            self._bookl2_depth[s] = max(self._bookl2_depth.get(s, 0), depth)
+            symbols.append(market.id)
+
+        await self._ws_client.subscribe_depth(symbols)
+
+        for s in new_symbols:
+            self._task_manager.create_task(self._sync_orderbook(s))
+
+    async def _get_depth_snapshot(self, symbol_id: str):
+        if self._account_type.is_spot:
+            return await self._api_client.get_api_v3_depth(symbol_id)
+        elif self._account_type.is_linear:
+            return await self._api_client.get_fapi_v1_depth(symbol_id)
+        elif self._account_type.is_inverse:
+            return await self._api_client.get_dapi_v1_depth(symbol_id)
+        else:
+            raise ValueError(
+                f"Unsupported BinanceAccountType.{self._account_type.value}"
+            )
+
+    async def _sync_orderbook(self, symbol: str):
+        """
+        https://developers.binance.com/docs/binance-spot-api-docs/web-socket-streams#how-to-manage-a-local-order-book-correctly
+        """
+        market = self._market[symbol]
+        book = self._orderbook[symbol]
+
+        while True:
+            if self._limiter:
+                await self._limiter.acquire()
+            try:
+                snapshot = await self._get_depth_snapshot(market.id)
+            except Exception as e:
+                self._log.error(f"Failed to fetch depth snapshot for {symbol}: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            book.apply_snapshot(
+                snapshot.bids,
+                snapshot.asks,
+                self._clock.timestamp_ms(),
+                snapshot.lastUpdateId,
+            )
+            self._depth_synced.discard(symbol)
+
+            buffer = self._depth_buffer.pop(symbol, [])
+            if all(self._apply_depth_update(symbol, book, res) for res in buffer):
+                break
+
+            self._log.warn(f"Depth gap while syncing {symbol}, refetching snapshot...")
+            self._depth_buffer[symbol] = []
+
+        self._log.debug(f"Orderbook synced for {symbol}")
+
+    def _apply_depth_update(
+        self, symbol: str, book: OrderBook, res: BinanceWsDepthUpdate
+    ) -> bool:
+        """Apply a diff event to the book, returns False if the event does not follow the book"""
+        if symbol in self._depth_synced:
+            if res.pu is not None:
+                # futures: `pu` is the final update id of the previous event
+                in_sequence = res.pu == book.update_id
+            else:
+                in_sequence = res.U == book.update_id + 1
+            if not in_sequence:
+                return False
+        else:
+            # first event after the snapshot must straddle `lastUpdateId`
+            if res.u < book.update_id:
+                return True
+            if res.U > book.update_id + 1:
+                return False
+            self._depth_synced.add(symbol)
+
+        book.apply_delta(res.b, res.a, res.E, res.u)
+        return True
+
+    def _parse_depth_update(self, raw: bytes):
+        res = self._ws_depth_update_decoder.decode(raw)
+        id = res.s + self.market_type
+        symbol = self._market_id[id]
+
+        buffer = self._depth_buffer.get(symbol)
+        if buffer is not None:
+            buffer.append(res)
+            return
+
+        book = self._orderbook.get(symbol)
+        if book is None:
+            return
+
+        if not self._apply_depth_update(symbol, book, res):
+            self._log.warn(f"Depth gap for {symbol}, resyncing orderbook...")
+            self._depth_buffer[symbol] = [res]
+            self._task_manager.create_task(self._sync_orderbook(symbol))
+            return
+
+        self._msgbus.publish(
+            topic=f"bookl2.{symbol}", msg=book.to_bookl2(self._bookl2_depth[symbol])
+        )
+
+    def _ws_msg_handler(self, raw: memoryview):
+        # `raw` is a view over the websocket frame, msgspec decodes it without copying
         try:
-            msg = self._ws_general_decoder.decode(raw)
-            if msg.e:
-                match msg.e:
-                    case BinanceWsEventType.TRADE:
-                        self._parse_trade(raw)
-                    case BinanceWsEventType.BOOK_TICKER:
-                        self._parse_futures_book_ticker(raw)
-                    case BinanceWsEventType.KLINE:
-                        self._parse_kline(raw)
-                    case BinanceWsEventType.MARK_PRICE_UPDATE:
-                        self._parse_mark_price(raw)
-            elif msg.u:
+            # route on the leading event type so every frame is decoded only once
+            event = peek_str_field(raw, b'{"e":"')
+            if event is not None:
+                handler = self._ws_event_handlers.get(event)
+                if handler:
+                    handler(raw)
+            elif raw[:5] == b'{"u":':
                 # spot book ticker doesn't have "e" key. FUCK BINANCE
                 self._parse_spot_book_ticker(raw)
+            else:
+                self._handle_general_msg(raw)
         except msgspec.DecodeError as e:
-            self._log.error(f"Error decoding message: {str(raw)} {str(e)}")
+            self._log.error(f"Error decoding message: {bytes(raw)} {str(e)}")
+
+    def _handle_general_msg(self, raw: memoryview):
+        """Slow path for frames whose routing key is not at the start of the payload"""
+        msg = self._ws_general_decoder.decode(raw)
+        if msg.e:
+            match msg.e:
+                case BinanceWsEventType.TRADE:
+                    self._parse_trade(raw)
+                case BinanceWsEventType.BOOK_TICKER:
+                    self._parse_futures_book_ticker(raw)
+                case BinanceWsEventType.KLINE:
+                    self._parse_kline(raw)
+                case BinanceWsEventType.MARK_PRICE_UPDATE:
+                    self._parse_mark_price(raw)
+                case BinanceWsEventType.DEPTH_UPDATE:
+                    self._parse_depth_update(raw)
+        elif msg.u:
+            self._parse_spot_book_ticker(raw)
 
     def _parse_kline_response(
         self, symbol: str, interval: KlineInterval, kline: BinanceResponseKline
@@ -289,7 +441,7 @@ class BinancePublicConnector(PublicConnector):
             timestamp=res.E,
             confirm=res.k.x,
         )
-        self._msgbus.publish(topic="kline", msg=ticker)
+        self._msgbus.publish(topic=f"kline.{ticker.interval.value}.{ticker.symbol}", msg=ticker)
 
     def _parse_trade(self, raw: bytes) -> Trade:
         res = self._ws_trade_decoder.decode(raw)
@@ -304,7 +456,7 @@ class BinancePublicConnector(PublicConnector):
             size=float(res.q),
             timestamp=res.T,
         )
-        self._msgbus.publish(topic="trade", msg=trade)
+        self._msgbus.publish(topic=f"trade.{trade.symbol}", msg=trade)
 
     def _parse_spot_book_ticker(self, raw: bytes) -> BookL1:
         res = self._ws_spot_book_ticker_decoder.decode(raw)
@@ -320,7 +472,7 @@ class BinancePublicConnector(PublicConnector):
             ask_size=float(res.A),
             timestamp=self._clock.timestamp_ms(),
         )
-        self._msgbus.publish(topic="bookl1", msg=bookl1)
+        self._msgbus.publish(topic=f"bookl1.{bookl1.symbol}", msg=bookl1)
 
     def _parse_futures_book_ticker(self, raw: bytes) -> BookL1:
         res = self._ws_futures_book_ticker_decoder.decode(raw)
@@ -335,7 +487,7 @@ class BinancePublicConnector(PublicConnector):
             ask_size=float(res.A),
             timestamp=res.E,
         )
-        self._msgbus.publish(topic="bookl1", msg=bookl1)
+        self._msgbus.publish(topic=f"bookl1.{bookl1.symbol}", msg=bookl1)
 
     def _parse_mark_price(self, raw: bytes):
         res = self._ws_mark_price_decoder.decode(raw)
@@ -363,9 +515,9 @@ class BinancePublicConnector(PublicConnector):
             price=float(res.i),
             timestamp=res.E,
         )
-        self._msgbus.publish(topic="mark_price", msg=mark_price)
-        self._msgbus.publish(topic="funding_rate", msg=funding_rate)
-        self._msgbus.publish(topic="index_price", msg=index_price)
+        self._msgbus.publish(topic=f"mark_price.{symbol}", msg=mark_price)
+        self._msgbus.publish(topic=f"funding_rate.{symbol}", msg=funding_rate)
+        self._msgbus.publish(topic=f"index_price.{symbol}", msg=index_price)
 
 
 class BinancePrivateConnector(PrivateConnector):
@@ -383,7 +535,22 @@ class BinancePrivateConnector(PrivateConnector):
         msgbus: MessageBus,
         task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        ws_order_entry: bool = False,
+        http_pool_size: int = 10,
+        http_keepalive_timeout: float = 60,
+        http_warmup_interval: float | None = 30,
+        http_transport: HttpTransportType = HttpTransportType.AIOHTTP,
     ):
+        # margin and portfolio margin accounts have no WS API, they keep using REST
+        ws_api_client = None
+        if ws_order_entry and account_type.ws_api_url:
+            ws_api_client = BinanceWSApiClient(
+                account_type=account_type,
+                api_key=exchange.api_key,
+                secret=exchange.secret,
+                task_manager=task_manager,
+            )
+
         super().__init__(
             account_type=account_type,
             market=exchange.market,
@@ -398,13 +565,24 @@ class BinancePrivateConnector(PrivateConnector):
                 api_key=exchange.api_key,
                 secret=exchange.secret,
                 testnet=account_type.is_testnet,
+                account_type=account_type,
+                pool_size=http_pool_size,
+                keepalive_timeout=http_keepalive_timeout,
+                warmup_interval=http_warmup_interval,
+                transport=http_transport,
             ),
             cache=cache,
             msgbus=msgbus,
+            task_manager=task_manager,
             rate_limit=rate_limit,
+            ws_api_client=ws_api_client,
         )
 
-        self._task_manager = task_manager
+        if ws_order_entry and ws_api_client is None:
+            self._log.warn(
+                f"WS order entry is not supported for `{account_type.value}`, using REST"
+            )
+
         self._ws_msg_general_decoder = msgspec.json.Decoder(BinanceUserDataStreamMsg)
         self._ws_msg_spot_order_update_decoder = msgspec.json.Decoder(
             BinanceSpotOrderUpdateMsg
@@ -717,7 +895,10 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.post_api_v3_order(**params)
+            return await self._order_request(
+                lambda: self._ws_api_client.place_order(**params),
+                lambda: self._api_client.post_api_v3_order(**params),
+            )
 
         elif self._account_type.is_isolated_margin_or_margin:
             if not market.margin:
@@ -731,14 +912,20 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.post_fapi_v1_order(**params)
+            return await self._order_request(
+                lambda: self._ws_api_client.place_order(**params),
+                lambda: self._api_client.post_fapi_v1_order(**params),
+            )
 
         elif self._account_type.is_inverse:
             if not market.inverse:
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.post_dapi_v1_order(**params)
+            return await self._order_request(
+                lambda: self._ws_api_client.place_order(**params),
+                lambda: self._api_client.post_dapi_v1_order(**params),
+            )
 
         elif self._account_type.is_portfolio_margin:
             if market.margin:
@@ -894,35 +1081,10 @@ class BinancePrivateConnector(PrivateConnector):
         market = self._market.get(symbol)
         if not market:
             raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
-        id = market.id
-
-        params = {
-            "symbol": id,
-            "side": BinanceEnumParser.to_binance_order_side(side).value,
-            "type": BinanceEnumParser.to_binance_order_type(type).value,
-            "quantity": amount,
-        }
-
-        if type == OrderType.LIMIT:
-            if not price:
-                raise ValueError("Price is required for  order")
-            params["price"] = price
-            params["timeInForce"] = BinanceEnumParser.to_binance_time_in_force(
-                time_in_force
-            ).value
-
-        if position_side:
-            params["positionSide"] = BinanceEnumParser.to_binance_position_side(
-                position_side
-            ).value
 
-        reduce_only = kwargs.pop("reduceOnly", False) or kwargs.pop(
-            "reduce_only", False
+        params = self._get_order_params(
+            market, side, type, amount, price, time_in_force, position_side, **kwargs
         )
-        if reduce_only:
-            params["reduceOnly"] = True
-
-        params.update(kwargs)
 
         try:
             res = await self._execute_order_request(market, symbol, params)
@@ -966,6 +1128,230 @@ class BinancePrivateConnector(PrivateConnector):
             )
             return order
 
+    def _get_order_params(
+        self,
+        market: BinanceMarket,
+        side: OrderSide,
+        type: OrderType,
+        amount: Decimal,
+        price: Decimal | None = None,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        position_side: PositionSide | None = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        params = {
+            "symbol": market.id,
+            "side": BinanceEnumParser.to_binance_order_side(side).value,
+            "type": BinanceEnumParser.to_binance_order_type(type).value,
+            "quantity": amount,
+        }
+
+        if type == OrderType.LIMIT:
+            if not price:
+                raise ValueError("Price is required for  order")
+            params["price"] = price
+            params["timeInForce"] = BinanceEnumParser.to_binance_time_in_force(
+                time_in_force
+            ).value
+
+        if position_side:
+            params["positionSide"] = BinanceEnumParser.to_binance_position_side(
+                position_side
+            ).value
+
+        reduce_only = kwargs.pop("reduceOnly", False) or kwargs.pop(
+            "reduce_only", False
+        )
+        if reduce_only:
+            params["reduceOnly"] = True
+
+        params.update(kwargs)
+        return params
+
+    async def create_orders(self, orders: List[BatchOrder]) -> List[Order]:
+        # only the futures apis have a batchOrders endpoint
+        if not (self._account_type.is_linear or self._account_type.is_inverse):
+            return await super().create_orders(orders)
+
+        results = await asyncio.gather(
+            *(
+                self._create_orders_batch(orders[i : i + BINANCE_MAX_BATCH_ORDERS])
+                for i in range(0, len(orders), BINANCE_MAX_BATCH_ORDERS)
+            )
+        )
+        return [order for batch in results for order in batch]
+
+    async def _create_orders_batch(self, orders: List[BatchOrder]) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+
+        batch_params = []
+        for order in orders:
+            market = self._market.get(order.symbol)
+            if not market:
+                raise ValueError(
+                    f"Symbol {order.symbol} formated wrongly, or not supported"
+                )
+            batch_params.append(
+                self._get_order_params(
+                    market,
+                    order.side,
+                    order.type,
+                    order.amount,
+                    order.price,
+                    order.time_in_force,
+                    order.position_side,
+                    **order.kwargs,
+                )
+            )
+
+        try:
+            if self._account_type.is_linear:
+                res = await self._api_client.post_fapi_v1_batch_orders(batch_params)
+            else:
+                res = await self._api_client.post_dapi_v1_batch_orders(batch_params)
+        except Exception as e:
+            error_msg = f"{e.__class__.__name__}: {str(e)}"
+            self._log.error(
+                f"Error creating batch orders: {error_msg} params: {str(batch_params)}"
+            )
+            res = [None] * len(orders)
+
+        results = []
+        for order, params, item in zip(orders, batch_params, res):
+            if isinstance(item, BinanceOrder):
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        symbol=order.symbol,
+                        status=OrderStatus.PENDING,
+                        id=item.orderId,
+                        amount=order.amount,
+                        filled=Decimal(0),
+                        client_order_id=item.clientOrderId,
+                        timestamp=item.updateTime,
+                        type=order.type,
+                        side=order.side,
+                        time_in_force=order.time_in_force,
+                        price=float(item.price) if item.price else None,
+                        average=float(item.avgPrice) if item.avgPrice else None,
+                        remaining=order.amount,
+                        reduce_only=item.reduceOnly if item.reduceOnly else None,
+                        position_side=BinanceEnumParser.parse_position_side(
+                            item.positionSide
+                        )
+                        if item.positionSide
+                        else None,
+                    )
+                )
+            else:
+                if item is not None:
+                    self._log.error(
+                        f"Error creating order: {item.code} {item.msg} params: {str(params)}"
+                    )
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=order.symbol,
+                        type=order.type,
+                        side=order.side,
+                        amount=order.amount,
+                        price=float(order.price) if order.price else None,
+                        time_in_force=order.time_in_force,
+                        position_side=order.position_side,
+                        status=OrderStatus.FAILED,
+                        filled=Decimal(0),
+                        remaining=order.amount,
+                    )
+                )
+        return results
+
+    async def cancel_orders(self, symbol: str, order_ids: List[int], **kwargs):
+        if not (self._account_type.is_linear or self._account_type.is_inverse):
+            return await super().cancel_orders(symbol, order_ids, **kwargs)
+
+        results = await asyncio.gather(
+            *(
+                self._cancel_orders_batch(
+                    symbol, order_ids[i : i + BINANCE_MAX_BATCH_CANCEL_ORDERS]
+                )
+                for i in range(0, len(order_ids), BINANCE_MAX_BATCH_CANCEL_ORDERS)
+            )
+        )
+        return [order for batch in results for order in batch]
+
+    async def _cancel_orders_batch(
+        self, symbol: str, order_ids: List[int]
+    ) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+        market = self._market.get(symbol)
+        if not market:
+            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+
+        try:
+            if self._account_type.is_linear:
+                res = await self._api_client.delete_fapi_v1_batch_orders(
+                    market.id, order_ids
+                )
+            else:
+                res = await self._api_client.delete_dapi_v1_batch_orders(
+                    market.id, order_ids
+                )
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error canceling batch orders: {error_msg} symbol: {symbol} order_ids: {order_ids}"
+            )
+            res = [None] * len(order_ids)
+
+        results = []
+        for order_id, item in zip(order_ids, res):
+            if isinstance(item, BinanceOrder):
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        symbol=symbol,
+                        status=OrderStatus.CANCELING,
+                        id=item.orderId,
+                        amount=item.origQty,
+                        filled=Decimal(item.executedQty),
+                        client_order_id=item.clientOrderId,
+                        timestamp=item.updateTime,
+                        type=BinanceEnumParser.parse_order_type(item.type)
+                        if item.type
+                        else None,
+                        side=BinanceEnumParser.parse_order_side(item.side)
+                        if item.side
+                        else None,
+                        price=item.price,
+                        average=item.avgPrice,
+                        remaining=Decimal(item.origQty) - Decimal(item.executedQty),
+                        reduce_only=item.reduceOnly,
+                        position_side=BinanceEnumParser.parse_position_side(
+                            item.positionSide
+                        )
+                        if item.positionSide
+                        else None,
+                    )
+                )
+            else:
+                if item is not None:
+                    self._log.error(
+                        f"Error canceling order: {item.code} {item.msg} symbol: {symbol} order_id: {order_id}"
+                    )
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=symbol,
+                        id=order_id,
+                        status=OrderStatus.CANCEL_FAILED,
+                    )
+                )
+        return results
+
     async def _execute_cancel_order_request(
         self, market: BinanceMarket, symbol: str, params: Dict[str, Any]
     ):
@@ -974,7 +1360,10 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.delete_api_v3_order(**params)
+            return await self._order_request(
+                lambda: self._ws_api_client.cancel_order(**params),
+                lambda: self._api_client.delete_api_v3_order(**params),
+            )
         elif self._account_type.is_isolated_margin_or_margin:
             if not market.margin:
                 raise ValueError(
@@ -986,13 +1375,19 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.delete_fapi_v1_order(**params)
+            return await self._order_request(
+                lambda: self._ws_api_client.cancel_order(**params),
+                lambda: self._api_client.delete_fapi_v1_order(**params),
+            )
         elif self._account_type.is_inverse:
             if not market.inverse:
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.delete_dapi_v1_order(**params)
+            return await self._order_request(
+                lambda: self._ws_api_client.cancel_order(**params),
+                lambda: self._api_client.delete_dapi_v1_order(**params),
+            )
         elif self._account_type.is_portfolio_margin:
             if market.margin:
                 return await self._api_client.delete_papi_v1_margin_order(**params)
@@ -258,6 +258,11 @@ class BinanceAccountType(AccountType):
     @property
     def ws_url(self):
         return STREAM_URLS[self]
+
+    @property
+    def ws_api_url(self):
+        """WebSocket API url for order entry, None if the account type has no WS API"""
+        return WS_API_URLS.get(self)
     
     @property
     def is_mock(self):
@@ -308,6 +313,15 @@ STREAM_URLS = {
     BinanceAccountType.COIN_M_FUTURE_TESTNET: "wss://dstream.binancefuture.com/ws",
 }
 
+WS_API_URLS = {
+    BinanceAccountType.SPOT: "wss://ws-api.binance.com:443/ws-api/v3",
+    BinanceAccountType.USD_M_FUTURE: "wss://ws-fapi.binance.com/ws-fapi/v1",
+    BinanceAccountType.COIN_M_FUTURE: "wss://ws-dapi.binance.com/ws-dapi/v1",
+    BinanceAccountType.SPOT_TESTNET: "wss://testnet.binance.vision/ws-api/v3",
+    BinanceAccountType.USD_M_FUTURE_TESTNET: "wss://testnet.binancefuture.com/ws-fapi/v1",
+    BinanceAccountType.COIN_M_FUTURE_TESTNET: "wss://testnet.binancefuture.com/ws-dapi/v1",
+}
+
 ENDPOINTS = {
     EndpointsType.USER_DATA_STREAM: {
         BinanceAccountType.SPOT: "/api/v3/userDataStream",
@@ -331,9 +345,25 @@ ENDPOINTS = {
         BinanceAccountType.USD_M_FUTURE_TESTNET: "/fapi/v1",
         BinanceAccountType.COIN_M_FUTURE_TESTNET: "/dapi/v1",
     },
+    # connectivity test, used to keep pooled connections warm
+    EndpointsType.GENERAL: {
+        BinanceAccountType.SPOT: "/api/v3/ping",
+        BinanceAccountType.MARGIN: "/api/v3/ping",
+        BinanceAccountType.ISOLATED_MARGIN: "/api/v3/ping",
+        BinanceAccountType.USD_M_FUTURE: "/fapi/v1/ping",
+        BinanceAccountType.COIN_M_FUTURE: "/dapi/v1/ping",
+        BinanceAccountType.PORTFOLIO_MARGIN: "/papi/v1/ping",
+        BinanceAccountType.SPOT_TESTNET: "/api/v3/ping",
+        BinanceAccountType.USD_M_FUTURE_TESTNET: "/fapi/v1/ping",
+        BinanceAccountType.COIN_M_FUTURE_TESTNET: "/dapi/v1/ping",
+    },
 }
 
 
+# max orders per futures batchOrders request
+BINANCE_MAX_BATCH_ORDERS = 5
+BINANCE_MAX_BATCH_CANCEL_ORDERS = 10
+
 class BinanceErrorCode(Enum):
     """
     Represents a Binance error code (covers futures).
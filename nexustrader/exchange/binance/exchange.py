@@ -11,15 +11,16 @@ class BinanceExchangeManager(ExchangeManager):
     api: ccxt.binance
     market: Dict[str, BinanceMarket] 
     market_id: Dict[str, str]
+    market_type = BinanceMarket
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, **kwargs):
         config = config or {}
         config["exchange_id"] = config.get("exchange_id", "binance")
-        super().__init__(config)
+        super().__init__(config, **kwargs)
             
-    def load_markets(self):
-        market = self.api.load_markets()
-        for symbol,mkt in market.items():
+    def _parse_markets(self, markets: Dict[str, Any]):
+        market, market_id = {}, {}
+        for symbol, mkt in markets.items():
             try:
                 mkt_json = orjson.dumps(mkt)
                 mkt = msgspec.json.decode(mkt_json, type=BinanceMarket)
@@ -27,17 +28,18 @@ class BinanceExchangeManager(ExchangeManager):
                 if (mkt.spot or mkt.linear or mkt.inverse or mkt.future) and not mkt.option:
                     symbol = self._parse_symbol(mkt, exchange_suffix="BINANCE")
                     mkt.symbol = symbol
-                    self.market[symbol] = mkt
+                    market[symbol] = mkt
                     if mkt.type.value == "spot":
-                        self.market_id[f"{mkt.id}_spot"] = symbol
+                        market_id[f"{mkt.id}_spot"] = symbol
                     elif mkt.linear:
-                        self.market_id[f"{mkt.id}_linear"] = symbol
+                        market_id[f"{mkt.id}_linear"] = symbol
                     elif mkt.inverse:
-                        self.market_id[f"{mkt.id}_inverse"] = symbol
+                        market_id[f"{mkt.id}_inverse"] = symbol
                 
             except Exception as e:
                 print(f"Error: {e}, {symbol}, {mkt}")
                 continue
+        return market, market_id
 
 def check():
     bnc = BinanceExchangeManager()
@@ -3,17 +3,20 @@ import orjson
 import hashlib
 import msgspec
 import asyncio
-import aiohttp
 
 
-from typing import Any, Dict
-from urllib.parse import urljoin, urlencode
+from typing import Any, Dict, List
+from urllib.parse import urljoin
 
 from nexustrader.base import ApiClient
-from nexustrader.exchange.binance.schema import BinanceOrder, BinanceListenKey, BinanceSpotAccountInfo, BinanceFuturesAccountInfo, BinanceResponseKline
-from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.base.api_client import encode_query
+from nexustrader.exchange.binance.schema import BinanceOrder, BinanceBatchOrderError, BinanceListenKey, BinanceSpotAccountInfo, BinanceFuturesAccountInfo, BinanceResponseKline, BinanceResponseDepth
+from nexustrader.exchange.binance.constants import (
+    ENDPOINTS,
+    BinanceAccountType,
+    EndpointsType,
+)
 from nexustrader.exchange.binance.error import BinanceClientError, BinanceServerError
-from nexustrader.core.nautilius_core import hmac_signature
 
 class BinanceApiClient(ApiClient):
     def __init__(
@@ -22,12 +25,23 @@ class BinanceApiClient(ApiClient):
         secret: str = None,
         testnet: bool = False,
         timeout: int = 10,
+        account_type: BinanceAccountType | None = None,
+        **kwargs,
     ):
         super().__init__(
             api_key=api_key,
             secret=secret,
             timeout=timeout,
+            **kwargs,
         )
+        if account_type:
+            # keep the pool to the host the account trades on warm
+            self._warmup_urls.append(
+                urljoin(
+                    account_type.base_url,
+                    ENDPOINTS[EndpointsType.GENERAL][account_type],
+                )
+            )
         self._headers = {
             "Content-Type": "application/json",
             "User-Agent": "TradingBot/1.0",
@@ -38,10 +52,13 @@ class BinanceApiClient(ApiClient):
         
         self._testnet = testnet
         self._order_decoder = msgspec.json.Decoder(BinanceOrder)
+        self._batch_orders_decoder = msgspec.json.Decoder(list[msgspec.Raw])
+        self._batch_order_error_decoder = msgspec.json.Decoder(BinanceBatchOrderError)
         self._spot_account_decoder = msgspec.json.Decoder(BinanceSpotAccountInfo)
         self._futures_account_decoder = msgspec.json.Decoder(BinanceFuturesAccountInfo)
         self._listen_key_decoder = msgspec.json.Decoder(BinanceListenKey)
         self._kline_response_decoder = msgspec.json.Decoder(list[BinanceResponseKline])
+        self._depth_response_decoder = msgspec.json.Decoder(BinanceResponseDepth)
 
     def _generate_signature(self, query: str) -> str:
         signature = hmac.new(
@@ -50,9 +67,8 @@ class BinanceApiClient(ApiClient):
         return signature
     
     def _generate_signature_v2(self, query: str) -> str:
-        signature = hmac_signature(self._secret, query)
-        return signature
-    
+        return self._signer.hexdigest(query)
+
     async def _fetch(
         self,
         method: str,
@@ -63,30 +79,31 @@ class BinanceApiClient(ApiClient):
         required_timestamp: bool = True,
     ) -> Any:
         self._init_session()
-        
-        url = urljoin(base_url, endpoint)
+
+        url = self._url(base_url, endpoint)
         payload = payload or {}
         if required_timestamp:
             payload["timestamp"] = self._clock.timestamp_ms()
-        payload = urlencode(payload)
+        query = encode_query(payload)
 
         if signed:
-            signature = self._generate_signature_v2(payload)
-            payload += f"&signature={signature}"
+            query += "&signature=" + self._generate_signature_v2(query)
 
-        url += f"?{payload}"
-        self._log.debug(f"Request: {url}")
+        if query:
+            url += "?" + query
+        if self._log_debug:
+            self._log.debug(f"Request: {url}")
 
         try:
-            response = await self._session.request(
+            response = await self._transport.request(
                 method=method,
                 url=url,
                 headers=self._headers,
             )
-            raw = await response.read()
+            raw = response.body
             self.raise_error(raw, response.status, response.headers)
             return raw
-        except aiohttp.ClientError as e:
+        except ConnectionError as e:
             self._log.error(f"Client Error {method} Url: {url} {e}")
             raise
         except asyncio.TimeoutError:
@@ -96,6 +113,31 @@ class BinanceApiClient(ApiClient):
             self._log.error(f"Error {method} Url: {url} {e}")
             raise
 
+    def _decode_batch_orders(
+        self, raw: bytes
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        # each entry is either an order or an error object, in the request order
+        results = []
+        for item in self._batch_orders_decoder.decode(raw):
+            try:
+                results.append(self._order_decoder.decode(item))
+            except msgspec.ValidationError:
+                results.append(self._batch_order_error_decoder.decode(item))
+        return results
+
+    @staticmethod
+    def _encode_batch_orders(batch_orders: List[Dict[str, Any]]) -> str:
+        # batchOrders is a json list whose values are all sent as strings
+        return orjson.dumps(
+            [
+                {
+                    k: str(v).lower() if isinstance(v, bool) else str(v)
+                    for k, v in params.items()
+                }
+                for params in batch_orders
+            ]
+        ).decode("utf-8")
+
     def raise_error(self, raw: bytes, status: int, headers: Dict[str, Any]):
         if 400 <= status < 500:
             raise BinanceClientError(status, orjson.loads(raw), headers)
@@ -303,6 +345,30 @@ class BinanceApiClient(ApiClient):
         raw = await self._fetch("POST", base_url, end_point, payload=data, signed=True)
         return self._order_decoder.decode(raw)
 
+    async def post_fapi_v1_batch_orders(
+        self, batch_orders: List[Dict[str, Any]]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Place-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/batchOrders"
+        data = {"batchOrders": self._encode_batch_orders(batch_orders)}
+        raw = await self._fetch("POST", base_url, end_point, payload=data, signed=True)
+        return self._decode_batch_orders(raw)
+
+    async def post_dapi_v1_batch_orders(
+        self, batch_orders: List[Dict[str, Any]]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Place-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/batchOrders"
+        data = {"batchOrders": self._encode_batch_orders(batch_orders)}
+        raw = await self._fetch("POST", base_url, end_point, payload=data, signed=True)
+        return self._decode_batch_orders(raw)
+
     async def post_dapi_v1_order(
         self,
         symbol: str,
@@ -432,6 +498,36 @@ class BinanceApiClient(ApiClient):
         raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
         return self._order_decoder.decode(raw)
 
+    async def delete_fapi_v1_batch_orders(
+        self, symbol: str, order_id_list: List[int]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Cancel-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/batchOrders"
+        data = {
+            "symbol": symbol,
+            "orderIdList": orjson.dumps(order_id_list).decode("utf-8"),
+        }
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._decode_batch_orders(raw)
+
+    async def delete_dapi_v1_batch_orders(
+        self, symbol: str, order_id_list: List[int]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Cancel-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/batchOrders"
+        data = {
+            "symbol": symbol,
+            "orderIdList": orjson.dumps(order_id_list).decode("utf-8"),
+        }
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._decode_batch_orders(raw)
+
     async def delete_dapi_v1_order(self, symbol: str, order_id: int, **kwargs) -> BinanceOrder:
         """
         https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Cancel-Order
@@ -595,3 +691,42 @@ class BinanceApiClient(ApiClient):
         
         raw = await self._fetch("GET", base_url, end_point, payload=data)
         return self._kline_response_decoder.decode(raw)
+
+    async def get_api_v3_depth(self, symbol: str, limit: int = 1000) -> BinanceResponseDepth:
+        """
+        https://developers.binance.com/docs/binance-spot-api-docs/rest-api/market-data-endpoints#order-book
+        """
+        base_url = self._get_base_url(BinanceAccountType.SPOT)
+        end_point = "/api/v3/depth"
+        data = {
+            "symbol": symbol,
+            "limit": limit,
+        }
+        raw = await self._fetch("GET", base_url, end_point, payload=data)
+        return self._depth_response_decoder.decode(raw)
+
+    async def get_fapi_v1_depth(self, symbol: str, limit: int = 1000) -> BinanceResponseDepth:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Order-Book
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/depth"
+        data = {
+            "symbol": symbol,
+            "limit": limit,
+        }
+        raw = await self._fetch("GET", base_url, end_point, payload=data)
+        return self._depth_response_decoder.decode(raw)
+
+    async def get_dapi_v1_depth(self, symbol: str, limit: int = 1000) -> BinanceResponseDepth:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/market-data/rest-api/Order-Book
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/depth"
+        data = {
+            "symbol": symbol,
+            "limit": limit,
+        }
+        raw = await self._fetch("GET", base_url, end_point, payload=data)
+        return self._depth_response_decoder.decode(raw)
@@ -285,6 +285,31 @@ class BinanceFuturesBookTicker(msgspec.Struct):
     A: str
 
 
+class BinanceWsDepthUpdate(msgspec.Struct):
+    """
+    {
+        "e": "depthUpdate", // Event type
+        "E": 1672515782136, // Event time
+        "T": 1672515782136, // Transaction time (futures only)
+        "s": "BNBBTC",      // Symbol
+        "U": 157,           // First update ID in event
+        "u": 160,           // Final update ID in event
+        "pu": 149,          // Final update ID in last stream (futures only)
+        "b": [["0.0024", "10"]],
+        "a": [["0.0026", "100"]]
+    }
+    """
+    e: BinanceWsEventType
+    E: int
+    s: str
+    U: int
+    u: int
+    b: list[list[str]]
+    a: list[list[str]]
+    pu: int | None = None
+    T: int | None = None
+
+
 class BinanceWsMessageGeneral(msgspec.Struct):
     e: BinanceWsEventType | None = None
     u: int | None = None
@@ -328,6 +353,40 @@ class BinanceUserTrade(msgspec.Struct, frozen=True):
     pair: str | None = None  # COIN-M FUTURES only
 
 
+
+class BinanceBatchOrderError(msgspec.Struct, frozen=True):
+    """
+    Entry of a `batchOrders` response for an order that was rejected
+    """
+
+    code: int
+    msg: str
+
+
+class BinanceWsApiError(msgspec.Struct, frozen=True):
+    code: int
+    msg: str
+
+
+class BinanceWsApiResponse(msgspec.Struct, frozen=True):
+    """
+    Response of a WebSocket API request, `result` is left undecoded since its
+    type depends on the method, `error` is set instead when the request failed
+
+    {
+        "id": "1",
+        "status": 200,
+        "result": {...},
+        "rateLimits": [...]
+    }
+    """
+
+    id: str | None
+    status: int
+    result: msgspec.Raw | None = None
+    error: BinanceWsApiError | None = None
+
+
 class BinanceOrder(msgspec.Struct, frozen=True):
     symbol: str
     orderId: int
@@ -377,29 +436,29 @@ class BinanceOrder(msgspec.Struct, frozen=True):
 
 
 class BinanceMarketInfo(msgspec.Struct):
-    symbol: str = None
-    status: str = None
-    baseAsset: str = None
-    baseAssetPrecision: str | int = None
-    quoteAsset: str = None
-    quotePrecision: str | int = None
-    quoteAssetPrecision: str | int = None
-    baseCommissionPrecision: str | int = None
-    quoteCommissionPrecision: str | int = None
-    orderTypes: List[BinanceOrderType] = None
-    icebergAllowed: bool = None
-    ocoAllowed: bool = None
-    otoAllowed: bool = None
-    quoteOrderQtyMarketAllowed: bool = None
-    allowTrailingStop: bool = None
-    cancelReplaceAllowed: bool = None
-    isSpotTradingAllowed: bool = None
-    isMarginTradingAllowed: bool = None
-    filters: List[Dict[str, Any]] = None
-    permissions: List[str] = None
-    permissionSets: List[List[str]] = None
-    defaultSelfTradePreventionMode: str = None
-    allowedSelfTradePreventionModes: List[str] = None
+    symbol: str | None = None
+    status: str | None = None
+    baseAsset: str | None = None
+    baseAssetPrecision: str | int | None = None
+    quoteAsset: str | None = None
+    quotePrecision: str | int | None = None
+    quoteAssetPrecision: str | int | None = None
+    baseCommissionPrecision: str | int | None = None
+    quoteCommissionPrecision: str | int | None = None
+    orderTypes: List[BinanceOrderType] | None = None
+    icebergAllowed: bool | None = None
+    ocoAllowed: bool | None = None
+    otoAllowed: bool | None = None
+    quoteOrderQtyMarketAllowed: bool | None = None
+    allowTrailingStop: bool | None = None
+    cancelReplaceAllowed: bool | None = None
+    isSpotTradingAllowed: bool | None = None
+    isMarginTradingAllowed: bool | None = None
+    filters: List[Dict[str, Any]] | None = None
+    permissions: List[str] | None = None
+    permissionSets: List[List[str]] | None = None
+    defaultSelfTradePreventionMode: str | None = None
+    allowedSelfTradePreventionModes: List[str] | None = None
 
 
 class BinanceMarket(BaseMarket):
@@ -469,6 +528,19 @@ class BinanceSpotUpdateMsg(msgspec.Struct, kw_only=True):
     def parse_to_balances(self) -> List[Balance]:
         return [balance.parse_to_balance() for balance in self.B]
 
+class BinanceResponseDepth(msgspec.Struct):
+    """
+    {
+        "lastUpdateId": 1027024,
+        "bids": [["4.00000000", "431.00000000"]],
+        "asks": [["4.00000200", "12.00000000"]]
+    }
+    """
+    lastUpdateId: int
+    bids: list[list[str]]
+    asks: list[list[str]]
+
+
 class BinanceResponseKline(msgspec.Struct, array_like=True):
     """
     [
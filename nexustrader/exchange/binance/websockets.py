@@ -1,11 +1,15 @@
-from typing import Callable, List
+import msgspec
+from typing import Callable, Dict, List, Literal
 from typing import Any
 from aiolimiter import AsyncLimiter
 
 
 from nexustrader.base import WSClient
 from nexustrader.exchange.binance.constants import BinanceAccountType, BinanceKlineInterval
+from nexustrader.exchange.binance.error import BinanceClientError, BinanceServerError
+from nexustrader.exchange.binance.schema import BinanceOrder, BinanceWsApiResponse
 from nexustrader.core.entity import TaskManager
+from nexustrader.core.nautilius_core import hmac_signature
 
 
 class BinanceWSClient(WSClient):
@@ -14,6 +18,7 @@ class BinanceWSClient(WSClient):
         account_type: BinanceAccountType,
         handler: Callable[..., Any],
         task_manager: TaskManager,
+        zero_copy: bool = False,
     ):
         self._account_type = account_type
         url = account_type.ws_url
@@ -23,6 +28,7 @@ class BinanceWSClient(WSClient):
             handler=handler,
             task_manager=task_manager,
             enable_auto_ping=False,
+            zero_copy=zero_copy,
         )
     
     async def _send_payload(self, params: List[str], chunk_size: int = 50):
@@ -83,6 +89,22 @@ class BinanceWSClient(WSClient):
         params = [f"{symbol.lower()}@bookTicker" for symbol in symbols]
         await self._subscribe(params)
         
+    async def subscribe_depth(
+        self,
+        symbols: List[str],
+        speed: Literal["100ms", "250ms", "500ms", "1000ms"] = "100ms",
+    ):
+        """diff depth stream, spot supports 100ms/1000ms and futures 100ms/250ms/500ms"""
+        if (
+            self._account_type.is_isolated_margin_or_margin
+            or self._account_type.is_portfolio_margin
+        ):
+            raise ValueError(
+                "Not Supported for `Margin Account` or `Portfolio Margin Account`"
+            )
+        params = [f"{symbol.lower()}@depth@{speed}" for symbol in symbols]
+        await self._subscribe(params)
+
     # NOTE: Currently not supported by Binance
     # async def subscribe_mark_price(
     #     self, symbol: str, interval: Literal["1s", "3s"] = "1s"
@@ -113,3 +135,84 @@ class BinanceWSClient(WSClient):
 
     async def _resubscribe(self):
         await self._send_payload(self._subscriptions)
+
+
+class BinanceWSApiClient(WSClient):
+    """Order entry over the Binance WebSocket API.
+
+    Requests are signed like their REST counterparts and answered on the same
+    connection by a response carrying the request `id`.
+    """
+
+    def __init__(
+        self,
+        account_type: BinanceAccountType,
+        api_key: str,
+        secret: str,
+        task_manager: TaskManager,
+        timeout: int = 5,
+    ):
+        if not account_type.ws_api_url:
+            raise ValueError(f"WebSocket API is not supported for `{account_type.value}`")
+        self._account_type = account_type
+        self._api_key = api_key
+        self._secret = secret
+        self._timeout = timeout
+        self._response_decoder = msgspec.json.Decoder(BinanceWsApiResponse)
+        self._order_decoder = msgspec.json.Decoder(BinanceOrder)
+        # order rate limit: 100 per 10s for spot, 300 per 10s for futures
+        max_rate = 100 if account_type.is_spot else 300
+        super().__init__(
+            account_type.ws_api_url,
+            limiter=AsyncLimiter(max_rate=max_rate, time_period=10),
+            handler=self._ws_msg_handler,
+            task_manager=task_manager,
+            enable_auto_ping=False,
+        )
+
+    def _ws_msg_handler(self, raw: bytes):
+        try:
+            msg = self._response_decoder.decode(raw)
+        except msgspec.DecodeError:
+            self._log.error(f"Error decoding message: {str(raw)}")
+            return
+        if not self._resolve_request(msg.id, msg):
+            self._log.warn(f"Response to unknown request: {str(raw)}")
+
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        params = {
+            key: str(value).lower() if isinstance(value, bool) else str(value)
+            for key, value in params.items()
+        }
+        params["apiKey"] = self._api_key
+        params["timestamp"] = self._clock.timestamp_ms()
+        query = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+        params["signature"] = hmac_signature(self._secret, query)
+        return params
+
+    async def _signed_request(self, method: str, params: Dict[str, Any]) -> BinanceOrder:
+        req_id = self._next_request_id()
+        payload = {"id": req_id, "method": method, "params": self._sign(params)}
+        msg: BinanceWsApiResponse = await self._request(req_id, payload, self._timeout)
+        if msg.error:
+            message = {"code": msg.error.code, "msg": msg.error.msg}
+            if msg.status >= 500:
+                raise BinanceServerError(msg.status, message, {})
+            raise BinanceClientError(msg.status, message, {})
+        return self._order_decoder.decode(msg.result)
+
+    async def place_order(self, symbol: str, side: str, type: str, **kwargs) -> BinanceOrder:
+        """
+        https://developers.binance.com/docs/binance-spot-api-docs/web-socket-api/trading-requests
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/websocket-api
+        """
+        params = {"symbol": symbol, "side": side, "type": type, **kwargs}
+        return await self._signed_request("order.place", params)
+
+    async def cancel_order(self, symbol: str, order_id: int, **kwargs) -> BinanceOrder:
+        params = {"symbol": symbol, "orderId": order_id, **kwargs}
+        return await self._signed_request("order.cancel", params)
+
+    async def _resubscribe(self):
+        pass
+
@@ -1,13 +1,26 @@
+import importlib
 from nexustrader.exchange.bybit.constants import BybitAccountType
-from nexustrader.exchange.bybit.websockets import BybitWSClient
-from nexustrader.exchange.bybit.connector import (
-    BybitPublicConnector,
-    BybitPrivateConnector,
-)
-from nexustrader.exchange.bybit.exchange import BybitExchangeManager
-from nexustrader.exchange.bybit.rest_api import BybitApiClient
-from nexustrader.exchange.bybit.ems import BybitExecutionManagementSystem
-from nexustrader.exchange.bybit.oms import BybitOrderManagementSystem
+
+# the connectors pull in ccxt, aiohttp, picows and nautilus, they are only
+# imported when first used so loading the account types stays cheap
+_LAZY_IMPORTS = {
+    "BybitWSClient": "nexustrader.exchange.bybit.websockets",
+    "BybitPublicConnector": "nexustrader.exchange.bybit.connector",
+    "BybitExchangeManager": "nexustrader.exchange.bybit.exchange",
+    "BybitApiClient": "nexustrader.exchange.bybit.rest_api",
+    "BybitPrivateConnector": "nexustrader.exchange.bybit.connector",
+    "BybitExecutionManagementSystem": "nexustrader.exchange.bybit.ems",
+    "BybitOrderManagementSystem": "nexustrader.exchange.bybit.oms",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BybitAccountType",
@@ -1,12 +1,15 @@
+import asyncio
 import msgspec
-from typing import Dict, List
-from decimal import Decimal
+from typing import Any, Dict, List
 from collections import defaultdict
+from decimal import Decimal
 from nexustrader.base import PublicConnector, PrivateConnector
+from nexustrader.base.ws_client import peek_str_field
 from nexustrader.core.nautilius_core import MessageBus
 from nexustrader.core.entity import TaskManager, RateLimit
 from nexustrader.core.cache import AsyncCache
-from nexustrader.schema import BookL1, Order, Trade, Position, Kline
+from nexustrader.core.orderbook import OrderBook
+from nexustrader.schema import Order, Trade, Position, Kline, BatchOrder
 from nexustrader.constants import (
     OrderSide,
     OrderStatus,
@@ -15,12 +18,12 @@ from nexustrader.constants import (
     PositionSide,
     KlineInterval,
     TriggerType,
+    HttpTransportType,
 )
 from nexustrader.exchange.bybit.schema import (
     BybitWsMessageGeneral,
     BybitWsOrderMsg,
     BybitWsOrderbookDepthMsg,
-    BybitOrderBook,
     BybitMarket,
     BybitWsTradeMsg,
     BybitWsPositionMsg,
@@ -28,10 +31,12 @@ from nexustrader.exchange.bybit.schema import (
     BybitWsKlineMsg,
     BybitWalletBalanceResponse,
     BybitPositionResponse,
+    BybitBatchOrderResponse,
 )
 from nexustrader.exchange.bybit.rest_api import BybitApiClient
-from nexustrader.exchange.bybit.websockets import BybitWSClient
+from nexustrader.exchange.bybit.websockets import BybitWSClient, BybitWSApiClient
 from nexustrader.exchange.bybit.constants import (
+    BYBIT_MAX_BATCH_ORDERS,
     BybitAccountType,
     BybitEnumParser,
 )
@@ -64,6 +69,7 @@ class BybitPublicConnector(PublicConnector):
                 account_type=account_type,
                 handler=self._ws_msg_handler,
                 task_manager=task_manager,
+                zero_copy=True,
             ),
             msgbus=msgbus,
             api_client=BybitApiClient(
@@ -76,7 +82,8 @@ class BybitPublicConnector(PublicConnector):
         self._ws_msg_orderbook_decoder = msgspec.json.Decoder(BybitWsOrderbookDepthMsg)
         self._ws_msg_general_decoder = msgspec.json.Decoder(BybitWsMessageGeneral)
         self._ws_msg_kline_decoder = msgspec.json.Decoder(BybitWsKlineMsg)
-        self._orderbook = defaultdict(BybitOrderBook)
+        self._orderbook: Dict[str, OrderBook] = {}
+        self._bookl2_depth: Dict[str, int] = {}
 
     @property
     def market_type(self):
@@ -89,26 +96,38 @@ class BybitPublicConnector(PublicConnector):
         else:
             raise ValueError(f"Unsupported BybitAccountType.{self._account_type.value}")
 
-    def _ws_msg_handler(self, raw: bytes):
+    def _ws_msg_handler(self, raw: memoryview):
+        # `raw` is a view over the websocket frame, msgspec decodes it without copying
         try:
-            ws_msg: BybitWsMessageGeneral = self._ws_msg_general_decoder.decode(raw)
-            if ws_msg.ret_msg == "pong":
-                self._ws_client._transport.notify_user_specific_pong_received()
-                self._log.debug(f"Pong received {str(ws_msg)}")
-                return
-            if ws_msg.success is False:
-                self._log.error(f"WebSocket error: {ws_msg}")
-                return
-
-            if "orderbook" in ws_msg.topic:
-                self._handle_orderbook(raw, ws_msg.topic)
-            elif "publicTrade" in ws_msg.topic:
+            # push messages start with the topic, route on it so every frame is decoded only once
+            topic = peek_str_field(raw, b'{"topic":"')
+            if topic is None:
+                self._handle_general_msg(raw)
+            elif topic.startswith(b"orderbook"):
+                self._handle_orderbook(raw, topic.decode())
+            elif topic.startswith(b"publicTrade"):
                 self._handle_trade(raw)
-            elif "kline" in ws_msg.topic:
+            elif topic.startswith(b"kline"):
                 self._handle_kline(raw)
-
         except msgspec.DecodeError:
-            self._log.error(f"Error decoding message: {str(raw)}")
+            self._log.error(f"Error decoding message: {bytes(raw)}")
+
+    def _handle_general_msg(self, raw: memoryview):
+        ws_msg: BybitWsMessageGeneral = self._ws_msg_general_decoder.decode(raw)
+        if ws_msg.ret_msg == "pong":
+            self._ws_client._transport.notify_user_specific_pong_received()
+            self._log.debug(f"Pong received {str(ws_msg)}")
+            return
+        if ws_msg.success is False:
+            self._log.error(f"WebSocket error: {ws_msg}")
+            return
+
+        if "orderbook" in ws_msg.topic:
+            self._handle_orderbook(raw, ws_msg.topic)
+        elif "publicTrade" in ws_msg.topic:
+            self._handle_trade(raw)
+        elif "kline" in ws_msg.topic:
+            self._handle_kline(raw)
 
     def _handle_kline(self, raw: bytes):
         msg: BybitWsKlineMsg = self._ws_msg_kline_decoder.decode(raw)
@@ -129,7 +148,7 @@ class BybitPublicConnector(PublicConnector):
                 confirm=d.confirm,
                 timestamp=msg.ts,
             )
-            self._msgbus.publish(topic="kline", msg=kline)
+            self._msgbus.publish(topic=f"kline.{kline.interval.value}.{kline.symbol}", msg=kline)
 
     def _handle_trade(self, raw: bytes):
         msg: BybitWsTradeMsg = self._ws_msg_trade_decoder.decode(raw)
@@ -143,31 +162,29 @@ class BybitPublicConnector(PublicConnector):
                 size=float(d.v),
                 timestamp=msg.ts,
             )
-            self._msgbus.publish(topic="trade", msg=trade)
+            self._msgbus.publish(topic=f"trade.{trade.symbol}", msg=trade)
 
     def _handle_orderbook(self, raw: bytes, topic: str):
         msg: BybitWsOrderbookDepthMsg = self._ws_msg_orderbook_decoder.decode(raw)
         id = msg.data.s + self.market_type
         symbol = self._market_id[id]
-        res = self._orderbook[symbol].parse_orderbook_depth(msg, levels=1)
 
-        bid, bid_size = (
-            (res["bids"][0][0], res["bids"][0][1]) if res["bids"] else (0, 0)
-        )
-        ask, ask_size = (
-            (res["asks"][0][0], res["asks"][0][1]) if res["asks"] else (0, 0)
-        )
+        # books are kept per topic, `orderbook.1` feeds bookl1 and deeper feeds bookl2
+        book = self._orderbook.get(topic)
+        if book is None:
+            book = OrderBook(exchange=self._exchange_id, symbol=symbol)
+            self._orderbook[topic] = book
 
-        bookl1 = BookL1(
-            exchange=self._exchange_id,
-            symbol=symbol,
-            timestamp=msg.ts,
-            bid=bid,
-            bid_size=bid_size,
-            ask=ask,
-            ask_size=ask_size,
-        )
-        self._msgbus.publish(topic="bookl1", msg=bookl1)
+        if msg.type == "snapshot":
+            book.apply_snapshot(msg.data.b, msg.data.a, msg.ts, msg.data.u)
+        elif msg.type == "delta":
+            book.apply_delta(msg.data.b, msg.data.a, msg.ts, msg.data.u)
+
+        depth = self._bookl2_depth.get(topic)
+        if depth is None:
+            self._msgbus.publish(topic=f"bookl1.{symbol}", msg=book.to_bookl1())
+        else:
+            self._msgbus.publish(topic=f"bookl2.{symbol}", msg=book.to_bookl2(depth))
 
     def request_klines(
         self,
@@ -220,6 +237,25 @@ class BybitPublicConnector(PublicConnector):
         interval = BybitEnumParser.to_bybit_kline_interval(interval)
         await self._ws_client.subscribe_kline(symbols, interval)
 
+    async def subscribe_bookl2(self, symbol: str | List[str], depth: int):
+        if isinstance(symbol, str):
+            symbol = [symbol]
+
+        # bybit only pushes fixed depths, use the smallest feed covering `depth`
+        feed_depths = (50, 200) if self._account_type.is_spot else (50, 200, 500)
+        feed_depth = next((d for d in feed_depths if d >= depth), feed_depths[-1])
+
+        symbols = []
+        for s in symbol:
+            market = self._market.get(s)
+            if not market:
+                raise ValueError(f"Symbol {s} formated wrongly, or not supported")
+            symbols.append(market.id)
+            topic = f"orderbook.{feed_depth}.{market.id}"
+            self._bookl2_depth[topic] = max(self._bookl2_depth.get(topic, 0), depth)
+
+        await self._ws_client.subscribe_order_book(symbols, depth=feed_depth)
+
 
 class BybitPrivateConnector(PrivateConnector):
     _ws_client: BybitWSClient
@@ -236,6 +272,11 @@ class BybitPrivateConnector(PrivateConnector):
         msgbus: MessageBus,
         task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        ws_order_entry: bool = False,
+        http_pool_size: int = 10,
+        http_keepalive_timeout: float = 60,
+        http_warmup_interval: float | None = 30,
+        http_transport: HttpTransportType = HttpTransportType.AIOHTTP,
     ):
         # all the private endpoints are the same for all account types, so no need to pass account_type
         # only need to determine if it's testnet or not
@@ -267,10 +308,23 @@ class BybitPrivateConnector(PrivateConnector):
                 api_key=exchange.api_key,
                 secret=exchange.secret,
                 testnet=account_type.is_testnet,
+                pool_size=http_pool_size,
+                keepalive_timeout=http_keepalive_timeout,
+                warmup_interval=http_warmup_interval,
+                transport=http_transport,
             ),
             msgbus=msgbus,
             cache=cache,
+            task_manager=task_manager,
             rate_limit=rate_limit,
+            ws_api_client=BybitWSApiClient(
+                account_type=account_type,
+                api_key=exchange.api_key,
+                secret=exchange.secret,
+                task_manager=task_manager,
+            )
+            if ws_order_entry
+            else None,
         )
 
         self._ws_msg_general_decoder = msgspec.json.Decoder(BybitWsMessageGeneral)
@@ -331,7 +385,10 @@ class BybitPrivateConnector(PrivateConnector):
                 **kwargs,
             }
 
-            res = await self._api_client.post_v5_order_cancel(**params)
+            res = await self._order_request(
+                lambda: self._ws_api_client.cancel_order(**params),
+                lambda: self._api_client.post_v5_order_cancel(**params),
+            )
             order = Order(
                 exchange=self._exchange_id,
                 id=res.result.orderId,
@@ -499,7 +556,10 @@ class BybitPrivateConnector(PrivateConnector):
         params.update(kwargs)
 
         try:
-            res = await self._api_client.post_v5_order_create(**params)
+            res = await self._order_request(
+                lambda: self._ws_api_client.create_order(**params),
+                lambda: self._api_client.post_v5_order_create(**params),
+            )
 
             order = Order(
                 exchange=self._exchange_id,
@@ -538,6 +598,199 @@ class BybitPrivateConnector(PrivateConnector):
             )
             return order
 
+    def _get_batch_order_request(
+        self, market: BybitMarket, order: BatchOrder
+    ) -> Dict[str, Any]:
+        request = {
+            "symbol": market.id,
+            "side": BybitEnumParser.to_bybit_order_side(order.side).value,
+            "orderType": BybitEnumParser.to_bybit_order_type(order.type).value,
+            "qty": str(order.amount),
+        }
+
+        if order.type == OrderType.LIMIT:
+            if not order.price:
+                raise ValueError("Price is required for limit order")
+            request["price"] = str(order.price)
+            request["timeInForce"] = BybitEnumParser.to_bybit_time_in_force(
+                order.time_in_force
+            ).value
+
+        if order.position_side:
+            request["positionSide"] = BybitEnumParser.to_bybit_position_side(
+                order.position_side
+            ).value
+
+        kwargs = dict(order.kwargs)
+        reduce_only = kwargs.pop("reduceOnly", False) or kwargs.pop(
+            "reduce_only", False
+        )
+        if reduce_only:
+            request["reduceOnly"] = True
+        request.update(kwargs)
+        return request
+
+    async def create_orders(self, orders: List[BatchOrder]) -> List[Order]:
+        # one batch request only takes orders of a single category
+        batches: Dict[str, List[int]] = defaultdict(list)
+        for idx, order in enumerate(orders):
+            market = self._market.get(order.symbol)
+            if not market:
+                raise ValueError(
+                    f"Symbol {order.symbol} formated wrongly, or not supported"
+                )
+            batches[self._get_category(market)].append(idx)
+
+        results: List[Order | None] = [None] * len(orders)
+        tasks = []
+        for category, idxs in batches.items():
+            size = BYBIT_MAX_BATCH_ORDERS[category]
+            for i in range(0, len(idxs), size):
+                tasks.append(
+                    self._create_orders_batch(
+                        category, idxs[i : i + size], orders, results
+                    )
+                )
+        await asyncio.gather(*tasks)
+        return results
+
+    async def _create_orders_batch(
+        self,
+        category: str,
+        idxs: List[int],
+        orders: List[BatchOrder],
+        results: List[Order | None],
+    ):
+        if self._limiter:
+            await self._limiter.acquire()
+
+        request = [
+            self._get_batch_order_request(self._market[orders[idx].symbol], orders[idx])
+            for idx in idxs
+        ]
+
+        try:
+            res: BybitBatchOrderResponse = (
+                await self._api_client.post_v5_order_create_batch(category, request)
+            )
+            items = zip(res.result.list, res.retExtInfo.list)
+        except Exception as e:
+            error_msg = f"{e.__class__.__name__}: {str(e)}"
+            self._log.error(
+                f"Error creating batch orders: {error_msg} params: {str(request)}"
+            )
+            res = None
+            items = [(None, None)] * len(idxs)
+
+        for idx, params, (result, ext_info) in zip(idxs, request, items):
+            order = orders[idx]
+            if result is not None and ext_info.code == 0:
+                results[idx] = Order(
+                    exchange=self._exchange_id,
+                    id=result.orderId,
+                    client_order_id=result.orderLinkId,
+                    timestamp=int(result.createAt) if result.createAt else res.time,
+                    symbol=order.symbol,
+                    type=order.type,
+                    side=order.side,
+                    amount=order.amount,
+                    price=float(order.price) if order.price else None,
+                    time_in_force=order.time_in_force,
+                    position_side=order.position_side,
+                    status=OrderStatus.PENDING,
+                    filled=Decimal(0),
+                    remaining=order.amount,
+                    reduce_only=params.get("reduceOnly", False),
+                )
+            else:
+                if ext_info is not None:
+                    self._log.error(
+                        f"Error creating order: {ext_info.code} {ext_info.msg} params: {str(params)}"
+                    )
+                results[idx] = Order(
+                    exchange=self._exchange_id,
+                    timestamp=self._clock.timestamp_ms(),
+                    symbol=order.symbol,
+                    type=order.type,
+                    side=order.side,
+                    amount=order.amount,
+                    price=float(order.price) if order.price else None,
+                    time_in_force=order.time_in_force,
+                    position_side=order.position_side,
+                    status=OrderStatus.FAILED,
+                    filled=Decimal(0),
+                    remaining=order.amount,
+                )
+
+    async def cancel_orders(self, symbol: str, order_ids: List[str], **kwargs):
+        market = self._market.get(symbol)
+        if not market:
+            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+        category = self._get_category(market)
+        size = BYBIT_MAX_BATCH_ORDERS[category]
+
+        results = await asyncio.gather(
+            *(
+                self._cancel_orders_batch(
+                    market, category, order_ids[i : i + size], **kwargs
+                )
+                for i in range(0, len(order_ids), size)
+            )
+        )
+        return [order for batch in results for order in batch]
+
+    async def _cancel_orders_batch(
+        self, market: BybitMarket, category: str, order_ids: List[str], **kwargs
+    ) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+
+        request = [
+            {"symbol": market.id, "orderId": order_id, **kwargs}
+            for order_id in order_ids
+        ]
+        try:
+            res: BybitBatchOrderResponse = (
+                await self._api_client.post_v5_order_cancel_batch(category, request)
+            )
+            items = zip(res.result.list, res.retExtInfo.list)
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error canceling batch orders: {error_msg} params: {str(request)}"
+            )
+            res = None
+            items = [(None, None)] * len(order_ids)
+
+        orders = []
+        for order_id, (result, ext_info) in zip(order_ids, items):
+            if result is not None and ext_info.code == 0:
+                orders.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        id=result.orderId,
+                        client_order_id=result.orderLinkId,
+                        timestamp=res.time,
+                        symbol=market.symbol,
+                        status=OrderStatus.CANCELING,
+                    )
+                )
+            else:
+                if ext_info is not None:
+                    self._log.error(
+                        f"Error canceling order: {ext_info.code} {ext_info.msg} order_id: {order_id}"
+                    )
+                orders.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=market.symbol,
+                        id=order_id,
+                        status=OrderStatus.CANCEL_FAILED,
+                    )
+                )
+        return orders
+
     def _parse_order_update(self, raw: bytes):
         order_msg = self._ws_msg_order_update_decoder.decode(raw)
         self._log.debug(f"Order update: {str(order_msg)}")
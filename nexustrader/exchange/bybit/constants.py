@@ -65,6 +65,12 @@ class BybitAccountType(AccountType):
             return "wss://stream-testnet.bybit.com/v5/private"
         return "wss://stream.bybit.com/v5/private"
 
+    @property
+    def ws_trade_url(self):
+        if self.is_testnet:
+            return "wss://stream-testnet.bybit.com/v5/trade"
+        return "wss://stream.bybit.com/v5/trade"
+
     @property
     def is_spot(self):
         return self in {self.SPOT, self.SPOT_TESTNET}
@@ -95,6 +101,13 @@ class BybitAccountType(AccountType):
         
 
 
+# max orders per create-batch / cancel-batch request by category
+BYBIT_MAX_BATCH_ORDERS = {
+    "spot": 10,
+    "linear": 20,
+    "inverse": 20,
+}
+
 WS_PUBLIC_URL = {
     BybitAccountType.SPOT: "wss://stream.bybit.com/v5/public/spot",
     BybitAccountType.LINEAR: "wss://stream.bybit.com/v5/public/linear",
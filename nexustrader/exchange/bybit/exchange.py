@@ -9,16 +9,17 @@ class BybitExchangeManager(ExchangeManager):
     api: ccxt.bybit
     market = Dict[str, BybitMarket]
     market_id = Dict[str, str]
+    market_type = BybitMarket
     
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, **kwargs):
         config = config or {}
         config["exchange_id"] = config.get("exchange_id", "bybit")
-        super().__init__(config)
+        super().__init__(config, **kwargs)
     
-    def load_markets(self):
-        market = self.api.load_markets()
-        for symbol, mkt in market.items():
+    def _parse_markets(self, markets: Dict[str, Any]):
+        market, market_id = {}, {}
+        for symbol, mkt in markets.items():
             try:
                 
                 mkt_json = orjson.dumps(mkt)
@@ -26,14 +27,15 @@ class BybitExchangeManager(ExchangeManager):
                 if (mkt.spot or mkt.linear or mkt.inverse or mkt.future) and not mkt.option:
                     symbol = self._parse_symbol(mkt, exchange_suffix="BYBIT")
                     mkt.symbol = symbol
-                    self.market[symbol] = mkt
+                    market[symbol] = mkt
                     if mkt.type.value == "spot":
-                        self.market_id[f"{mkt.id}_spot"] = symbol
+                        market_id[f"{mkt.id}_spot"] = symbol
                     elif mkt.linear:
-                        self.market_id[f"{mkt.id}_linear"] = symbol
+                        market_id[f"{mkt.id}_linear"] = symbol
                     elif mkt.inverse:
-                        self.market_id[f"{mkt.id}_inverse"] = symbol
+                        market_id[f"{mkt.id}_inverse"] = symbol
                 
             except Exception as e:
                 print(f"Error: {e}, {symbol}, {mkt}")
                 continue
+        return market, market_id
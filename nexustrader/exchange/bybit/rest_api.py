@@ -1,20 +1,20 @@
 import hmac
 import hashlib
-import aiohttp
 import asyncio
 import msgspec
 import orjson
 from typing import Any, Dict, List
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urljoin
 from decimal import Decimal
 
 from nexustrader.base import ApiClient
+from nexustrader.base.api_client import encode_query
 from nexustrader.exchange.bybit.constants import BybitBaseUrl
 from nexustrader.exchange.bybit.error import BybitError
-from nexustrader.core.nautilius_core import hmac_signature
 from nexustrader.exchange.bybit.schema import (
     BybitResponse,
     BybitOrderResponse,
+    BybitBatchOrderResponse,
     BybitPositionResponse,
     BybitOrderHistoryResponse,
     BybitOpenOrdersResponse,
@@ -29,6 +29,7 @@ class BybitApiClient(ApiClient):
         secret: str = None,
         timeout: int = 10,
         testnet: bool = False,
+        **kwargs,
     ):
         """
         ### Testnet:
@@ -50,6 +51,7 @@ class BybitApiClient(ApiClient):
             api_key=api_key,
             secret=secret,
             timeout=timeout,
+            **kwargs,
         )
         self._recv_window = 5000
 
@@ -57,6 +59,7 @@ class BybitApiClient(ApiClient):
             self._base_url = BybitBaseUrl.TESTNET.base_url
         else:
             self._base_url = BybitBaseUrl.MAINNET_1.base_url
+        self._warmup_urls.append(urljoin(self._base_url, "/v5/market/time"))
 
         self._headers = {
             "Content-Type": "application/json",
@@ -65,9 +68,18 @@ class BybitApiClient(ApiClient):
 
         if api_key:
             self._headers["X-BAPI-API-KEY"] = api_key
+        # the parts of a signed request that never change
+        self._sign_prefix = f"{api_key}{self._recv_window}"
+        self._signed_headers = {
+            **self._headers,
+            "X-BAPI-RECV-WINDOW": str(self._recv_window),
+        }
 
         self._response_decoder = msgspec.json.Decoder(BybitResponse)
         self._order_response_decoder = msgspec.json.Decoder(BybitOrderResponse)
+        self._batch_order_response_decoder = msgspec.json.Decoder(
+            BybitBatchOrderResponse
+        )
         self._position_response_decoder = msgspec.json.Decoder(BybitPositionResponse)
         self._order_history_response_decoder = msgspec.json.Decoder(
             BybitOrderHistoryResponse
@@ -91,8 +103,7 @@ class BybitApiClient(ApiClient):
 
     def _generate_signature_v2(self, payload: str) -> List[str]:
         timestamp = str(self._clock.timestamp_ms())
-        param = f"{timestamp}{self._api_key}{self._recv_window}{payload}"
-        signature = hmac_signature(self._secret, param)  # return hex digest string
+        signature = self._signer.hexdigest(f"{timestamp}{self._sign_prefix}{payload}")
         return [signature, timestamp]
 
     async def _fetch(
@@ -105,11 +116,11 @@ class BybitApiClient(ApiClient):
     ):
         self._init_session()
 
-        url = urljoin(base_url, endpoint)
+        url = self._url(base_url, endpoint)
         payload = payload or {}
 
         payload_str = (
-            urlencode(payload)
+            encode_query(payload)
             if method == "GET"
             else orjson.dumps(payload).decode("utf-8")
         )
@@ -118,25 +129,26 @@ class BybitApiClient(ApiClient):
         if signed:
             signature, timestamp = self._generate_signature_v2(payload_str)
             headers = {
-                **headers,
+                **self._signed_headers,
                 "X-BAPI-TIMESTAMP": timestamp,
                 "X-BAPI-SIGN": signature,
-                "X-BAPI-RECV-WINDOW": str(self._recv_window),
             }
 
         if method == "GET":
-            url += f"?{payload_str}"
+            if payload_str:
+                url += "?" + payload_str
             payload_str = None
 
         try:
-            self._log.debug(f"Request: {url} {payload_str}")
-            response = await self._session.request(
+            if self._log_debug:
+                self._log.debug(f"Request: {url} {payload_str}")
+            response = await self._transport.request(
                 method=method,
                 url=url,
                 headers=headers,
                 data=payload_str,
             )
-            raw = await response.read()
+            raw = response.body
             if response.status >= 400:
                 raise BybitError(
                     code=response.status,
@@ -150,7 +162,7 @@ class BybitApiClient(ApiClient):
                     code=bybit_response.retCode,
                     message=bybit_response.retMsg,
                 )
-        except aiohttp.ClientError as e:
+        except ConnectionError as e:
             self._log.error(f"Client Error {method} Url: {url} {e}")
             raise
         except asyncio.TimeoutError:
@@ -199,6 +211,34 @@ class BybitApiClient(ApiClient):
         raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
         return self._order_response_decoder.decode(raw)
 
+    async def post_v5_order_create_batch(
+        self, category: str, request: List[Dict[str, Any]]
+    ) -> BybitBatchOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-place
+        """
+        endpoint = "/v5/order/create-batch"
+        payload = {
+            "category": category,
+            "request": request,
+        }
+        raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
+        return self._batch_order_response_decoder.decode(raw)
+
+    async def post_v5_order_cancel_batch(
+        self, category: str, request: List[Dict[str, Any]]
+    ) -> BybitBatchOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-cancel
+        """
+        endpoint = "/v5/order/cancel-batch"
+        payload = {
+            "category": category,
+            "request": request,
+        }
+        raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
+        return self._batch_order_response_decoder.decode(raw)
+
     async def get_v5_position_list(
         self, category: str, **kwargs
     ) -> BybitPositionResponse:
@@ -96,6 +96,63 @@ class BybitOrderResponse(msgspec.Struct):
     result: BybitOrderResult
     time: int
 
+
+class BybitWsApiResponse(msgspec.Struct):
+    """
+    Message of the `/v5/trade` stream, `data` is left undecoded since its type
+    depends on `op`
+
+    {
+        "reqId": "1",
+        "retCode": 0,
+        "retMsg": "OK",
+        "op": "order.create",
+        "data": {"orderId": "...", "orderLinkId": "..."},
+        "header": {"Timenow": "1709...", ...},
+        "connId": "..."
+    }
+    """
+
+    op: str
+    retCode: int = 0
+    retMsg: str = ""
+    reqId: str | None = None
+    data: msgspec.Raw | None = None
+    header: Dict[str, str] | None = None
+
+
+class BybitBatchOrderResult(msgspec.Struct):
+    symbol: str
+    orderId: str  # empty when the order was rejected
+    orderLinkId: str
+    createAt: str | None = None  # create-batch only
+
+
+class BybitBatchOrderResultList(msgspec.Struct):
+    list: List[BybitBatchOrderResult]
+
+
+class BybitBatchOrderExtInfo(msgspec.Struct):
+    code: int
+    msg: str
+
+
+class BybitBatchOrderExtInfoList(msgspec.Struct):
+    list: List[BybitBatchOrderExtInfo]
+
+
+class BybitBatchOrderResponse(msgspec.Struct):
+    """
+    `result.list` and `retExtInfo.list` are in the request order,
+    a code other than 0 in `retExtInfo` means that order failed
+    """
+
+    retCode: int
+    retMsg: str
+    result: BybitBatchOrderResultList
+    retExtInfo: BybitBatchOrderExtInfoList
+    time: int
+
 class BybitPositionStruct(msgspec.Struct):
     positionIdx: int
     riskId: int
@@ -188,50 +245,6 @@ class BybitWsOrderbookDepthMsg(msgspec.Struct):
     data: BybitWsOrderbookDepth
 
 
-class BybitOrderBook(msgspec.Struct):
-    bids: Dict[float, float] = {}
-    asks: Dict[float, float] = {}
-
-    def parse_orderbook_depth(self, msg: BybitWsOrderbookDepthMsg, levels: int = 1):
-        if msg.type == "snapshot":
-            self._handle_snapshot(msg.data)
-        elif msg.type == "delta":
-            self._handle_delta(msg.data)
-        return self._get_orderbook(levels)
-
-    def _handle_snapshot(self, data: BybitWsOrderbookDepth) -> None:
-        if data.b:
-            self.bids.clear()
-        if data.a:
-            self.asks.clear()
-
-        for price, size in data.b:
-            self.bids[float(price)] = float(size)
-
-        for price, size in data.a:
-            self.asks[float(price)] = float(size)
-
-    def _handle_delta(self, data: BybitWsOrderbookDepth) -> None:
-        for price, size in data.b:
-            if float(size) == 0:
-                self.bids.pop(float(price))
-            else:
-                self.bids[float(price)] = float(size)
-
-        for price, size in data.a:
-            if float(size) == 0:
-                self.asks.pop(float(price))
-            else:
-                self.asks[float(price)] = float(size)
-
-    def _get_orderbook(self, levels: int):
-        bids = sorted(self.bids.items(), reverse=True)[:levels]  # bids descending
-        asks = sorted(self.asks.items())[:levels]  # asks ascending
-        return {
-            "bids": bids,
-            "asks": asks,
-        }
-        
 class BybitWsTrade(msgspec.Struct):
     # The timestamp (ms) that the order is filled
     T: int
@@ -351,15 +364,15 @@ class BybitLeverageFilter(msgspec.Struct):
 
 
 class BybitMarketInfo(msgspec.Struct):
-    symbol: str = None
-    baseCoin: str = None
-    quoteCoin: str = None
-    innovation: str = None
-    status: str = None
-    marginTrading: str = None
-    lotSizeFilter: BybitLotSizeFilter = None
-    priceFilter: BybitPriceFilter = None
-    riskParameters: BybitRiskParameters = None
+    symbol: str | None = None
+    baseCoin: str | None = None
+    quoteCoin: str | None = None
+    innovation: str | None = None
+    status: str | None = None
+    marginTrading: str | None = None
+    lotSizeFilter: BybitLotSizeFilter | None = None
+    priceFilter: BybitPriceFilter | None = None
+    riskParameters: BybitRiskParameters | None = None
     settleCoin: str | None = None
     optionsType: str | None = None
     launchTime: str | None = None
@@ -367,7 +380,7 @@ class BybitMarketInfo(msgspec.Struct):
     deliveryFeeRate: str | None = None
     contractType: str | None = None
     priceScale: str | None = None
-    leverageFilter: BybitLeverageFilter = None
+    leverageFilter: BybitLeverageFilter | None = None
     unifiedMarginTrade: bool | None = None
     fundingInterval: str | int | None = None
     copyTrading: str | None = None
@@ -1,13 +1,30 @@
 import hmac
 import orjson
+import msgspec
 import asyncio
 
-from typing import Any, Callable, List
+from decimal import Decimal
+from typing import Any, Callable, List, Tuple
 from aiolimiter import AsyncLimiter
 
 from nexustrader.base import WSClient
+from nexustrader.error import WSNotConnectedError
 from nexustrader.core.entity import TaskManager
 from nexustrader.exchange.bybit.constants import BybitAccountType, BybitKlineInterval
+from nexustrader.exchange.bybit.error import BybitError
+from nexustrader.exchange.bybit.schema import (
+    BybitWsApiResponse,
+    BybitOrderResponse,
+    BybitOrderResult,
+)
+
+
+def generate_auth_signature(secret: str, expires: int) -> str:
+    return hmac.new(
+        bytes(secret, "utf-8"),
+        bytes(f"GET/realtime{expires}", "utf-8"),
+        digestmod="sha256",
+    ).hexdigest()
 
 
 class BybitWSClient(WSClient):
@@ -18,6 +35,7 @@ class BybitWSClient(WSClient):
         task_manager: TaskManager,
         api_key: str = None,
         secret: str = None,
+        zero_copy: bool = False,
     ):
         self._account_type = account_type
         self._api_key = api_key
@@ -37,6 +55,7 @@ class BybitWSClient(WSClient):
             ping_reply_timeout=2,
             specific_ping_msg=orjson.dumps({"op": "ping"}),
             auto_ping_strategy="ping_when_idle",
+            zero_copy=zero_copy,
         )
 
     @property
@@ -45,13 +64,7 @@ class BybitWSClient(WSClient):
 
     def _generate_signature(self):
         expires = self._clock.timestamp_ms() + 1_000
-        signature = str(
-            hmac.new(
-                bytes(self._secret, "utf-8"),
-                bytes(f"GET/realtime{expires}", "utf-8"),
-                digestmod="sha256",
-            ).hexdigest()
-        )
+        signature = generate_auth_signature(self._secret, expires)
         return signature, expires
 
     def _get_auth_payload(self):
@@ -127,3 +140,123 @@ class BybitWSClient(WSClient):
     async def subscribe_wallet(self, topic: str = "wallet"):
         """subscribe to wallet"""
         await self._subscribe([topic], auth=True)
+
+
+class BybitWSApiClient(WSClient):
+    """Order entry over the Bybit `/v5/trade` stream.
+
+    Each request carries a `reqId` which the response echoes back, orders are
+    only sent once the connection is authenticated.
+    """
+
+    def __init__(
+        self,
+        account_type: BybitAccountType,
+        api_key: str,
+        secret: str,
+        task_manager: TaskManager,
+        timeout: int = 5,
+    ):
+        self._account_type = account_type
+        self._api_key = api_key
+        self._secret = secret
+        self._timeout = timeout
+        self._authed = False
+        self._response_decoder = msgspec.json.Decoder(BybitWsApiResponse)
+        self._order_result_decoder = msgspec.json.Decoder(BybitOrderResult)
+        super().__init__(
+            account_type.ws_trade_url,
+            limiter=AsyncLimiter(max_rate=20, time_period=1),
+            handler=self._ws_msg_handler,
+            task_manager=task_manager,
+            ping_idle_timeout=5,
+            ping_reply_timeout=2,
+            specific_ping_msg=orjson.dumps({"op": "ping"}),
+            auto_ping_strategy="ping_when_idle",
+        )
+
+    def _ws_msg_handler(self, raw: bytes):
+        try:
+            msg = self._response_decoder.decode(raw)
+        except msgspec.DecodeError:
+            self._log.error(f"Error decoding message: {str(raw)}")
+            return
+        if msg.op == "pong":
+            self._transport.notify_user_specific_pong_received()
+            return
+        # the auth response is matched by its op
+        if not self._resolve_request(msg.reqId or msg.op, msg):
+            self._log.warn(f"Response to unknown request: {str(raw)}")
+
+    def _generate_signature(self) -> Tuple[str, int]:
+        expires = self._clock.timestamp_ms() + 1_000
+        return generate_auth_signature(self._secret, expires), expires
+
+    async def _auth(self):
+        self._authed = False
+        signature, expires = self._generate_signature()
+        payload = {"reqId": "auth", "op": "auth", "args": [self._api_key, expires, signature]}
+        msg: BybitWsApiResponse = await self._request("auth", payload, self._timeout)
+        if msg.retCode != 0:
+            raise BybitError(code=msg.retCode, message=msg.retMsg)
+        self._authed = True
+
+    async def connect(self):
+        if not self.connected:
+            await super().connect()
+            await self._auth()
+
+    def disconnect(self):
+        self._authed = False
+        super().disconnect()
+
+    async def _submit(self, op: str, args: dict) -> BybitOrderResponse:
+        if not self._authed:
+            raise WSNotConnectedError(f"{self._url} is not authenticated")
+        req_id = self._next_request_id()
+        payload = {
+            "reqId": req_id,
+            "header": {"X-BAPI-TIMESTAMP": str(self._clock.timestamp_ms())},
+            "op": op,
+            "args": [args],
+        }
+        msg: BybitWsApiResponse = await self._request(req_id, payload, self._timeout)
+        if msg.retCode != 0:
+            raise BybitError(code=msg.retCode, message=msg.retMsg)
+        timestamp = int(msg.header["Timenow"]) if msg.header else self._clock.timestamp_ms()
+        return BybitOrderResponse(
+            retCode=msg.retCode,
+            retMsg=msg.retMsg,
+            result=self._order_result_decoder.decode(msg.data),
+            time=timestamp,
+        )
+
+    async def create_order(
+        self,
+        category: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: Decimal,
+        **kwargs,
+    ) -> BybitOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/websocket/trade/guideline
+        """
+        args = {
+            "category": category,
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "qty": str(qty),
+            **kwargs,
+        }
+        return await self._submit("order.create", args)
+
+    async def cancel_order(self, category: str, symbol: str, **kwargs) -> BybitOrderResponse:
+        args = {"category": category, "symbol": symbol, **kwargs}
+        return await self._submit("order.cancel", args)
+
+    async def _resubscribe(self):
+        await self._auth()
+
@@ -1,8 +1,24 @@
+import importlib
 from nexustrader.exchange.okx.constants import OkxAccountType
-from nexustrader.exchange.okx.exchange import OkxExchangeManager
-from nexustrader.exchange.okx.connector import OkxPublicConnector, OkxPrivateConnector
-from nexustrader.exchange.okx.ems import OkxExecutionManagementSystem
-from nexustrader.exchange.okx.oms import OkxOrderManagementSystem
+
+# the connectors pull in ccxt, aiohttp, picows and nautilus, they are only
+# imported when first used so loading the account types stays cheap
+_LAZY_IMPORTS = {
+    "OkxExchangeManager": "nexustrader.exchange.okx.exchange",
+    "OkxPublicConnector": "nexustrader.exchange.okx.connector",
+    "OkxPrivateConnector": "nexustrader.exchange.okx.connector",
+    "OkxExecutionManagementSystem": "nexustrader.exchange.okx.ems",
+    "OkxOrderManagementSystem": "nexustrader.exchange.okx.oms",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "OkxAccountType",
@@ -1,15 +1,18 @@
+import asyncio
 import msgspec
 import sys
-from typing import Dict, List
+from typing import Any, Dict, List
 from decimal import Decimal
 from nexustrader.exchange.okx import OkxAccountType
 from nexustrader.exchange.okx.websockets import OkxWSClient
 from nexustrader.exchange.okx.exchange import OkxExchangeManager
 from nexustrader.exchange.okx.schema import OkxWsGeneralMsg
-from nexustrader.schema import Trade, BookL1, Kline, Order, Position
+from nexustrader.schema import Trade, BookL1, Kline, Order, Position, BatchOrder
 from nexustrader.exchange.okx.schema import (
     OkxMarket,
     OkxWsBboTbtMsg,
+    OkxWsBooksMsg,
+    OkxOrderBook,
     OkxWsCandleMsg,
     OkxWsTradeMsg,
     OkxWsOrderMsg,
@@ -26,14 +29,17 @@ from nexustrader.constants import (
     PositionSide,
     KlineInterval,
     TriggerType,
+    HttpTransportType,
 )
 from nexustrader.base import PublicConnector, PrivateConnector
+from nexustrader.base.ws_client import peek_str_field
 from nexustrader.core.nautilius_core import MessageBus
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.entity import TaskManager, RateLimit
 from nexustrader.exchange.okx.rest_api import OkxApiClient
 from nexustrader.constants import OrderSide, OrderType
 from nexustrader.exchange.okx.constants import (
+    OKX_MAX_BATCH_ORDERS,
     OkxTdMode,
     OkxEnumParser,
     OkxKlineInterval,
@@ -62,6 +68,7 @@ class OkxPublicConnector(PublicConnector):
                 account_type=account_type,
                 handler=self._ws_msg_handler,
                 task_manager=task_manager,
+                zero_copy=True,
             ),
             msgbus=msgbus,
             api_client=OkxApiClient(
@@ -75,11 +82,15 @@ class OkxPublicConnector(PublicConnector):
             handler=self._business_ws_msg_handler,
             task_manager=task_manager,
             business_url=True,
+            zero_copy=True,
         )
         self._ws_msg_general_decoder = msgspec.json.Decoder(OkxWsGeneralMsg)
         self._ws_msg_bbo_tbt_decoder = msgspec.json.Decoder(OkxWsBboTbtMsg)
         self._ws_msg_candle_decoder = msgspec.json.Decoder(OkxWsCandleMsg)
         self._ws_msg_trade_decoder = msgspec.json.Decoder(OkxWsTradeMsg)
+        self._ws_msg_books_decoder = msgspec.json.Decoder(OkxWsBooksMsg)
+        self._orderbook: Dict[str, OkxOrderBook] = {}
+        self._bookl2_depth: Dict[str, int] = {}
 
     async def _request_klines(
         self,
@@ -187,41 +198,78 @@ class OkxPublicConnector(PublicConnector):
         interval = OkxEnumParser.to_okx_kline_interval(interval)
         await self._business_ws_client.subscribe_candlesticks(symbols, interval)
 
-    def _business_ws_msg_handler(self, raw: bytes):
+    async def subscribe_bookl2(self, symbol: str | List[str], depth: int):
+        if isinstance(symbol, str):
+            symbol = [symbol]
+
+        # `books5` pushes 5 level snapshots, `books` is 400 levels of incremental updates
+        channel = "books5" if depth <= 5 else "books"
+
+        symbols = []
+        for s in symbol:
+            market = self._market.get(s)
+            if not market:
+                raise ValueError(f"Symbol {s} not found in market")
+            key = f"{channel}.{market.id}"
+            if key not in self._orderbook:
+                self._orderbook[key] = OkxOrderBook(exchange=self._exchange_id, symbol=s)
+            self._bookl2_depth[key] = max(self._bookl2_depth.get(key, 0), depth)
+            symbols.append(market.id)
+
+        await self._ws_client.subscribe_order_book(symbols, channel=channel)
+
+    def _business_ws_msg_handler(self, raw: memoryview):
+        # `raw` is a view over the websocket frame, msgspec decodes it without copying
         if raw == b"pong":
             self._business_ws_client._transport.notify_user_specific_pong_received()
-            self._log.debug(f"Pong received:{str(raw)}")
+            self._log.debug("Pong received")
             return
         try:
-            ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
-            if ws_msg.is_event_msg:
-                self._handle_event_msg(ws_msg)
-            else:
-                channel: str = ws_msg.arg.channel
-                if channel.startswith("candle"):
-                    self._handle_kline(raw)
+            # push messages start with the channel, route on it so every frame is decoded only once
+            channel = peek_str_field(raw, b'{"arg":{"channel":"')
+            if channel is None:
+                self._handle_general_msg(raw)
+            elif channel.startswith(b"candle"):
+                self._handle_kline(raw)
         except msgspec.DecodeError:
-            self._log.error(f"Error decoding message: {str(raw)}")
+            self._log.error(f"Error decoding message: {bytes(raw)}")
 
-    def _ws_msg_handler(self, raw: bytes):
+    def _ws_msg_handler(self, raw: memoryview):
+        # `raw` is a view over the websocket frame, msgspec decodes it without copying
         if raw == b"pong":
             self._ws_client._transport.notify_user_specific_pong_received()
-            self._log.debug(f"Pong received:{str(raw)}")
+            self._log.debug("Pong received")
             return
         try:
-            ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
-            if ws_msg.is_event_msg:
-                self._handle_event_msg(ws_msg)
-            else:
-                channel: str = ws_msg.arg.channel
-                if channel == "bbo-tbt":
-                    self._handle_bbo_tbt(raw)
-                elif channel == "trades":
-                    self._handle_trade(raw)
-                elif channel.startswith("candle"):
-                    self._handle_kline(raw)
+            channel = peek_str_field(raw, b'{"arg":{"channel":"')
+            if channel is None:
+                self._handle_general_msg(raw)
+            elif channel == b"bbo-tbt":
+                self._handle_bbo_tbt(raw)
+            elif channel == b"trades":
+                self._handle_trade(raw)
+            elif channel == b"books" or channel == b"books5":
+                self._handle_books(raw)
+            elif channel.startswith(b"candle"):
+                self._handle_kline(raw)
         except msgspec.DecodeError:
-            self._log.error(f"Error decoding message: {str(raw)}")
+            self._log.error(f"Error decoding message: {bytes(raw)}")
+
+    def _handle_general_msg(self, raw: memoryview):
+        """Slow path for event messages and frames whose channel is not at the start of the payload"""
+        ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
+        if ws_msg.is_event_msg:
+            self._handle_event_msg(ws_msg)
+        else:
+            channel: str = ws_msg.arg.channel
+            if channel == "bbo-tbt":
+                self._handle_bbo_tbt(raw)
+            elif channel == "trades":
+                self._handle_trade(raw)
+            elif channel == "books" or channel == "books5":
+                self._handle_books(raw)
+            elif channel.startswith("candle"):
+                self._handle_kline(raw)
 
     def _handle_event_msg(self, ws_msg: OkxWsGeneralMsg):
         if ws_msg.event == "error":
@@ -253,7 +301,7 @@ class OkxPublicConnector(PublicConnector):
                 timestamp=self._clock.timestamp_ms(),
                 confirm=False if d[8] == "0" else True,
             )
-            self._msgbus.publish(topic="kline", msg=kline)
+            self._msgbus.publish(topic=f"kline.{kline.interval.value}.{kline.symbol}", msg=kline)
 
     def _handle_trade(self, raw: bytes):
         msg: OkxWsTradeMsg = self._ws_msg_trade_decoder.decode(raw)
@@ -267,7 +315,45 @@ class OkxPublicConnector(PublicConnector):
                 size=float(d.sz),
                 timestamp=int(d.ts),
             )
-            self._msgbus.publish(topic="trade", msg=trade)
+            self._msgbus.publish(topic=f"trade.{trade.symbol}", msg=trade)
+
+    def _handle_books(self, raw: bytes):
+        msg: OkxWsBooksMsg = self._ws_msg_books_decoder.decode(raw)
+        id = msg.arg.instId
+        key = f"{msg.arg.channel}.{id}"
+        book = self._orderbook.get(key)
+        if book is None:
+            return
+
+        for d in msg.data:
+            ts = int(d.ts)
+            if msg.action == "update":
+                if book.is_empty:
+                    # resubscribed, waiting for the new snapshot
+                    return
+                if d.prevSeqId is not None and d.prevSeqId != book.update_id:
+                    self._log.warn(f"Sequence gap in {key}, resubscribing...")
+                    self._resync_books(book, id, msg.arg.channel)
+                    return
+                book.apply_delta(d.bids, d.asks, ts, d.seqId)
+            else:
+                book.apply_snapshot(d.bids, d.asks, ts, d.seqId or 0)
+
+            if d.checksum is not None and book.checksum() != d.checksum:
+                self._log.warn(f"Checksum mismatch in {key}, resubscribing...")
+                self._resync_books(book, id, msg.arg.channel)
+                return
+
+            self._msgbus.publish(
+                topic=f"bookl2.{book.symbol}",
+                msg=book.to_bookl2(self._bookl2_depth[key]),
+            )
+
+    def _resync_books(self, book: OkxOrderBook, inst_id: str, channel: str):
+        book.clear()
+        self._task_manager.create_task(
+            self._ws_client.resubscribe_order_book(inst_id, channel)
+        )
 
     def _handle_bbo_tbt(self, raw: bytes):
         msg: OkxWsBboTbtMsg = self._ws_msg_bbo_tbt_decoder.decode(raw)
@@ -285,7 +371,7 @@ class OkxPublicConnector(PublicConnector):
                 ask_size=float(d.asks[0][1]),
                 timestamp=int(d.ts),
             )
-            self._msgbus.publish(topic="bookl1", msg=bookl1)
+            self._msgbus.publish(topic=f"bookl1.{bookl1.symbol}", msg=bookl1)
     
     def _handle_candlesticks(self, symbol: str, interval: KlineInterval, kline: OkxCandlesticksResponseData) -> Kline:        
         return Kline(
@@ -323,34 +409,48 @@ class OkxPrivateConnector(PrivateConnector):
         msgbus: MessageBus,
         task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        ws_order_entry: bool = False,
+        http_pool_size: int = 10,
+        http_keepalive_timeout: float = 60,
+        http_warmup_interval: float | None = 30,
+        http_transport: HttpTransportType = HttpTransportType.AIOHTTP,
     ):
         if not exchange.api_key or not exchange.secret or not exchange.passphrase:
             raise ValueError(
                 "API key, secret, and passphrase are required for private endpoints"
             )
 
+        ws_client = OkxWSClient(
+            account_type=account_type,
+            handler=self._ws_msg_handler,
+            task_manager=task_manager,
+            api_key=exchange.api_key,
+            secret=exchange.secret,
+            passphrase=exchange.passphrase,
+        )
+
         super().__init__(
             account_type=account_type,
             market=exchange.market,
             market_id=exchange.market_id,
             exchange_id=exchange.exchange_id,
-            ws_client=OkxWSClient(
-                account_type=account_type,
-                handler=self._ws_msg_handler,
-                task_manager=task_manager,
-                api_key=exchange.api_key,
-                secret=exchange.secret,
-                passphrase=exchange.passphrase,
-            ),
+            ws_client=ws_client,
             api_client=OkxApiClient(
                 api_key=exchange.api_key,
                 secret=exchange.secret,
                 passphrase=exchange.passphrase,
                 testnet=account_type.is_testnet,
+                pool_size=http_pool_size,
+                keepalive_timeout=http_keepalive_timeout,
+                warmup_interval=http_warmup_interval,
+                transport=http_transport,
             ),
             msgbus=msgbus,
             cache=cache,
+            task_manager=task_manager,
             rate_limit=rate_limit,
+            # orders are sent on the logged in private connection
+            ws_api_client=ws_client if ws_order_entry else None,
         )
 
         self._decoder_ws_general_msg = msgspec.json.Decoder(OkxWsGeneralMsg)
@@ -409,7 +509,11 @@ class OkxPrivateConnector(PrivateConnector):
         if msg.event == "error":
             self._log.error(msg)
         elif msg.event == "login":
-            self._log.debug("Login success")
+            self._ws_client._on_login(msg.code)
+            if msg.code == "0":
+                self._log.debug("Login success")
+            else:
+                self._log.error(f"Login failed: {msg}")
         elif msg.event == "subscribe":
             self._log.debug(f"Subscribed to {msg.arg.channel}")
 
@@ -418,6 +522,11 @@ class OkxPrivateConnector(PrivateConnector):
             self._ws_client._transport.notify_user_specific_pong_received()
             self._log.debug(f"Pong received: {str(raw)}")
             return
+        # response to an order entry request
+        req_id = peek_str_field(raw, b'{"id":"')
+        if req_id is not None:
+            self._ws_client._resolve_request(req_id.decode(), bytes(raw))
+            return
         try:
             ws_msg: OkxWsGeneralMsg = self._decoder_ws_general_msg.decode(raw)
             if ws_msg.is_event_msg:
@@ -511,6 +620,11 @@ class OkxPrivateConnector(PrivateConnector):
     def _get_td_mode(self, market: OkxMarket):
         return OkxTdMode.CASH if market.spot else OkxTdMode.CROSS
 
+    def _pop_reduce_only(self, kwargs: Dict[str, Any]) -> bool:
+        """`reduceOnly` / `reduce_only` of the order kwargs, both keys are removed from `kwargs`"""
+        reduce_only = kwargs.pop("reduceOnly", False)
+        return kwargs.pop("reduce_only", False) or reduce_only
+
     async def create_stop_loss_order(
         self,
         symbol: str,
@@ -584,16 +698,17 @@ class OkxPrivateConnector(PrivateConnector):
         if position_side:
             params["posSide"] = OkxEnumParser.to_okx_position_side(position_side).value
 
-        reduce_only = kwargs.pop("reduceOnly", False) or kwargs.pop(
-            "reduce_only", False
-        )
+        reduce_only = self._pop_reduce_only(kwargs)
         if reduce_only:
             params["reduceOnly"] = True
 
         params.update(kwargs)
 
         try:
-            res = await self._api_client.post_api_v5_trade_order(**params)
+            res = await self._order_request(
+                lambda: self._ws_api_client.place_order(**params),
+                lambda: self._api_client.post_api_v5_trade_order(**params),
+            )
             res = res.data[0]
             order = Order(
                 exchange=self._exchange_id,
@@ -643,7 +758,10 @@ class OkxPrivateConnector(PrivateConnector):
         params = {"inst_id": symbol, "ord_id": order_id, **kwargs}
 
         try:
-            res = await self._api_client.post_api_v5_trade_cancel_order(**params)
+            res = await self._order_request(
+                lambda: self._ws_api_client.cancel_order(**params),
+                lambda: self._api_client.post_api_v5_trade_cancel_order(**params),
+            )
             res = res.data[0]
             order = Order(
                 exchange=self._exchange_id,
@@ -665,6 +783,183 @@ class OkxPrivateConnector(PrivateConnector):
             )
             return order
 
+    def _get_batch_order_request(
+        self, market: OkxMarket, order: BatchOrder
+    ) -> Dict[str, Any]:
+        kwargs = dict(order.kwargs)
+        td_mode = kwargs.pop("td_mode", None)
+        if not td_mode:
+            td_mode = self._get_td_mode(market)
+
+        request = {
+            "instId": market.id,
+            "tdMode": td_mode.value,
+            "side": OkxEnumParser.to_okx_order_side(order.side).value,
+            "ordType": OkxEnumParser.to_okx_order_type(
+                order.type, order.time_in_force
+            ).value,
+            "sz": str(order.amount),
+            "tag": "f50cdd72d3b6BCDE",
+        }
+
+        if order.type == OrderType.LIMIT:
+            if not order.price:
+                raise ValueError("Price is required for limit order")
+            request["px"] = str(order.price)
+        else:
+            if market.spot:
+                request["tgtCcy"] = "base_ccy"
+
+        if order.position_side:
+            request["posSide"] = OkxEnumParser.to_okx_position_side(
+                order.position_side
+            ).value
+
+        reduce_only = self._pop_reduce_only(kwargs)
+        if reduce_only:
+            request["reduceOnly"] = True
+
+        request.update(kwargs)
+        return request
+
+    async def create_orders(self, orders: List[BatchOrder]) -> List[Order]:
+        results = await asyncio.gather(
+            *(
+                self._create_orders_batch(orders[i : i + OKX_MAX_BATCH_ORDERS])
+                for i in range(0, len(orders), OKX_MAX_BATCH_ORDERS)
+            )
+        )
+        return [order for batch in results for order in batch]
+
+    async def _create_orders_batch(self, orders: List[BatchOrder]) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+
+        request = []
+        for order in orders:
+            market = self._market.get(order.symbol)
+            if not market:
+                raise ValueError(
+                    f"Symbol {order.symbol} formated wrongly, or not supported"
+                )
+            request.append(self._get_batch_order_request(market, order))
+
+        try:
+            res = await self._api_client.post_api_v5_trade_batch_orders(request)
+            data = res.data
+        except Exception as e:
+            error_msg = f"{e.__class__.__name__}: {str(e)}"
+            self._log.error(
+                f"Error creating batch orders: {error_msg} params: {str(request)}"
+            )
+            data = [None] * len(orders)
+
+        results = []
+        for order, params, item in zip(orders, request, data):
+            if item is not None and item.sCode == "0":
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        id=item.ordId,
+                        client_order_id=item.clOrdId,
+                        timestamp=int(item.ts),
+                        symbol=order.symbol,
+                        type=order.type,
+                        side=order.side,
+                        amount=order.amount,
+                        price=float(order.price) if order.price else None,
+                        time_in_force=order.time_in_force,
+                        position_side=order.position_side,
+                        status=OrderStatus.PENDING,
+                        filled=Decimal(0),
+                        remaining=order.amount,
+                        reduce_only=params.get("reduceOnly", False),
+                    )
+                )
+            else:
+                if item is not None:
+                    self._log.error(
+                        f"Error creating order: {item.sCode} {item.sMsg} params: {str(params)}"
+                    )
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=order.symbol,
+                        type=order.type,
+                        side=order.side,
+                        amount=order.amount,
+                        price=float(order.price) if order.price else None,
+                        time_in_force=order.time_in_force,
+                        position_side=order.position_side,
+                        status=OrderStatus.FAILED,
+                        filled=Decimal(0),
+                        remaining=order.amount,
+                    )
+                )
+        return results
+
+    async def cancel_orders(self, symbol: str, order_ids: List[str], **kwargs):
+        market = self._market.get(symbol)
+        if not market:
+            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+
+        results = await asyncio.gather(
+            *(
+                self._cancel_orders_batch(
+                    market, order_ids[i : i + OKX_MAX_BATCH_ORDERS]
+                )
+                for i in range(0, len(order_ids), OKX_MAX_BATCH_ORDERS)
+            )
+        )
+        return [order for batch in results for order in batch]
+
+    async def _cancel_orders_batch(
+        self, market: OkxMarket, order_ids: List[str]
+    ) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+
+        request = [{"instId": market.id, "ordId": order_id} for order_id in order_ids]
+        try:
+            res = await self._api_client.post_api_v5_trade_cancel_batch_orders(request)
+            data = res.data
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error canceling batch orders: {error_msg} params: {str(request)}"
+            )
+            data = [None] * len(order_ids)
+
+        orders = []
+        for order_id, item in zip(order_ids, data):
+            if item is not None and item.sCode == "0":
+                orders.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        id=item.ordId,
+                        client_order_id=item.clOrdId,
+                        timestamp=int(item.ts),
+                        symbol=market.symbol,
+                        status=OrderStatus.CANCELING,
+                    )
+                )
+            else:
+                if item is not None:
+                    self._log.error(
+                        f"Error canceling order: {item.sCode} {item.sMsg} order_id: {order_id}"
+                    )
+                orders.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=market.symbol,
+                        id=order_id,
+                        status=OrderStatus.CANCEL_FAILED,
+                    )
+                )
+        return orders
+
     async def disconnect(self):
         await super().disconnect()
         await self._api_client.close_session()
@@ -95,6 +95,9 @@ REST_URLS = {
 }
 
 
+# max orders per batch-orders / cancel-batch-orders request
+OKX_MAX_BATCH_ORDERS = 20
+
 @unique
 class OkxTdMode(Enum):
     CASH = "cash"  # 现货
@@ -10,16 +10,17 @@ class OkxExchangeManager(ExchangeManager):
     api: ccxt.okx
     market: Dict[str, OkxMarket] # symbol -> okx market
     market_id: Dict[str, str] # symbol -> exchange symbol id
+    market_type = OkxMarket
 
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, **kwargs):
         config = config or {}
         config["exchange_id"] = config.get("exchange_id", "okx")
-        super().__init__(config)
+        super().__init__(config, **kwargs)
         self.passphrase = config.get("password", None)
     
-    def load_markets(self):
-        market = self.api.load_markets()
-        for symbol, mkt in market.items():
+    def _parse_markets(self, markets: Dict[str, Any]):
+        market, market_id = {}, {}
+        for symbol, mkt in markets.items():
             try:
                 mkt_json = orjson.dumps(mkt)
                 mkt = msgspec.json.decode(mkt_json, type=OkxMarket)
@@ -27,9 +28,10 @@ class OkxExchangeManager(ExchangeManager):
                 if (mkt.spot or mkt.linear or mkt.inverse or mkt.future) and not mkt.option:
                     symbol = self._parse_symbol(mkt, exchange_suffix="OKX")
                     mkt.symbol = symbol
-                    self.market[symbol] = mkt
-                    self.market_id[mkt.id] = symbol # since okx symbol id is identical, no need to distinguish spot, linear, inverse
+                    market[symbol] = mkt
+                    market_id[mkt.id] = symbol # since okx symbol id is identical, no need to distinguish spot, linear, inverse
                 
             except Exception as e:
                 print(f"Error: {e}, {symbol}, {mkt}")
                 continue
+        return market, market_id
@@ -1,12 +1,13 @@
 import msgspec
-from typing import Dict, Any
+from typing import Dict, Any, List
 import orjson
 import hmac
 import base64
+import time
 import asyncio
-import aiohttp
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urljoin
 from nexustrader.base import ApiClient
+from nexustrader.base.api_client import encode_query
 from nexustrader.exchange.okx.constants import OkxRestUrl
 from nexustrader.exchange.okx.error import OkxHttpError, OkxRequestError
 from nexustrader.exchange.okx.schema import (
@@ -18,7 +19,6 @@ from nexustrader.exchange.okx.schema import (
     OkxPositionResponse,
     OkxCandlesticksResponse,
 )
-from nexustrader.core.nautilius_core import hmac_signature
 
 
 class OkxApiClient(ApiClient):
@@ -29,14 +29,17 @@ class OkxApiClient(ApiClient):
         passphrase: str = None,
         testnet: bool = False,
         timeout: int = 10,
+        **kwargs,
     ):
         super().__init__(
             api_key=api_key,
             secret=secret,
             timeout=timeout,
+            **kwargs,
         )
 
         self._base_url = OkxRestUrl.DEMO.value if testnet else OkxRestUrl.LIVE.value
+        self._warmup_urls.append(urljoin(self._base_url, "/api/v5/public/time"))
         self._passphrase = passphrase
         self._testnet = testnet
         self._place_order_decoder = msgspec.json.Decoder(OkxPlaceOrderResponse)
@@ -56,6 +59,16 @@ class OkxApiClient(ApiClient):
             "Content-Type": "application/json",
             "User-Agent": "TradingBot/1.0",
         }
+        # the parts of a signed request that never change
+        self._signed_headers = {
+            **self._headers,
+            "OK-ACCESS-KEY": api_key,
+            "OK-ACCESS-PASSPHRASE": passphrase,
+        }
+        if testnet:
+            self._signed_headers["x-simulated-trading"] = "1"
+        self._ts_second = None
+        self._ts_prefix = ""
 
     async def get_api_v5_account_balance(
         self, ccy: str | None = None
@@ -128,6 +141,28 @@ class OkxApiClient(ApiClient):
         raw = await self._fetch("POST", endpoint, payload=payload, signed=True)
         return self._cancel_order_decoder.decode(raw)
 
+    async def post_api_v5_trade_batch_orders(
+        self, orders: List[Dict[str, Any]]
+    ) -> OkxPlaceOrderResponse:
+        """
+        Place up to 20 orders in one request
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-place-multiple-orders
+        """
+        endpoint = "/api/v5/trade/batch-orders"
+        raw = await self._fetch("POST", endpoint, payload=orders, signed=True)
+        return self._place_order_decoder.decode(raw)
+
+    async def post_api_v5_trade_cancel_batch_orders(
+        self, orders: List[Dict[str, Any]]
+    ) -> OkxCancelOrderResponse:
+        """
+        Cancel up to 20 orders in one request
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-cancel-multiple-orders
+        """
+        endpoint = "/api/v5/trade/cancel-batch-orders"
+        raw = await self._fetch("POST", endpoint, payload=orders, signed=True)
+        return self._cancel_order_decoder.decode(raw)
+
     def _generate_signature(self, message: str) -> str:
         mac = hmac.new(
             bytes(self._secret, encoding="utf8"),
@@ -136,45 +171,25 @@ class OkxApiClient(ApiClient):
         )
         return base64.b64encode(mac.digest()).decode()
 
-    def _generate_signature_v2(self, message: str) -> str:
-        hex_digest = hmac_signature(self._secret, message)
-        digest = bytes.fromhex(hex_digest)
-        return base64.b64encode(digest).decode()
-
-    async def _get_signature(
-        self, ts: str, method: str, request_path: str, payload: Dict[str, Any] = None
-    ) -> str:
-        body = ""
-        if payload:
-            body = orjson.dumps(payload).decode()
-
-        sign_str = f"{ts}{method}{request_path}{body}"
-        signature = self._generate_signature_v2(sign_str)
-        return signature
+    def _generate_signature_v2(self, message: str | bytes) -> str:
+        return self._signer.b64digest(message)
 
     def _get_timestamp(self) -> str:
-        return (
-            self._clock.utc_now()
-            .isoformat(timespec="milliseconds")
-            .replace("+00:00", "Z")
-        )
+        ms = self._clock.timestamp_ms()
+        second, millis = divmod(ms, 1000)
+        # the formatted date only changes once per second
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._ts_prefix}.{millis:03d}Z"
 
-    async def _get_headers(
-        self, ts: str, method: str, request_path: str, payload: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
-        headers = self._headers
-        signature = await self._get_signature(ts, method, request_path, payload)
-        headers.update(
-            {
-                "OK-ACCESS-KEY": self._api_key,
-                "OK-ACCESS-SIGN": signature,
-                "OK-ACCESS-TIMESTAMP": ts,
-                "OK-ACCESS-PASSPHRASE": self._passphrase,
-            }
-        )
-        if self._testnet:
-            headers["x-simulated-trading"] = "1"
-        return headers
+    def _get_headers(self, ts: str, method: str, request_path: str, body: bytes) -> Dict[str, Any]:
+        sign_str = f"{ts}{method}{request_path}".encode("utf-8") + body
+        return {
+            **self._signed_headers,
+            "OK-ACCESS-SIGN": self._generate_signature_v2(sign_str),
+            "OK-ACCESS-TIMESTAMP": ts,
+        }
 
     async def get_api_v5_market_candles(
         self,
@@ -204,38 +219,42 @@ class OkxApiClient(ApiClient):
         self,
         method: str,
         endpoint: str,
-        payload: Dict[str, Any] = None,
+        payload: Dict[str, Any] | List[Dict[str, Any]] = None,
         signed: bool = False,
     ) -> bytes:
         self._init_session()
-        url = urljoin(self._base_url, endpoint)
+        url = self._url(self._base_url, endpoint)
         request_path = endpoint
-        headers = self._headers
-        timestamp = self._get_timestamp()
 
         payload = payload or {}
 
-        payload_json = urlencode(payload) if method == "GET" else orjson.dumps(payload)
-
         if method == "GET":
-            url += f"?{payload_json}"
+            query = encode_query(payload)
+            if query:
+                request_path += "?" + query
+                url += "?" + query
             payload_json = None
+            body = b""
+        else:
+            payload_json = body = orjson.dumps(payload)
 
+        headers = self._headers
         if signed and self._api_key:
-            headers = await self._get_headers(timestamp, method, request_path, payload)
+            headers = self._get_headers(self._get_timestamp(), method, request_path, body)
 
         try:
-            self._log.debug(
-                f"Request {method} Url: {url} Headers: {headers} Payload: {payload_json}"
-            )
+            if self._log_debug:
+                self._log.debug(
+                    f"Request {method} Url: {url} Headers: {headers} Payload: {payload_json}"
+                )
 
-            response = await self._session.request(
+            response = await self._transport.request(
                 method=method,
                 url=url,
                 headers=headers,
                 data=payload_json,
             )
-            raw = await response.read()
+            raw = response.body
 
             if response.status >= 400:
                 raise OkxHttpError(
@@ -244,7 +263,8 @@ class OkxApiClient(ApiClient):
                     headers=response.headers,
                 )
             okx_response = self._general_response_decoder.decode(raw)
-            if okx_response.code == "0":
+            # "2" is the partial success of a batch request, the result of each order is in `data`
+            if okx_response.code in ("0", "2"):
                 return raw
             else:
                 okx_error_response = self._error_response_decoder.decode(raw)
@@ -259,7 +279,7 @@ class OkxApiClient(ApiClient):
                     status_code=response.status,
                     message=okx_error_response.msg,
                 )
-        except aiohttp.ClientError as e:
+        except ConnectionError as e:
             self._log.error(f"Client Error {method} Url: {url} {e}")
             raise
         except asyncio.TimeoutError:
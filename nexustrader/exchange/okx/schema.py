@@ -1,6 +1,8 @@
+import zlib
 import msgspec
-from typing import List
+from typing import Dict, List, Tuple
 from nexustrader.schema import BaseMarket
+from nexustrader.core.orderbook import OrderBook
 from decimal import Decimal
 from msgspec import Struct
 
@@ -74,6 +76,89 @@ class OkxWsBboTbtMsg(msgspec.Struct):
     data: list[OkxWsBboTbtData]
 
 
+class OkxWsBooksData(msgspec.Struct):
+    asks: list[list[str]]
+    bids: list[list[str]]
+    ts: str
+    checksum: int | None = None
+    seqId: int | None = None
+    prevSeqId: int | None = None
+
+
+class OkxWsBooksMsg(msgspec.Struct):
+    """
+    {
+        "arg": {
+            "channel": "books",
+            "instId": "BTC-USDT"
+        },
+        "action": "snapshot",
+        "data": [
+            {
+            "asks": [["8476.98", "415", "0", "13"]],
+            "bids": [["8476.97", "256", "0", "12"]],
+            "ts": "1597026383085",
+            "checksum": -855196043,
+            "prevSeqId": -1,
+            "seqId": 123456
+            }
+        ]
+    }
+
+    `books5` pushes a full 5 level snapshot every time and has no `action`.
+    """
+
+    arg: OkxWsArgMsg
+    data: list[OkxWsBooksData]
+    action: str | None = None
+
+
+class OkxOrderBook(OrderBook):
+    """
+    OrderBook keeping the original price/size strings, OKX computes the
+    checksum over the strings exactly as they were pushed.
+
+    https://www.okx.com/docs-v5/en/#order-book-trading-market-data-ws-order-book-channel
+    """
+
+    def __init__(self, exchange, symbol: str, max_depth: int | None = None):
+        super().__init__(exchange, symbol, max_depth)
+        self._raw_bids: Dict[float, Tuple[str, str]] = {}
+        self._raw_asks: Dict[float, Tuple[str, str]] = {}
+
+    def apply_snapshot(self, bids, asks, timestamp: int, update_id: int = 0) -> None:
+        self._raw_bids.clear()
+        self._raw_asks.clear()
+        super().apply_snapshot(bids, asks, timestamp, update_id)
+
+    def apply_delta(self, bids, asks, timestamp: int, update_id: int = 0) -> None:
+        for raw, levels in ((self._raw_bids, bids), (self._raw_asks, asks)):
+            for level in levels:
+                if float(level[1]) == 0:
+                    raw.pop(float(level[0]), None)
+                else:
+                    raw[float(level[0])] = (level[0], level[1])
+        super().apply_delta(bids, asks, timestamp, update_id)
+
+    def checksum(self) -> int:
+        bids = self.bids.top(25)
+        asks = self.asks.top(25)
+        parts = []
+        for i in range(max(len(bids), len(asks))):
+            if i < len(bids):
+                parts.extend(self._raw_bids[bids[i][0]])
+            if i < len(asks):
+                parts.extend(self._raw_asks[asks[i][0]])
+        crc = zlib.crc32(":".join(parts).encode())
+        # okx uses the signed 32-bit value
+        return crc - (1 << 32) if crc >= (1 << 31) else crc
+
+    def clear(self) -> None:
+        self._raw_bids.clear()
+        self._raw_asks.clear()
+        super().clear()
+
+
 class OkxWsCandleMsg(msgspec.Struct):
     arg: OkxWsArgMsg
     data: list[list[str]]
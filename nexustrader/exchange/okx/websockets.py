@@ -2,12 +2,21 @@ import time
 import hmac
 import base64
 import asyncio
+import msgspec
 
 from typing import Literal, Any, Callable, Dict, List
 from aiolimiter import AsyncLimiter
 
 from nexustrader.base import WSClient
+from nexustrader.error import WSNotConnectedError
 from nexustrader.exchange.okx.constants import OkxAccountType, OkxKlineInterval
+from nexustrader.exchange.okx.error import OkxRequestError
+from nexustrader.exchange.okx.schema import (
+    OkxGeneralResponse,
+    OkxErrorResponse,
+    OkxPlaceOrderResponse,
+    OkxCancelOrderResponse,
+)
 from nexustrader.core.entity import TaskManager
 
 class OkxWSClient(WSClient):
@@ -20,12 +29,15 @@ class OkxWSClient(WSClient):
         secret: str | None = None,
         passphrase: str | None = None,
         business_url: bool = False,
+        zero_copy: bool = False,
+        timeout: int = 5,
     ):
         self._api_key = api_key
         self._secret = secret
         self._passphrase = passphrase
         self._account_type = account_type
         self._authed = False
+        self._login_ack: asyncio.Future | None = None
         self._business_url = business_url
         if self.is_private:
             url = f"{account_type.stream_url}/v5/private"
@@ -43,7 +55,15 @@ class OkxWSClient(WSClient):
             specific_ping_msg=b"ping",
             ping_idle_timeout=5,
             ping_reply_timeout=2,
+            zero_copy=zero_copy,
         )
+        self._timeout = timeout
+        # trade ops are limited per instrument, not by the subscription limit
+        self._order_limiter = AsyncLimiter(max_rate=60, time_period=2)
+        self._general_response_decoder = msgspec.json.Decoder(OkxGeneralResponse)
+        self._error_response_decoder = msgspec.json.Decoder(OkxErrorResponse)
+        self._place_order_decoder = msgspec.json.Decoder(OkxPlaceOrderResponse)
+        self._cancel_order_decoder = msgspec.json.Decoder(OkxCancelOrderResponse)
 
     @property
     def is_private(self):
@@ -76,20 +96,51 @@ class OkxWSClient(WSClient):
 
     async def _auth(self):
         if not self._authed:
+            # `_authed` is only set by the login ack, orders go over REST until then
+            self._login_ack = asyncio.get_running_loop().create_future()
             await self._send(self._get_auth_payload())
-            self._authed = True
-            await asyncio.sleep(5)
+            try:
+                await asyncio.wait_for(self._login_ack, 5)
+            except asyncio.TimeoutError:
+                self._log.error(f"{self._url} login was not acknowledged")
+
+    def _on_login(self, code: str):
+        """Handle the login ack, called by the message handler"""
+        self._authed = code == "0"
+        if self._login_ack is not None and not self._login_ack.done():
+            self._login_ack.set_result(self._authed)
     
-    async def _submit(self, op: str, params: Dict[str, Any]):
-        await self.connect()
-        await self._auth()
-        
+    def disconnect(self):
+        self._authed = False
+        super().disconnect()
+
+    async def _submit(self, op: str, params: Dict[str, Any]) -> bytes:
+        """Send a trade request and return the raw response with the same `id`"""
+        if not self._authed:
+            raise WSNotConnectedError(f"{self._url} is not logged in")
+
+        req_id = self._next_request_id()
         payload = {
-            "id": self._clock.timestamp_ms(),
+            "id": req_id,
             "op": op,
             "args": [params],
         }
-        await self._send(payload)
+        raw = await self._request(req_id, payload, self._timeout, self._order_limiter)
+        okx_response = self._general_response_decoder.decode(raw)
+        if okx_response.code != "0":
+            okx_error_response = self._error_response_decoder.decode(raw)
+            for data in okx_error_response.data:
+                raise OkxRequestError(
+                    error_code=data.sCode,
+                    status_code=None,
+                    message=data.sMsg,
+                )
+            raise OkxRequestError(
+                error_code=okx_error_response.code,
+                status_code=None,
+                message=okx_error_response.msg,
+            )
+        return raw
     
     async def _send_payload(self, params: List[Dict[str, Any]], chunk_size: int = 100):
         # Split params into chunks of 100 if length exceeds 100
@@ -121,7 +172,12 @@ class OkxWSClient(WSClient):
         await self._send_payload(params)
         
     
-    async def place_order(self, inst_id: str, td_mode: str, side: str, ord_type: str, sz: str, **kwargs):
+    async def place_order(
+        self, inst_id: str, td_mode: str, side: str, ord_type: str, sz: str, **kwargs
+    ) -> OkxPlaceOrderResponse:
+        """
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-place-order
+        """
         params = {
             "instId": inst_id,
             "tdMode": td_mode,
@@ -130,9 +186,12 @@ class OkxWSClient(WSClient):
             "sz": sz,
             **kwargs,
         }
-        await self._submit("order", params)
+        raw = await self._submit("order", params)
+        return self._place_order_decoder.decode(raw)
     
-    async def cancel_order(self, inst_id: str, ord_id: str | None = None, cl_ord_id: str | None = None):
+    async def cancel_order(
+        self, inst_id: str, ord_id: str | None = None, cl_ord_id: str | None = None
+    ) -> OkxCancelOrderResponse:
         params = {
             "instId": inst_id,
         }
@@ -140,7 +199,8 @@ class OkxWSClient(WSClient):
             params["ordId"] = ord_id
         if cl_ord_id:
             params["clOrdId"] = cl_ord_id
-        await self._submit("cancel-order", params)
+        raw = await self._submit("cancel-order", params)
+        return self._cancel_order_decoder.decode(raw)
         
 
     async def subscribe_order_book(
@@ -156,6 +216,12 @@ class OkxWSClient(WSClient):
         params = [{"channel": channel, "instId": symbol} for symbol in symbols]
         await self._subscribe(params)
 
+    async def resubscribe_order_book(self, symbol: str, channel: str):
+        """unsubscribe and subscribe again to receive a fresh snapshot, e.g. after a checksum failure"""
+        params = [{"channel": channel, "instId": symbol}]
+        await self._send({"op": "unsubscribe", "args": params})
+        await self._send_payload(params)
+
     async def subscribe_trade(self, symbols: List[str]):
         """
         https://www.okx.com/docs-v5/en/#order-book-trading-market-data-ws-all-trades-channel
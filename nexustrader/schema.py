@@ -155,6 +155,35 @@ class OrderSubmit(Struct):
     status: OrderStatus = OrderStatus.INITIALIZED
 
 
+class BatchOrder(Struct):
+    """
+    A plain (limit / market) order inside `Strategy.create_batch_orders`
+    """
+
+    symbol: str
+    side: OrderSide
+    type: OrderType
+    amount: Decimal
+    price: Decimal | None = None
+    time_in_force: TimeInForce | None = TimeInForce.GTC
+    position_side: PositionSide | None = None
+    uuid: str = field(default_factory=lambda: UUID4().value)
+    kwargs: Dict[str, Any] = {}
+
+
+class BatchOrderSubmit(Struct):
+    """
+    BATCH_CREATE: `orders` are sent in as few exchange batch requests as possible
+    CANCEL_ALL: every open order of `symbol` is canceled, `orders` is empty
+    """
+
+    symbol: str
+    instrument_id: InstrumentId
+    submit_type: SubmitType
+    orders: List[BatchOrder] = []
+    kwargs: Dict[str, Any] = {}
+
+
 class Order(Struct):
     exchange: ExchangeType
     symbol: str
@@ -382,11 +411,11 @@ class LimitMinMax(Struct):
 
 
 class Limit(Struct):
-    leverage: LimitMinMax = None
-    amount: LimitMinMax = None
-    price: LimitMinMax = None
-    cost: LimitMinMax = None
-    market: LimitMinMax = None
+    leverage: LimitMinMax | None = None
+    amount: LimitMinMax | None = None
+    price: LimitMinMax | None = None
+    cost: LimitMinMax | None = None
+    market: LimitMinMax | None = None
 
 
 class MarginMode(Struct):
@@ -4,7 +4,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from collections import defaultdict
 from nexustrader.core.log import SpdLog
 from nexustrader.base import ExchangeManager
-from nexustrader.core.entity import TaskManager
+from nexustrader.core.entity import TaskManager, DataConflator
 from nexustrader.core.cache import AsyncCache
 from nexustrader.error import StrategyBuildError
 from nexustrader.base import (
@@ -15,10 +15,13 @@ from nexustrader.base import (
 from nexustrader.core.nautilius_core import MessageBus, UUID4, LiveClock
 from nexustrader.schema import (
     BookL1,
+    BookL2,
     Trade,
     Kline,
     Order,
     OrderSubmit,
+    BatchOrder,
+    BatchOrderSubmit,
     InstrumentId,
     BaseMarket,
     AccountBalance,
@@ -43,12 +46,16 @@ class Strategy:
             name=type(self).__name__, level="DEBUG", flush=True
         )
 
-        self._subscriptions: Dict[DataType, Dict[KlineInterval, Set[str]] | Set[str]] = {
+        self._subscriptions: Dict[DataType, Dict[KlineInterval | int, Set[str]] | Set[str]] = {
             DataType.BOOKL1: set(),
+            DataType.BOOKL2: defaultdict(set),
             DataType.TRADE: set(),
             DataType.KLINE: defaultdict(set),
         }
 
+        # latest-value delivery per handler, see `DataConflator`
+        self._conflators: Dict[Callable, DataConflator] = {}
+
         self._initialized = False
         self._scheduler = AsyncIOScheduler()
         self.clock = LiveClock()
@@ -73,9 +80,6 @@ class Strategy:
         self._private_connectors = private_connectors
         self._public_connectors = public_connectors
         self._exchanges = exchanges
-        self._msgbus.subscribe(topic="trade", handler=self.on_trade)
-        self._msgbus.subscribe(topic="bookl1", handler=self.on_bookl1)
-        self._msgbus.subscribe(topic="kline", handler=self.on_kline)
 
         self._msgbus.register(endpoint="pending", handler=self.on_pending_order)
         self._msgbus.register(endpoint="accepted", handler=self.on_accepted_order)
@@ -205,6 +209,49 @@ class Strategy:
         self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
         return order.uuid
     
+    def create_batch_orders(
+        self, orders: List[BatchOrder], account_type: AccountType | None = None
+    ) -> List[str]:
+        """create limit / market orders in as few exchange batch requests as possible
+
+        Orders are grouped per exchange and instrument type, each group is sent
+        through the exchange batch endpoint in one submit.
+
+        Args:
+            orders: List[BatchOrder] The orders to create
+            account_type: AccountType | None = None The account type of the orders
+
+        Returns:
+            List[str] The uuids of the orders, in the same order as `orders`
+        """
+        batches: Dict[tuple, BatchOrderSubmit] = {}
+        for order in orders:
+            instrument_id = InstrumentId.from_str(order.symbol)
+            key = (instrument_id.exchange, instrument_id.type)
+            if key not in batches:
+                batches[key] = BatchOrderSubmit(
+                    symbol=order.symbol,
+                    instrument_id=instrument_id,
+                    submit_type=SubmitType.BATCH_CREATE,
+                )
+            batches[key].orders.append(order)
+
+        for batch in batches.values():
+            self._ems[batch.instrument_id.exchange]._submit_order(batch, account_type)
+        return [order.uuid for order in orders]
+
+    def cancel_all_orders(
+        self, symbol: str, account_type: AccountType | None = None, **kwargs
+    ):
+        """cancel every open order of `symbol` with the exchange batch cancel endpoint"""
+        batch = BatchOrderSubmit(
+            symbol=symbol,
+            instrument_id=InstrumentId.from_str(symbol),
+            submit_type=SubmitType.CANCEL_ALL,
+            kwargs=kwargs,
+        )
+        self._ems[batch.instrument_id.exchange]._submit_order(batch, account_type)
+
     def create_adp_maker(
         self,
         symbol: str,
@@ -304,12 +351,35 @@ class Strategy:
         self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
         return order.uuid
 
-    def subscribe_bookl1(self, symbols: str | List[str]):
+    def _subscribe_topic(self, topic: str, handler: Callable, conflate: bool = False):
+        """
+        Subscribe `handler` to a per-symbol market data topic, e.g.
+        `bookl1.BTCUSDT-PERP.BINANCE`, so it is only invoked for the symbols
+        it asked for.
+        """
+        if conflate:
+            conflator = self._conflators.get(handler)
+            if conflator is None:
+                conflator = DataConflator(handler, self._task_manager.loop)
+                self._conflators[handler] = conflator
+            handler = conflator.push
+        self._msgbus.subscribe(topic=topic, handler=handler)
+
+    def subscribe_bookl1(
+        self,
+        symbols: str | List[str],
+        conflate: bool = False,
+        handler: Callable[[BookL1], None] | None = None,
+    ):
         """
         Subscribe to level 1 book data for the given symbols.
 
         Args:
             symbols (List[str]): The symbols to subscribe to.
+            conflate (bool): If True, only the latest book of each symbol is
+                delivered once the previous callback returns, intermediate
+                updates are dropped.
+            handler (Callable): The callback for these symbols, defaults to `on_bookl1`.
         """
         if not self._initialized:
             raise StrategyBuildError(
@@ -318,15 +388,55 @@ class Strategy:
         if isinstance(symbols, str):
             symbols = [symbols]
 
+        handler = handler or self.on_bookl1
         for symbol in symbols:
             self._subscriptions[DataType.BOOKL1].add(symbol)
+            self._subscribe_topic(f"bookl1.{symbol}", handler, conflate)
+
+    def subscribe_bookl2(
+        self,
+        symbols: str | List[str],
+        depth: int = 20,
+        conflate: bool = False,
+        handler: Callable[[BookL2], None] | None = None,
+    ):
+        """
+        Subscribe to level 2 book data for the given symbols.
+
+        The connector maintains the full book locally and publishes the top
+        `depth` levels on every update. If the same symbol is subscribed with
+        several depths, the largest one is published.
+
+        Args:
+            symbols (List[str]): The symbols to subscribe to.
+            depth (int): The number of levels on each side of the book.
+            conflate (bool): If True, only the latest book of each symbol is
+                delivered once the previous callback returns.
+            handler (Callable): The callback for these symbols, defaults to `on_bookl2`.
+        """
+        if not self._initialized:
+            raise StrategyBuildError(
+                "Strategy not initialized, please use `subscribe_bookl2` in `on_start` method"
+            )
+        if isinstance(symbols, str):
+            symbols = [symbols]
+
+        handler = handler or self.on_bookl2
+        for symbol in symbols:
+            self._subscriptions[DataType.BOOKL2][depth].add(symbol)
+            self._subscribe_topic(f"bookl2.{symbol}", handler, conflate)
 
-    def subscribe_trade(self, symbols: str | List[str]):
+    def subscribe_trade(
+        self,
+        symbols: str | List[str],
+        handler: Callable[[Trade], None] | None = None,
+    ):
         """
         Subscribe to trade data for the given symbols.
 
         Args:
             symbols (List[str]): The symbols to subscribe to.
+            handler (Callable): The callback for these symbols, defaults to `on_trade`.
         """
         if not self._initialized:
             raise StrategyBuildError(
@@ -335,16 +445,24 @@ class Strategy:
         if isinstance(symbols, str):
             symbols = [symbols]
 
+        handler = handler or self.on_trade
         for symbol in symbols:
             self._subscriptions[DataType.TRADE].add(symbol)
+            self._subscribe_topic(f"trade.{symbol}", handler)
 
-    def subscribe_kline(self, symbols: str | List[str], interval: KlineInterval):
+    def subscribe_kline(
+        self,
+        symbols: str | List[str],
+        interval: KlineInterval,
+        handler: Callable[[Kline], None] | None = None,
+    ):
         """
         Subscribe to kline data for the given symbols.
 
         Args:
             symbols (List[str]): The symbols to subscribe to.
             interval (str): The interval of the kline data
+            handler (Callable): The callback for these symbols, defaults to `on_kline`.
         """
         if not self._initialized:
             raise StrategyBuildError(
@@ -353,8 +471,10 @@ class Strategy:
         if isinstance(symbols, str):
             symbols = [symbols]
 
+        handler = handler or self.on_kline
         for symbol in symbols:
             self._subscriptions[DataType.KLINE][interval].add(symbol)
+            self._subscribe_topic(f"kline.{interval.value}.{symbol}", handler)
 
     def linear_info(
         self, exchange: ExchangeType, base: str | None = None, quote: str | None = None, exclude: List[str] | None = None
@@ -389,6 +509,9 @@ class Strategy:
     def on_bookl1(self, bookl1: BookL1):
         pass
 
+    def on_bookl2(self, bookl2: BookL2):
+        pass
+
     def on_kline(self, kline: Kline):
         pass
 
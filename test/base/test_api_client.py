@@ -0,0 +1,100 @@
+import ssl
+import hmac
+import socket
+import base64
+import asyncio
+import hashlib
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from decimal import Decimal
+from urllib.parse import urlencode
+from nexustrader.base.api_client import (
+    encode_query,
+    HmacSigner,
+    AiohttpTransport,
+    AiosonicTransport,
+    NautilusHttpTransport,
+)
+
+
+def test_encode_query_matches_urlencode():
+    params = {
+        "symbol": "BTCUSDT",
+        "quantity": Decimal("0.001"),
+        "price": Decimal("60000.1"),
+        "newClientOrderId": "a1b2-c3d4_e5",
+        "reduceOnly": True,
+        "batchOrders": '[{"symbol": "BTCUSDT", "side": "BUY"}]',
+        "timestamp": 1712345678901,
+    }
+    assert encode_query(params) == urlencode(params)
+    assert encode_query({}) == ""
+
+
+def test_hmac_signer_matches_hmac():
+    signer = HmacSigner("secret")
+    for message in ("symbol=BTCUSDT&timestamp=1", "symbol=ETHUSDT&timestamp=2"):
+        mac = hmac.new(b"secret", message.encode("utf-8"), hashlib.sha256)
+        assert signer.hexdigest(message) == mac.hexdigest()
+        assert signer.b64digest(message.encode("utf-8")) == base64.b64encode(mac.digest()).decode()
+
+
+def make_transport(name: str, timeout: int):
+    ssl_context = ssl.create_default_context()
+    if name == "aiohttp":
+        return AiohttpTransport(timeout, pool_size=2, keepalive_timeout=10, dns_cache_ttl=10, ssl_context=ssl_context)
+    if name == "aiosonic":
+        return AiosonicTransport(timeout, pool_size=2, dns_cache_ttl=10, ssl_context=ssl_context)
+    return NautilusHttpTransport(timeout)
+
+
+# on the loop of the test, the session loop of the other async fixtures would never serve it
+@pytest_asyncio.fixture(loop_scope="function")
+async def server():
+    async def echo(request: web.Request):
+        body = await request.read()
+        return web.Response(status=201, body=request.method.encode() + b" " + body, headers={"X-Echo": request.headers["X-Key"]})
+
+    async def slow(request: web.Request):
+        await asyncio.sleep(2)
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_route("*", "/echo", echo)
+    app.router.add_get("/slow", slow)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.parametrize("name", ["aiohttp", "aiosonic", "nautilus"])
+async def test_transport_request(server, name):
+    transport = make_transport(name, timeout=1)
+    try:
+        for method, data in (("GET", None), ("POST", "a=1"), ("DELETE", b"b=2")):
+            response = await transport.request(method, f"{server}/echo", headers={"X-Key": "key"}, data=data)
+            expected = data.encode() if isinstance(data, str) else data or b""
+            assert response.status == 201
+            assert response.body == method.encode() + b" " + expected
+            if name != "nautilus":
+                # the nautilus response has no headers
+                assert {k.lower(): v for k, v in response.headers.items()}["x-echo"] == "key"
+
+        # every backend raises the same errors
+        with pytest.raises(asyncio.TimeoutError):
+            await transport.request("GET", f"{server}/slow")
+        with pytest.raises(ConnectionError):
+            await transport.request("GET", f"http://127.0.0.1:{unused_port()}/echo")
+    finally:
+        await transport.close()
@@ -0,0 +1,195 @@
+from dataclasses import replace
+from decimal import Decimal
+from types import SimpleNamespace
+from nexustrader.backtest import BacktestEngine, ReplayData, run_sweep
+from nexustrader.config import Config, MockConnectorConfig
+from nexustrader.constants import ExchangeType, DataType, OrderSide, OrderType
+from nexustrader.core.recorder import MarketDataRecorder
+from nexustrader.exchange.binance import BinanceAccountType
+from nexustrader.schema import BookL1
+from nexustrader.strategy import Strategy
+
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+START = 1712345600000
+
+
+class FlipStrategy(Strategy):
+    def __init__(self, every: int = 100):
+        super().__init__()
+        self.every = every
+        self.books = 0
+        self.fills = []
+        self.ticks = []
+
+    def on_start(self):
+        self.subscribe_bookl1(SYMBOL)
+        self.schedule(self.tick, trigger="interval", seconds=60)
+
+    def tick(self):
+        self.ticks.append(self.clock.timestamp_ms())
+
+    def on_bookl1(self, bookl1: BookL1):
+        self.books += 1
+        if self.books % self.every == 1:
+            side = OrderSide.BUY if self.books // self.every % 2 == 0 else OrderSide.SELL
+            self.create_order(SYMBOL, side, OrderType.MARKET, Decimal("1"))
+
+    def on_filled_order(self, order):
+        self.fills.append((self.clock.timestamp_ms(), order.side, order.price))
+
+
+class TwapStrategy(Strategy):
+    """Buys with a TWAP on the first book and sells with one 5 minutes later"""
+
+    def __init__(self, wait: int = 10):
+        super().__init__()
+        self.wait = wait
+        self.books = 0
+        self.fills = []
+
+    def on_start(self):
+        self.subscribe_bookl1(SYMBOL)
+
+    def on_bookl1(self, bookl1: BookL1):
+        self.books += 1
+        if self.books in (1, 301):
+            side = OrderSide.BUY if self.books == 1 else OrderSide.SELL
+            self.create_twap(SYMBOL, side, Decimal("1"), duration=120, wait=self.wait, check_interval=1)
+
+    def on_filled_order(self, order):
+        self.fills.append((self.clock.timestamp_ms(), order.side, order.type, order.amount, order.price))
+
+
+class OfflineBacktestEngine(BacktestEngine):
+    # markets of the mock connector without loading them from the exchange
+    def _build_exchanges(self):
+        market = SimpleNamespace(
+            linear=True,
+            spot=False,
+            quote="USDT",
+            precision=SimpleNamespace(amount=0.001, price=0.1),
+            limits=SimpleNamespace(amount=SimpleNamespace(min=0.001), cost=SimpleNamespace(min=5.0)),
+        )
+        self._exchanges[ExchangeType.BINANCE] = SimpleNamespace(
+            exchange_id=ExchangeType.BINANCE, market={SYMBOL: market}, market_id={}
+        )
+
+
+async def record_books(directory: str, message_bus, task_manager):
+    recorder = MarketDataRecorder(message_bus, task_manager, directory, [DataType.BOOKL1])
+    recorder.start()
+    for i in range(600):
+        price = 100.0 + i % 50
+        message_bus.publish(
+            topic=f"bookl1.{SYMBOL}",
+            msg=BookL1(
+                exchange=ExchangeType.BINANCE,
+                symbol=SYMBOL,
+                bid=price,
+                ask=price + 0.1,
+                bid_size=1,
+                ask_size=1,
+                timestamp=START + i * 1000,
+            ),
+        )
+    await recorder.stop()
+    await task_manager.cancel()
+
+
+def build_config(every: int = 100) -> Config:
+    return Config(
+        strategy_id="backtest",
+        user_id="test",
+        strategy=FlipStrategy(every),
+        basic_config={},
+        public_conn_config={},
+        private_conn_config={
+            ExchangeType.BINANCE: [
+                MockConnectorConfig(
+                    initial_balance={"USDT": 10000},
+                    account_type=BinanceAccountType.LINEAR_MOCK,
+                )
+            ]
+        },
+    )
+
+
+def run_backtest(directory: str, data: ReplayData | None = None):
+    config = build_config()
+    if data is not None:
+        return config.strategy, OfflineBacktestEngine(config, data=data).run()
+    return config.strategy, OfflineBacktestEngine(config, data_dir=directory).run()
+
+
+def test_backtest_replays_recorded_books(tmp_path, message_bus, task_manager):
+    task_manager.loop.run_until_complete(record_books(str(tmp_path), message_bus, task_manager))
+    task_manager.loop.close()
+
+    # the backtest runs its own event loop
+    strategy, result = run_backtest(str(tmp_path))
+    assert result.events == strategy.books == 600
+    # every order is filled at the book of the event that triggered it
+    assert strategy.fills[:2] == [
+        (START, OrderSide.BUY, 100.1),
+        (START + 100_000, OrderSide.SELL, 100.0),
+    ]
+    assert len(strategy.fills) == 6
+    assert strategy.ticks[:2] == [START + 60_000, START + 120_000]
+    assert result.pnl[BinanceAccountType.LINEAR_MOCK][0] == (START, 10000.0, 0)
+
+    again, _ = run_backtest(str(tmp_path))
+    assert again.fills == strategy.fills
+
+
+def test_replay_data_matches_recorded_data(tmp_path, message_bus, task_manager):
+    task_manager.loop.run_until_complete(record_books(str(tmp_path / "market"), message_bus, task_manager))
+    task_manager.loop.close()
+
+    data = ReplayData.load(str(tmp_path / "market"), str(tmp_path / "replay"), [SYMBOL])
+    expected, _ = run_backtest(str(tmp_path / "market"))
+    strategy, result = run_backtest(str(tmp_path), data=data)
+    assert result.events == 600
+    assert strategy.fills == expected.fills
+
+
+def test_sweep_runs_every_combination(tmp_path, message_bus, task_manager, monkeypatch):
+    task_manager.loop.run_until_complete(record_books(str(tmp_path), message_bus, task_manager))
+    task_manager.loop.close()
+
+    monkeypatch.setattr("nexustrader.backtest.BacktestEngine._build_exchanges", OfflineBacktestEngine._build_exchanges)
+    rows = run_sweep(build_config, {"every": [100, 200, 300]}, str(tmp_path), [SYMBOL], max_workers=2)
+    assert [row["every"] for row in rows] == [100, 200, 300]
+    assert all(row["events"] == 600 for row in rows)
+    assert rows[0]["pnl"] != rows[1]["pnl"]
+
+
+def build_twap_config(wait: int) -> Config:
+    return replace(build_config(), strategy=TwapStrategy(wait))
+
+
+
+def test_twap_sweep_is_deterministic(tmp_path, message_bus, task_manager, monkeypatch):
+    task_manager.loop.run_until_complete(record_books(str(tmp_path), message_bus, task_manager))
+    task_manager.loop.close()
+
+    config = build_twap_config(30)
+    OfflineBacktestEngine(config, data_dir=str(tmp_path)).run()
+    fills = config.strategy.fills
+    # the slices are placed `wait` simulated seconds apart, the buy is done within its duration
+    assert fills[0][0] == START + 30_000
+    buys = [fill for fill in fills if fill[1] == OrderSide.BUY]
+    assert sum(fill[3] for fill in buys) == Decimal("1")
+    assert buys[-1][0] <= START + 120_000
+
+    again = build_twap_config(30)
+    OfflineBacktestEngine(again, data_dir=str(tmp_path)).run()
+    assert again.strategy.fills == fills
+
+    monkeypatch.setattr("nexustrader.backtest.BacktestEngine._build_exchanges", OfflineBacktestEngine._build_exchanges)
+    grid = {"wait": [10, 30, 60]}
+    rows = run_sweep(build_twap_config, grid, str(tmp_path), [SYMBOL], max_workers=2)
+    repeated = run_sweep(build_twap_config, grid, str(tmp_path), [SYMBOL], max_workers=2)
+    for row in rows + repeated:
+        del row["elapsed"]
+    assert rows == repeated
+    assert len({row["pnl"] for row in rows}) == 3
@@ -0,0 +1,157 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from nexustrader.base import ExecutionManagementSystem
+from types import SimpleNamespace
+from nexustrader.constants import SubmitType, OrderSide, OrderType, OrderStatus
+from nexustrader.core.cache import AsyncCache
+from nexustrader.schema import OrderSubmit, InstrumentId, BatchOrder, BatchOrderSubmit, Order, ExchangeType
+from nexustrader.exchange.binance.constants import BinanceAccountType
+
+
+class DummyExecutionManagementSystem(ExecutionManagementSystem):
+    def _build_order_submit_queues(self):
+        for account_type in self._private_connectors.keys():
+            self._order_submit_queues[account_type] = asyncio.Queue()
+
+    def _set_account_type(self):
+        pass
+
+    def _submit_order(self, order, account_type=None):
+        self._order_submit_queues[account_type].put_nowait(order)
+
+    def _get_min_order_amount(self, symbol, market):
+        return Decimal(0)
+
+
+def make_submit(symbol: str, submit_type: SubmitType, uuid: str) -> OrderSubmit:
+    return OrderSubmit(
+        symbol=symbol,
+        instrument_id=InstrumentId.from_str(symbol),
+        submit_type=submit_type,
+        uuid=uuid,
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        amount=Decimal("1"),
+        price=Decimal("100"),
+    )
+
+
+@pytest.fixture
+def ems(task_manager):
+    account_type = BinanceAccountType.USD_M_FUTURE
+    ems = DummyExecutionManagementSystem(
+        market={},
+        cache=None,
+        msgbus=None,
+        task_manager=task_manager,
+        registry=None,
+    )
+    ems._build({account_type: None}, {account_type: 2})
+    return ems
+
+
+async def test_submits_run_concurrently_and_keep_uuid_order(ems):
+    account_type = BinanceAccountType.USD_M_FUTURE
+    events = []
+
+    async def create(order_submit, account_type):
+        events.append(("create-start", order_submit.uuid))
+        await asyncio.sleep(0.05 if order_submit.uuid == "slow" else 0)
+        events.append(("create-done", order_submit.uuid))
+
+    async def cancel(order_submit, account_type):
+        events.append(("cancel", order_submit.uuid))
+
+    ems._create_order = create
+    ems._cancel_order = cancel
+    await ems.start()
+
+    ems._submit_order(make_submit("BTCUSDT-PERP.BINANCE", SubmitType.CREATE, "slow"), account_type)
+    ems._submit_order(make_submit("BTCUSDT-PERP.BINANCE", SubmitType.CANCEL, "slow"), account_type)
+    ems._submit_order(make_submit("ETHUSDT-PERP.BINANCE", SubmitType.CREATE, "fast"), account_type)
+    await ems._order_submit_queues[account_type].join()
+
+    # the fast order is not stuck behind the slow one
+    assert events.index(("create-done", "fast")) < events.index(("create-done", "slow"))
+    # the cancel is only sent once its create has returned
+    assert events.index(("create-done", "slow")) < events.index(("cancel", "slow"))
+
+
+async def test_batch_create_and_cancel_all(tmp_path, task_manager, message_bus, order_registry):
+    account_type = BinanceAccountType.USD_M_FUTURE
+    symbol = "BTCUSDT-PERP.BINANCE"
+    canceled = []
+
+    async def create_orders(orders):
+        # the second order is rejected by the exchange
+        return [
+            Order(
+                exchange=ExchangeType.BINANCE,
+                symbol=order.symbol,
+                id=str(i) if i != 1 else None,
+                status=OrderStatus.PENDING if i != 1 else OrderStatus.FAILED,
+                side=order.side,
+                type=order.type,
+                amount=order.amount,
+                price=float(order.price),
+                timestamp=0,
+            )
+            for i, order in enumerate(orders)
+        ]
+
+    async def cancel_orders(symbol, order_ids):
+        canceled.extend(order_ids)
+        return [
+            Order(
+                exchange=ExchangeType.BINANCE,
+                symbol=symbol,
+                id=order_id,
+                status=OrderStatus.CANCELING,
+                side=OrderSide.BUY,
+                type=OrderType.LIMIT,
+                amount=Decimal("1"),
+                timestamp=1,
+            )
+            for order_id in order_ids
+        ]
+
+    sent = []
+    for endpoint in ("pending", "failed", "canceling", "cancel_failed"):
+        message_bus.register(endpoint=endpoint, handler=lambda order, endpoint=endpoint: sent.append((endpoint, order.uuid)))
+
+    cache = AsyncCache(
+        strategy_id="strategy-mock",
+        user_id="user-mock",
+        msgbus=message_bus,
+        task_manager=task_manager,
+        registry=order_registry,
+        db_path=str(tmp_path / "cache.db"),
+    )
+    await cache._init_storage()
+    ems = DummyExecutionManagementSystem(
+        market={},
+        cache=cache,
+        msgbus=message_bus,
+        task_manager=task_manager,
+        registry=order_registry,
+    )
+    connector = SimpleNamespace(create_orders=create_orders, cancel_orders=cancel_orders)
+    ems._build({account_type: connector}, {account_type: 2})
+    await ems.start()
+
+    orders = [
+        BatchOrder(symbol=symbol, side=OrderSide.BUY, type=OrderType.LIMIT, amount=Decimal("1"), price=Decimal(100 - i))
+        for i in range(3)
+    ]
+    instrument_id = InstrumentId.from_str(symbol)
+    ems._submit_order(BatchOrderSubmit(symbol=symbol, instrument_id=instrument_id, submit_type=SubmitType.BATCH_CREATE, orders=orders), account_type)
+    ems._submit_order(BatchOrderSubmit(symbol=symbol, instrument_id=instrument_id, submit_type=SubmitType.CANCEL_ALL), account_type)
+    await ems._order_submit_queues[account_type].join()
+
+    # every result is linked back to the uuid of its BatchOrder
+    assert sent[:3] == [("pending", orders[0].uuid), ("failed", orders[1].uuid), ("pending", orders[2].uuid)]
+    # CANCEL_ALL waits for the batch and cancels the open orders only
+    assert sorted(canceled) == ["0", "2"]
+    assert sorted(sent[3:]) == sorted([("canceling", orders[0].uuid), ("canceling", orders[2].uuid)])
+    await cache.close()
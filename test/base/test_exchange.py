@@ -0,0 +1,115 @@
+import sys
+import subprocess
+from nexustrader.base import ExchangeManager
+from nexustrader.constants import InstrumentType
+from nexustrader.exchange.binance.schema import BinanceMarket, BinanceMarketInfo
+from nexustrader.schema import Precision, Limit, LimitMinMax, MarginMode
+
+
+def make_market(base: str, quote: str, swap: bool) -> BinanceMarket:
+    return BinanceMarket(
+        id=f"{base}{quote}",
+        lowercaseId=f"{base}{quote}".lower(),
+        symbol=f"{base}/{quote}:{quote}" if swap else f"{base}/{quote}",
+        base=base,
+        quote=quote,
+        settle=quote if swap else None,
+        baseId=base,
+        quoteId=quote,
+        settleId=quote if swap else None,
+        type=InstrumentType.SWAP if swap else InstrumentType.SPOT,
+        spot=not swap,
+        margin=not swap,
+        swap=swap,
+        future=False,
+        option=False,
+        index=None,
+        active=True,
+        contract=swap,
+        linear=True if swap else None,
+        inverse=False if swap else None,
+        subType=InstrumentType.LINEAR if swap else None,
+        taker=0.0005,
+        maker=0.0002,
+        contractSize=1.0 if swap else None,
+        expiry=None,
+        expiryDatetime=None,
+        strike=None,
+        optionType=None,
+        precision=Precision(amount=0.001, price=0.1),
+        limits=Limit(amount=LimitMinMax(min=0.001, max=1000.0), price=LimitMinMax(min=0.1, max=None)),
+        marginModes=MarginMode(isolated=None, cross=None),
+        created=None,
+        tierBased=None,
+        percentage=None,
+        info=BinanceMarketInfo(symbol=f"{base}{quote}", status="TRADING"),
+        feeSide="get",
+    )
+
+
+class DummyExchangeManager(ExchangeManager):
+    market_type = BinanceMarket
+
+    def __init__(self, **kwargs):
+        self.fetch_count = 0
+        super().__init__({"exchange_id": "binance"}, **kwargs)
+
+    def _parse_markets(self, markets):
+        pass
+
+    def _fetch_markets(self):
+        self.fetch_count += 1
+        market = {
+            "BTCUSDT-PERP.BINANCE": make_market("BTC", "USDT", swap=True),
+            "BTCUSDT.BINANCE": make_market("BTC", "USDT", swap=False),
+        }
+        market_id = {
+            "BTCUSDT_linear": "BTCUSDT-PERP.BINANCE",
+            "BTCUSDT_spot": "BTCUSDT.BINANCE",
+        }
+        return market, market_id
+
+
+def test_markets_start_from_snapshot(tmp_path):
+    exchange = DummyExchangeManager(market_cache_dir=str(tmp_path))
+    assert exchange.fetch_count == 1
+    assert not exchange.market_from_cache
+
+    restarted = DummyExchangeManager(market_cache_dir=str(tmp_path))
+    assert restarted.fetch_count == 0
+    assert restarted.market_from_cache
+    assert restarted.market == exchange.market
+    assert restarted.market_id == exchange.market_id
+
+
+def test_expired_snapshot_is_not_used(tmp_path):
+    DummyExchangeManager(market_cache_dir=str(tmp_path))
+    exchange = DummyExchangeManager(market_cache_dir=str(tmp_path), market_cache_ttl=-1)
+    assert exchange.fetch_count == 1
+    assert not exchange.market_from_cache
+
+
+async def test_refresh_markets_updates_in_place(tmp_path):
+    DummyExchangeManager(market_cache_dir=str(tmp_path))
+    exchange = DummyExchangeManager(market_cache_dir=str(tmp_path))
+    market = exchange.market
+    market.pop("BTCUSDT-PERP.BINANCE")
+
+    await exchange.refresh_markets()
+    assert exchange.fetch_count == 1
+    assert not exchange.market_from_cache
+    # the connectors keep a reference to the same dict
+    assert exchange.market is market
+    assert "BTCUSDT-PERP.BINANCE" in market
+
+
+def test_exchange_package_imports_connectors_lazily():
+    code = (
+        "import sys\n"
+        "from nexustrader.exchange.binance import BinanceAccountType\n"
+        "assert 'nexustrader.exchange.binance.connector' not in sys.modules\n"
+        "assert 'ccxt' not in sys.modules\n"
+        "from nexustrader.exchange.binance import BinancePrivateConnector\n"
+        "assert 'nexustrader.exchange.binance.connector' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
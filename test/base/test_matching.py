@@ -0,0 +1,65 @@
+from decimal import Decimal
+from nexustrader.base.matching import OrderMatcher, RestingOrder
+from nexustrader.constants import OrderSide
+from nexustrader.schema import BookL1, Trade, ExchangeType
+
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+
+
+def book(bid: float, ask: float, bid_size: float = 5, ask_size: float = 5) -> BookL1:
+    return BookL1(
+        exchange=ExchangeType.BINANCE,
+        symbol=SYMBOL,
+        bid=bid,
+        ask=ask,
+        bid_size=bid_size,
+        ask_size=ask_size,
+        timestamp=0,
+    )
+
+
+def trade(price: float, size: float) -> Trade:
+    return Trade(exchange=ExchangeType.BINANCE, symbol=SYMBOL, price=price, size=size, timestamp=0)
+
+
+def test_trades_consume_the_queue_before_filling():
+    matcher = OrderMatcher()
+    order = RestingOrder("1", SYMBOL, OrderSide.BUY, 100.0, Decimal("2"))
+    matcher.add(order, book(100, 101, bid_size=3))
+
+    assert matcher.on_trade(trade(100, 2)) == []
+    # the level shrank, part of it was ahead of the order
+    matcher.on_bookl1(book(100, 101, bid_size=0.5))
+    assert order.queue_ahead == 0.5
+
+    assert matcher.on_trade(trade(100, 1.5)) == [(order, Decimal("1.0"))]
+    assert order.remaining == Decimal("1")
+    assert matcher.on_trade(trade(100, 5)) == [(order, Decimal("1"))]
+    assert "1" not in matcher
+
+
+def test_crossing_fills_levels_from_the_best():
+    matcher = OrderMatcher()
+    near = RestingOrder("1", SYMBOL, OrderSide.SELL, 102.0, Decimal("1"))
+    far = RestingOrder("2", SYMBOL, OrderSide.SELL, 104.0, Decimal("1"))
+    behind = RestingOrder("3", SYMBOL, OrderSide.BUY, 99.0, Decimal("1"))
+    for order in (far, near, behind):
+        matcher.add(order, book(100, 101))
+
+    assert matcher.on_bookl1(book(102, 103)) == [(near, Decimal("1"))]
+    # a trade below the price fills the whole order
+    assert matcher.on_trade(trade(98.5, 0.1)) == [(behind, Decimal("1"))]
+    assert matcher.on_trade(trade(104.5, 0.1)) == [(far, Decimal("1"))]
+
+
+def test_canceled_order_is_not_filled():
+    matcher = OrderMatcher()
+    first = RestingOrder("1", SYMBOL, OrderSide.BUY, 100.5, Decimal("1"))
+    second = RestingOrder("2", SYMBOL, OrderSide.BUY, 100.5, Decimal("1"))
+    matcher.add(first, book(100, 101))
+    matcher.add(second, book(100, 101))
+    assert first.queue_ahead == 0
+
+    assert matcher.cancel("1") is first
+    assert matcher.cancel("1") is None
+    assert matcher.on_bookl1(book(99, 100)) == [(second, Decimal("1"))]
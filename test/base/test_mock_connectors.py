@@ -0,0 +1,135 @@
+import pytest
+from decimal import Decimal
+from types import SimpleNamespace
+from nexustrader.base import MockSpotConnector, MockInverseConnector
+from nexustrader.constants import OrderStatus, OrderSide, OrderType
+from nexustrader.core.cache import AsyncCache
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.schema import BookL1, ExchangeType
+
+SPOT = "BTCUSDT.BINANCE"
+INVERSE = "BTCUSD-PERP.BINANCE"
+
+
+def make_market(spot: bool, base: str, quote: str, settle: str | None = None, contract_size: float | None = None):
+    return SimpleNamespace(
+        spot=spot,
+        linear=False,
+        inverse=not spot,
+        base=base,
+        quote=quote,
+        settle=settle,
+        contractSize=contract_size,
+    )
+
+
+@pytest.fixture
+def exchange():
+    return SimpleNamespace(
+        market={
+            SPOT: make_market(True, "BTC", "USDT"),
+            INVERSE: make_market(False, "BTC", "USD", settle="BTC", contract_size=100),
+        },
+        market_id={},
+        exchange_id=ExchangeType.BINANCE,
+    )
+
+
+@pytest.fixture
+async def cache(tmp_path, task_manager, message_bus, order_registry):
+    cache = AsyncCache(
+        strategy_id="strategy-mock",
+        user_id="user-mock",
+        msgbus=message_bus,
+        task_manager=task_manager,
+        registry=order_registry,
+        db_path=str(tmp_path / "cache.db"),
+        journal_dir=None,
+    )
+    await cache._init_storage()
+    yield cache
+    await cache.close()
+
+
+def publish_book(message_bus, symbol: str, bid: float, ask: float):
+    message_bus.publish(
+        topic=f"bookl1.{symbol}",
+        msg=BookL1(
+            exchange=ExchangeType.BINANCE,
+            symbol=symbol,
+            bid=bid,
+            ask=ask,
+            bid_size=1,
+            ask_size=1,
+            timestamp=0,
+        ),
+    )
+
+
+async def make_connector(connector_cls, account_type, initial_balance, exchange, message_bus, cache, task_manager, quote_currency):
+    connector = connector_cls(
+        initial_balance=initial_balance,
+        account_type=account_type,
+        exchange=exchange,
+        msgbus=message_bus,
+        cache=cache,
+        task_manager=task_manager,
+        overwrite_balance=True,
+        overwrite_position=True,
+        quote_currency=quote_currency,
+    )
+    await connector._init_position()
+    await connector._init_balance()
+    return connector
+
+
+async def test_spot_balance_locking(exchange, message_bus, cache, task_manager):
+    spot = await make_connector(
+        MockSpotConnector, BinanceAccountType.SPOT_MOCK, {"USDT": 10000, "BTC": 0},
+        exchange, message_bus, cache, task_manager, "USDT",
+    )
+    balance = cache.get_balance(BinanceAccountType.SPOT_MOCK)
+    publish_book(message_bus, SPOT, 100, 101)
+
+    order = await spot.create_order(SPOT, OrderSide.BUY, OrderType.LIMIT, Decimal("10"), price=Decimal("99"))
+    assert order.status == OrderStatus.PENDING
+    assert balance.balances["USDT"].free == Decimal("9010")
+    assert balance.balances["USDT"].locked == Decimal("990")
+
+    # the ask reaches the order price, filled as maker
+    publish_book(message_bus, SPOT, 98, 99)
+    assert balance.balances["USDT"].locked == 0
+    assert balance.balances["USDT"].free == Decimal("9010") - Decimal("990") * Decimal("0.0005")
+    assert balance.balances["BTC"].free == Decimal("10")
+
+    order = await spot.create_order(SPOT, OrderSide.SELL, OrderType.LIMIT, Decimal("6"), price=Decimal("120"))
+    assert balance.balances["BTC"].free == Decimal("4")
+    assert balance.balances["BTC"].locked == Decimal("6")
+    canceled = await spot.cancel_order(SPOT, order.id)
+    assert canceled.status == OrderStatus.CANCELING
+    assert balance.balances["BTC"].free == Decimal("10")
+    assert balance.balances["BTC"].locked == 0
+
+    assert (await spot.create_order(SPOT, OrderSide.SELL, OrderType.MARKET, Decimal("11"))).status == OrderStatus.FAILED
+    assert spot.unrealized_pnl == pytest.approx(10 * 98.5)
+
+
+async def test_inverse_coin_margined_pnl(exchange, message_bus, cache, task_manager):
+    inverse = await make_connector(
+        MockInverseConnector, BinanceAccountType.INVERSE_MOCK, {"BTC": 1},
+        exchange, message_bus, cache, task_manager, "BTC",
+    )
+    publish_book(message_bus, INVERSE, 10000, 10000)
+    # 200 contracts of 100 USD are 2 BTC
+    assert (await inverse.create_order(INVERSE, OrderSide.BUY, OrderType.MARKET, Decimal("200"))).status == OrderStatus.FAILED
+    order = await inverse.create_order(INVERSE, OrderSide.BUY, OrderType.MARKET, Decimal("100"))
+    assert order.fee == Decimal("0.0005")
+    assert inverse.total_notional == pytest.approx(1)
+
+    publish_book(message_bus, INVERSE, 12500, 12500)
+    inverse._update_unrealized_pnl()
+    assert inverse.unrealized_pnl == pytest.approx(0.2)
+
+    await inverse.create_order(INVERSE, OrderSide.SELL, OrderType.MARKET, Decimal("100"))
+    assert cache.get_position(INVERSE).value_or(None) is None
+    assert inverse.pnl == pytest.approx(1 - 0.0005 + 0.2 - 0.0004)
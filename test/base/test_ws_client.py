@@ -0,0 +1,79 @@
+import asyncio
+import orjson
+import pytest
+from aiolimiter import AsyncLimiter
+from nexustrader.base import WSClient
+from nexustrader.base.ws_client import peek_str_field
+from nexustrader.error import WSNotConnectedError
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg_type, payload):
+        self.sent.append(orjson.loads(payload))
+
+    def disconnect(self):
+        pass
+
+
+class EchoWSClient(WSClient):
+    def __init__(self, task_manager):
+        super().__init__(
+            "wss://example.com",
+            limiter=AsyncLimiter(max_rate=100, time_period=1),
+            handler=self._ws_msg_handler,
+            task_manager=task_manager,
+        )
+
+    def _ws_msg_handler(self, raw: bytes):
+        msg = orjson.loads(raw)
+        self._resolve_request(msg["id"], msg)
+
+    async def _resubscribe(self):
+        pass
+
+
+@pytest.fixture
+def ws_client(task_manager):
+    client = EchoWSClient(task_manager)
+    client._transport, client._listener = FakeTransport(), object()
+    return client
+
+
+async def test_request_resolved_by_id(ws_client: EchoWSClient):
+    first = asyncio.create_task(ws_client._request("1", {"id": "1"}, timeout=1))
+    second = asyncio.create_task(ws_client._request("2", {"id": "2"}, timeout=1))
+    await asyncio.sleep(0)
+
+    # responses may arrive out of order
+    ws_client._ws_msg_handler(b'{"id": "2", "result": "b"}')
+    ws_client._ws_msg_handler(b'{"id": "1", "result": "a"}')
+
+    assert (await first)["result"] == "a"
+    assert (await second)["result"] == "b"
+    assert not ws_client._pending_requests
+
+
+async def test_request_fails_on_disconnect(ws_client: EchoWSClient):
+    request = asyncio.create_task(ws_client._request("1", {"id": "1"}, timeout=1))
+    await asyncio.sleep(0)
+    ws_client.disconnect()
+
+    with pytest.raises(ConnectionError):
+        await request
+
+    # nothing is sent while disconnected, so the caller can fall back to REST
+    with pytest.raises(WSNotConnectedError):
+        await ws_client._request("2", {"id": "2"}, timeout=1)
+
+
+@pytest.mark.parametrize("wrap", [bytes, memoryview])
+def test_peek_str_field(wrap):
+    frame = wrap(b'{"e":"executionReport","E":1}')
+    assert peek_str_field(frame, b'{"e":"') == b"executionReport"
+    assert peek_str_field(frame, b'{"topic":"') is None
+    # the closing quote is past the scanned head
+    assert peek_str_field(frame, b'{"e":"', limit=10) is None
+    assert peek_str_field(wrap(b'{"e":"execution'), b'{"e":"') is None
@@ -1,5 +1,6 @@
 import pytest
 import time
+import asyncio
 from decimal import Decimal
 from copy import copy
 from nexustrader.schema import Order, ExchangeType, BookL1, Kline, Trade, Position, PositionSide, Balance
@@ -128,6 +129,55 @@ async def test_cache_cleanup(async_cache: AsyncCache, sample_order: Order):
     assert expired_order.uuid not in async_cache._mem_orders
 
 
+async def test_cache_cleanup_is_incremental(async_cache: AsyncCache, sample_order: Order):
+    for i in range(5):
+        expired_order: Order = copy(sample_order)
+        expired_order.uuid = f"expired-uuid-{i}"
+        expired_order.timestamp = 1
+        async_cache._order_initialized(expired_order)
+
+    # an order updated since it was indexed is kept
+    refreshed: Order = copy(expired_order)
+    refreshed.status = OrderStatus.ACCEPTED
+    refreshed.timestamp = time.time() * 1000
+    async_cache._order_status_update(refreshed)
+
+    assert async_cache._cleanup_expired_data(limit=3)
+    assert len(async_cache._mem_orders) == 2
+    assert not async_cache._cleanup_expired_data(limit=3)
+    assert list(async_cache._mem_orders) == [refreshed.uuid]
+    assert async_cache._mem_symbol_orders[sample_order.symbol] == {refreshed.uuid}
+
+
+async def test_wait_for_order_status(async_cache: AsyncCache, sample_order: Order):
+    async_cache._order_initialized(sample_order)
+    waiter = asyncio.create_task(async_cache.wait_for(sample_order.uuid, timeout=1))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    filled_order: Order = copy(sample_order)
+    filled_order.status = OrderStatus.FILLED
+    async_cache._order_status_update(filled_order)
+
+    assert await waiter == filled_order
+    assert sample_order.uuid not in async_cache._order_waiters
+    # already in the requested status -> returns immediately
+    assert await async_cache.wait_for(sample_order.uuid) == filled_order
+
+
+async def test_wait_for_order_status_timeout(async_cache: AsyncCache, sample_order: Order):
+    async_cache._order_initialized(sample_order)
+    assert await async_cache.wait_for(sample_order.uuid, timeout=0.01) is None
+    assert sample_order.uuid not in async_cache._order_waiters
+
+    accepted_order: Order = copy(sample_order)
+    accepted_order.status = OrderStatus.ACCEPTED
+    async_cache._order_status_update(accepted_order)
+    assert (
+        await async_cache.wait_for(sample_order.uuid, statuses={OrderStatus.ACCEPTED})
+        == accepted_order
+    )
+
 ################ # test cache private position data  ###################
 
 async def test_cache_apply_position(async_cache: AsyncCache):
@@ -198,4 +248,56 @@ async def test_cache_apply_balance(async_cache: AsyncCache):
             assert balance.free == usdt.free
             assert balance.locked == usdt.locked
     
-    
\ No newline at end of file
+    
+async def test_sync_writes_only_changed_orders(async_cache: AsyncCache, sample_order: Order):
+    def stored_status():
+        row = async_cache._db.execute(
+            f"SELECT status FROM {async_cache._table_prefix}_orders WHERE uuid = ?",
+            (sample_order.uuid,),
+        ).fetchone()
+        return row[0] if row else None
+
+    await async_cache._init_storage()
+    sample_order.timestamp = int(time.time() * 1000)
+    async_cache._order_initialized(sample_order)
+    await async_cache._sync_to_sqlite()
+    assert not async_cache._dirty.orders
+    assert stored_status() == OrderStatus.PENDING.value
+
+    # an unchanged order is not written again
+    async_cache._db.execute(
+        f"DELETE FROM {async_cache._table_prefix}_orders WHERE uuid = ?",
+        (sample_order.uuid,),
+    )
+    async_cache._db.commit()
+    await async_cache._sync_to_sqlite()
+    assert stored_status() is None
+
+    updated_order: Order = copy(sample_order)
+    updated_order.status = OrderStatus.FILLED
+    async_cache._order_status_update(updated_order)
+    await async_cache._sync_to_sqlite()
+    assert stored_status() == OrderStatus.FILLED.value
+
+
+async def test_get_order_async_reads_through_lru(async_cache: AsyncCache, sample_order: Order):
+    await async_cache._init_storage()
+    sample_order.timestamp = int(time.time() * 1000)
+    async_cache._order_initialized(sample_order)
+    await async_cache._sync_to_sqlite()
+    del async_cache._mem_orders[sample_order.uuid]
+
+    order = (await async_cache.get_order_async(sample_order.uuid)).unwrap()
+    assert order.status == OrderStatus.PENDING
+    # kept in the read cache, not among the live orders written back on sync
+    assert sample_order.uuid not in async_cache._mem_orders
+    assert async_cache._db_orders.get(sample_order.uuid) == order
+    assert async_cache.get_order(sample_order.uuid).unwrap() == order
+
+    # a live update replaces the cached copy
+    updated_order: Order = copy(sample_order)
+    updated_order.status = OrderStatus.FILLED
+    async_cache._order_status_update(updated_order)
+    assert async_cache._db_orders.get(sample_order.uuid) is None
+    assert (await async_cache.get_order_async(sample_order.uuid)).unwrap().status == OrderStatus.FILLED
+    assert (await async_cache.get_order_async("missing-uuid")).value_or(None) is None
@@ -1,6 +1,7 @@
 import pytest
 import asyncio
-from nexustrader.core.entity import TaskManager
+from nexustrader.core.entity import TaskManager, DataConflator
+from nexustrader.schema import Trade, ExchangeType
 
 
 @pytest.mark.asyncio
@@ -38,3 +39,30 @@ async def test_task_cancellation(task_manager: TaskManager) -> None:
 
     # assert not task_manager._tasks
     # assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_data_conflator_delivers_latest_value() -> None:
+    received = []
+    conflator = DataConflator(received.append, asyncio.get_running_loop())
+
+    def trade(symbol: str, price: float) -> Trade:
+        return Trade(
+            exchange=ExchangeType.BINANCE,
+            symbol=symbol,
+            price=price,
+            size=1.0,
+            timestamp=0,
+        )
+
+    conflator.push(trade("BTCUSDT-PERP.BINANCE", 1))
+    conflator.push(trade("ETHUSDT-PERP.BINANCE", 10))
+    conflator.push(trade("BTCUSDT-PERP.BINANCE", 2))
+    assert received == []
+
+    await asyncio.sleep(0)
+    assert [t.price for t in received] == [2, 10]
+
+    conflator.push(trade("BTCUSDT-PERP.BINANCE", 3))
+    await asyncio.sleep(0)
+    assert [t.price for t in received] == [2, 10, 3]
@@ -0,0 +1,100 @@
+import time
+from copy import copy
+from decimal import Decimal
+from nexustrader.schema import Order, ExchangeType, Position
+from nexustrader.constants import OrderStatus, OrderSide, OrderType, PositionSide
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.journal import OrderJournal, OrderEvent, PositionEvent
+
+
+def make_order(status: OrderStatus = OrderStatus.PENDING) -> Order:
+    return Order(
+        id="test-order-1",
+        uuid="test-uuid-1",
+        exchange=ExchangeType.BINANCE,
+        symbol="BTCUSDT-PERP.BINANCE",
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        status=status,
+        price=50000.0,
+        amount=Decimal("1"),
+        timestamp=int(time.time() * 1000),
+    )
+
+
+def make_cache(tmp_path, task_manager, message_bus, order_registry) -> AsyncCache:
+    return AsyncCache(
+        strategy_id="journal-test-strategy",
+        user_id="journal-test-user",
+        msgbus=message_bus,
+        task_manager=task_manager,
+        registry=order_registry,
+        db_path=str(tmp_path / "cache.db"),
+        journal_dir=str(tmp_path / "journal"),
+    )
+
+
+def test_journal_replays_in_order_and_drops_torn_tail(tmp_path):
+    journal = OrderJournal(str(tmp_path), "test")
+    journal.open()
+    journal.append(OrderEvent(True, make_order()))
+    journal.append(OrderEvent(False, make_order(OrderStatus.ACCEPTED)))
+    journal.rotate()
+    journal.append(PositionEvent(Position(symbol="BTCUSDT-PERP.BINANCE", exchange=ExchangeType.BINANCE)))
+    # a crash in the middle of a write
+    path = journal._segment_path(journal._seq)
+    with open(path, "ab") as f:
+        f.write(b"\x10\x00\x00\x00\x00")
+
+    events = list(OrderJournal(str(tmp_path), "test").replay())
+    assert [type(event) for event in events] == [OrderEvent, OrderEvent, PositionEvent]
+    assert events[1].order.status == OrderStatus.ACCEPTED
+
+
+def test_discard_removes_sealed_segments(tmp_path):
+    journal = OrderJournal(str(tmp_path), "test")
+    journal.open()
+    journal.append(OrderEvent(True, make_order()))
+    sealed = journal.rotate()
+    # the sealed segment is fsynced and closed off the event loop
+    assert len(journal._sealed_fds) == 1
+    journal.seal()
+    assert not journal._sealed_fds
+    journal.append(OrderEvent(False, make_order(OrderStatus.ACCEPTED)))
+    journal.discard(sealed)
+    journal.close()
+
+    events = list(OrderJournal(str(tmp_path), "test").replay())
+    assert len(events) == 1
+    assert events[0].order.status == OrderStatus.ACCEPTED
+
+
+async def test_cache_recovers_events_after_crash(tmp_path, task_manager, message_bus, order_registry):
+    cache = make_cache(tmp_path, task_manager, message_bus, order_registry)
+    await cache.start()
+    order = make_order()
+    cache._order_initialized(order)
+    accepted = copy(order)
+    accepted.status = OrderStatus.ACCEPTED
+    cache._order_status_update(accepted)
+    cache._apply_position(
+        Position(
+            symbol="BTCUSDT-PERP.BINANCE",
+            exchange=ExchangeType.BINANCE,
+            side=PositionSide.LONG,
+            signed_amount=Decimal("1"),
+        )
+    )
+    # crash: nothing was synced to the storage
+    await cache._db_async.close()
+    cache._db.close()
+
+    restarted = make_cache(tmp_path, task_manager, message_bus, order_registry)
+    await restarted.start()
+    assert restarted.get_order(order.uuid).unwrap().status == OrderStatus.ACCEPTED
+    assert restarted.get_position("BTCUSDT-PERP.BINANCE").unwrap().signed_amount == Decimal("1")
+    assert order_registry.get_uuid(order.id) == order.uuid
+
+    # once synced, the journal is compacted
+    await restarted.close()
+    assert not list(OrderJournal(str(tmp_path / "journal"), restarted._table_prefix).replay())
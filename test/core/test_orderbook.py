@@ -0,0 +1,71 @@
+import pytest
+from nexustrader.constants import ExchangeType
+from nexustrader.core.orderbook import OrderBook
+
+
+@pytest.fixture
+def orderbook():
+    book = OrderBook(exchange=ExchangeType.BYBIT, symbol="BTCUSDT-PERP.BYBIT")
+    book.apply_snapshot(
+        bids=[["100.0", "1"], ["99.5", "2"], ["99.0", "3"]],
+        asks=[["100.5", "1"], ["101.0", "2"], ["101.5", "3"]],
+        timestamp=1000,
+        update_id=1,
+    )
+    return book
+
+
+def test_snapshot_best_levels(orderbook: OrderBook):
+    assert orderbook.bids.best() == (100.0, 1.0)
+    assert orderbook.asks.best() == (100.5, 1.0)
+    assert orderbook.update_id == 1
+
+
+def test_top_levels_ordered_from_touch(orderbook: OrderBook):
+    assert orderbook.bids.top(2) == [(100.0, 1.0), (99.5, 2.0)]
+    assert orderbook.asks.top(2) == [(100.5, 1.0), (101.0, 2.0)]
+    assert len(orderbook.asks.top(10)) == 3
+
+
+def test_delta_insert_update_delete(orderbook: OrderBook):
+    orderbook.apply_delta(
+        bids=[["100.2", "5"], ["99.5", "4"], ["99.0", "0"]],
+        asks=[["100.5", "0"], ["100.8", "7"]],
+        timestamp=1001,
+        update_id=2,
+    )
+    assert orderbook.bids.top(5) == [(100.2, 5.0), (100.0, 1.0), (99.5, 4.0)]
+    assert orderbook.asks.top(5) == [(100.8, 7.0), (101.0, 2.0), (101.5, 3.0)]
+    assert orderbook.bids.size_at(99.0) == 0.0
+    assert orderbook.timestamp == 1001
+
+
+def test_delete_missing_level_is_noop(orderbook: OrderBook):
+    orderbook.apply_delta(bids=[["50", "0"]], asks=[], timestamp=1001)
+    assert len(orderbook.bids) == 3
+
+
+def test_snapshot_resets_book(orderbook: OrderBook):
+    orderbook.apply_snapshot(bids=[["90", "1"]], asks=[], timestamp=2000)
+    assert orderbook.bids.top(5) == [(90.0, 1.0)]
+    assert orderbook.asks.best() is None
+
+
+def test_max_depth_truncates_worst_levels():
+    book = OrderBook(exchange=ExchangeType.BYBIT, symbol="BTCUSDT-PERP.BYBIT", max_depth=2)
+    book.apply_snapshot(
+        bids=[["100", "1"], ["99", "1"], ["98", "1"]],
+        asks=[["101", "1"], ["102", "1"], ["103", "1"]],
+        timestamp=1000,
+    )
+    assert book.bids.top(5) == [(100.0, 1.0), (99.0, 1.0)]
+    assert book.asks.top(5) == [(101.0, 1.0), (102.0, 1.0)]
+
+
+def test_to_bookl1(orderbook: OrderBook):
+    bookl1 = orderbook.to_bookl1()
+    assert bookl1.bid == 100.0
+    assert bookl1.ask == 100.5
+    assert bookl1.bid_size == 1.0
+    assert bookl1.ask_size == 1.0
+    assert bookl1.timestamp == 1000
@@ -0,0 +1,66 @@
+import duckdb
+from nexustrader.constants import DataType, KlineInterval
+from nexustrader.core.recorder import MarketDataRecorder
+from nexustrader.schema import BookL1, Trade, Kline, ExchangeType
+
+
+async def test_recorder_writes_partitioned_parquet(tmp_path, message_bus, task_manager):
+    recorder = MarketDataRecorder(
+        msgbus=message_bus,
+        task_manager=task_manager,
+        directory=str(tmp_path),
+        data_types=[DataType.BOOKL1, DataType.TRADE, DataType.KLINE],
+        max_batch_size=2,
+    )
+    recorder.start()
+
+    for i, symbol in enumerate(["BTCUSDT-PERP.BINANCE", "ETHUSDT-PERP.BINANCE", "BTCUSDT-PERP.BINANCE"]):
+        message_bus.publish(
+            topic=f"bookl1.{symbol}",
+            msg=BookL1(
+                exchange=ExchangeType.BINANCE,
+                symbol=symbol,
+                bid=100.0 + i,
+                ask=101.0 + i,
+                bid_size=1.0,
+                ask_size=2.0,
+                timestamp=1712345678901 + i,
+            ),
+        )
+    message_bus.publish(
+        topic="trade.BTCUSDT-PERP.BINANCE",
+        msg=Trade(exchange=ExchangeType.BINANCE, symbol="BTCUSDT-PERP.BINANCE", price=100.5, size=0.1, timestamp=1712345678901),
+    )
+    message_bus.publish(
+        topic="kline.1m.BTCUSDT-PERP.BINANCE",
+        msg=Kline(
+            exchange=ExchangeType.BINANCE,
+            symbol="BTCUSDT-PERP.BINANCE",
+            interval=KlineInterval.MINUTE_1,
+            open=100.0,
+            high=102.0,
+            low=99.0,
+            close=101.0,
+            volume=10.0,
+            start=1712345640000,
+            timestamp=1712345678901,
+            confirm=False,
+        ),
+    )
+    await recorder.stop()
+
+    assert (tmp_path / "bookl1/exchange=binance/symbol=BTCUSDT-PERP.BINANCE/date=2024-04-05").is_dir()
+    bookl1 = duckdb.sql(
+        f"SELECT symbol, bid FROM read_parquet('{tmp_path}/bookl1/**/*.parquet', hive_partitioning=true) ORDER BY timestamp"
+    ).fetchall()
+    assert bookl1 == [
+        ("BTCUSDT-PERP.BINANCE", 100.0),
+        ("ETHUSDT-PERP.BINANCE", 101.0),
+        ("BTCUSDT-PERP.BINANCE", 102.0),
+    ]
+    kline = duckdb.sql(
+        f"SELECT interval, quote_volume, confirm FROM read_parquet('{tmp_path}/kline/**/*.parquet')"
+    ).fetchone()
+    assert kline[0] == KlineInterval.MINUTE_1.value
+    assert kline[2] is False
+    assert duckdb.sql(f"SELECT count(*) FROM read_parquet('{tmp_path}/trade/**/*.parquet')").fetchone()[0] == 1
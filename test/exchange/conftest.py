@@ -0,0 +1,48 @@
+import pytest
+from types import SimpleNamespace
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.nautilius_core import MessageBus, LiveClock
+from nautilus_trader.model.identifiers import TraderId
+from nexustrader.constants import ExchangeType
+from nexustrader.exchange.okx.connector import OkxPrivateConnector
+from nexustrader.exchange.okx.constants import OkxAccountType
+
+OKX_SYMBOL = "BTCUSDT-PERP.OKX"
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    import asyncio
+
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture
+def task_manager(event_loop_policy):
+    loop = event_loop_policy.new_event_loop()
+    return TaskManager(loop, enable_signal_handlers=False)
+
+
+@pytest.fixture
+def message_bus():
+    return MessageBus(trader_id=TraderId("TEST-001"), clock=LiveClock())
+
+
+@pytest.fixture
+def okx_connector(message_bus, task_manager):
+    exchange = SimpleNamespace(
+        exchange_id=ExchangeType.OKX,
+        market={OKX_SYMBOL: SimpleNamespace(id="BTC-USDT-SWAP", symbol=OKX_SYMBOL, spot=False)},
+        market_id={},
+        api_key="key",
+        secret="secret",
+        passphrase="passphrase",
+    )
+    return OkxPrivateConnector(
+        exchange=exchange,
+        account_type=OkxAccountType.DEMO,
+        cache=None,
+        msgbus=message_bus,
+        task_manager=task_manager,
+        ws_order_entry=True,
+    )
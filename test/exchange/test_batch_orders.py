@@ -0,0 +1,81 @@
+from decimal import Decimal
+from nexustrader.constants import OrderSide, OrderStatus, OrderType
+from nexustrader.exchange.okx.schema import (
+    OkxCancelOrderData,
+    OkxCancelOrderResponse,
+    OkxPlaceOrderData,
+    OkxPlaceOrderResponse,
+)
+from nexustrader.schema import BatchOrder
+
+SYMBOL = "BTCUSDT-PERP.OKX"
+
+
+def batch_order(i: int, **kwargs) -> BatchOrder:
+    return BatchOrder(
+        symbol=SYMBOL,
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        amount=Decimal("1"),
+        price=Decimal(100 + i),
+        kwargs=kwargs,
+    )
+
+
+async def test_okx_create_orders_splits_batches(okx_connector):
+    requests = []
+
+    async def post_batch_orders(orders):
+        requests.append(orders)
+        # the exchange rejects the order priced 101
+        data = [
+            OkxPlaceOrderData(
+                ordId=order["px"],
+                clOrdId="",
+                tag="",
+                ts="1",
+                sCode="51008" if order["px"] == "101" else "0",
+                sMsg="",
+            )
+            for order in orders
+        ]
+        return OkxPlaceOrderResponse(code="0", msg="", data=data, inTime="", outTime="")
+
+    okx_connector._api_client.post_api_v5_trade_batch_orders = post_batch_orders
+    orders = [batch_order(i) for i in range(24)] + [batch_order(24, reduce_only=True)]
+    results = await okx_connector.create_orders(orders)
+
+    assert [len(request) for request in requests] == [20, 5]
+    assert [result.price for result in results] == [float(order.price) for order in orders]
+    assert results[1].status == OrderStatus.FAILED
+    assert all(result.status == OrderStatus.PENDING for result in results[2:])
+    # `reduce_only` is mapped to the exchange field as for a single order
+    assert requests[1][-1]["reduceOnly"] is True
+    assert "reduce_only" not in requests[1][-1]
+    assert "reduceOnly" not in requests[0][0]
+    assert results[-1].reduce_only is True
+
+
+async def test_okx_cancel_orders_keeps_request_order(okx_connector):
+    async def post_cancel_batch_orders(orders):
+        data = [
+            OkxCancelOrderData(
+                ordId=order["ordId"],
+                clOrdId="",
+                ts="1",
+                sCode="51400" if order["ordId"] == "2" else "0",
+                sMsg="",
+            )
+            for order in orders
+        ]
+        return OkxCancelOrderResponse(code="2", msg="", data=data, inTime="", outTime="")
+
+    okx_connector._api_client.post_api_v5_trade_cancel_batch_orders = post_cancel_batch_orders
+    results = await okx_connector.cancel_orders(SYMBOL, ["1", "2", "3"])
+
+    assert [result.id for result in results] == ["1", "2", "3"]
+    assert [result.status for result in results] == [
+        OrderStatus.CANCELING,
+        OrderStatus.CANCEL_FAILED,
+        OrderStatus.CANCELING,
+    ]
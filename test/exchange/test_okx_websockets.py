@@ -0,0 +1,46 @@
+import asyncio
+from decimal import Decimal
+from nexustrader.constants import OrderSide, OrderStatus, OrderType
+from nexustrader.exchange.okx.schema import OkxPlaceOrderData, OkxPlaceOrderResponse
+
+SYMBOL = "BTCUSDT-PERP.OKX"
+
+
+async def test_orders_use_rest_until_login_ack(okx_connector):
+    ws_client = okx_connector._ws_client
+    sent = []
+    rest_orders = []
+
+    async def send(payload):
+        sent.append(payload)
+
+    async def post_order(**params):
+        rest_orders.append(params)
+        data = [OkxPlaceOrderData(ordId="1", clOrdId="", tag="", ts="1", sCode="0", sMsg="")]
+        return OkxPlaceOrderResponse(code="0", msg="", data=data, inTime="", outTime="")
+
+    ws_client._send = send
+    # a connected transport, the order entry only depends on the login
+    ws_client._transport = ws_client._listener = object()
+    okx_connector._api_client.post_api_v5_trade_order = post_order
+
+    auth = asyncio.create_task(ws_client._auth())
+    await asyncio.sleep(0)
+    assert sent[0]["op"] == "login"
+    assert not ws_client._authed
+
+    order = await okx_connector.create_order(SYMBOL, OrderSide.BUY, OrderType.LIMIT, Decimal("1"), price=Decimal("100"))
+    assert order.status == OrderStatus.PENDING
+    assert len(rest_orders) == 1
+
+    okx_connector._ws_msg_handler(b'{"event":"login","code":"0","msg":"","connId":"a4d3ae55"}')
+    await auth
+    assert ws_client._authed
+
+    # a rejected login leaves the order entry on REST
+    ws_client._authed = False
+    auth = asyncio.create_task(ws_client._auth())
+    await asyncio.sleep(0)
+    okx_connector._ws_msg_handler(b'{"event":"login","code":"60009","msg":"Login failed.","connId":"a4d3ae55"}')
+    await auth
+    assert not ws_client._authed
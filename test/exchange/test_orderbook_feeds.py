@@ -0,0 +1,143 @@
+import asyncio
+import msgspec
+from types import SimpleNamespace
+from nexustrader.constants import ExchangeType
+from nexustrader.exchange.binance.connector import BinancePublicConnector
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.binance.schema import BinanceResponseDepth
+from nexustrader.exchange.bybit.connector import BybitPublicConnector
+from nexustrader.exchange.bybit.constants import BybitAccountType
+from nexustrader.exchange.okx.schema import OkxOrderBook
+
+BINANCE_SYMBOL = "BTCUSDT-PERP.BINANCE"
+BYBIT_SYMBOL = "BTCUSDT-PERP.BYBIT"
+
+
+def make_exchange(exchange_id: ExchangeType, symbol: str):
+    return SimpleNamespace(
+        exchange_id=exchange_id,
+        market={symbol: SimpleNamespace(id="BTCUSDT")},
+        market_id={"BTCUSDT_linear": symbol},
+    )
+
+
+def collect(message_bus, topic: str) -> list:
+    books = []
+    message_bus.subscribe(topic=topic, handler=books.append)
+    return books
+
+
+async def no_op(*args, **kwargs):
+    pass
+
+
+def depth_update(first: int, last: int, prev: int, bids: list, asks: list) -> memoryview:
+    msg = {
+        "e": "depthUpdate",
+        "E": last,
+        "T": last,
+        "s": "BTCUSDT",
+        "U": first,
+        "u": last,
+        "pu": prev,
+        "b": bids,
+        "a": asks,
+    }
+    return memoryview(msgspec.json.encode(msg))
+
+
+def test_okx_checksum():
+    # https://www.okx.com/docs-v5/en/#order-book-trading-market-data-ws-order-book-channel
+    book = OkxOrderBook(exchange=ExchangeType.OKX, symbol="BTC-USDT.OKX")
+    book.apply_snapshot(
+        bids=[["3366.1", "7", "0", "3"], ["3366", "6", "3", "4"]],
+        asks=[["3366.8", "9", "10", "3"], ["3368", "8", "3", "4"]],
+        timestamp=0,
+    )
+    assert book.checksum() == -1881014294
+
+
+async def test_binance_depth_resyncs_on_gap(message_bus, task_manager):
+    connector = BinancePublicConnector(
+        account_type=BinanceAccountType.USD_M_FUTURE,
+        exchange=make_exchange(ExchangeType.BINANCE, BINANCE_SYMBOL),
+        msgbus=message_bus,
+        task_manager=task_manager,
+    )
+    snapshots = [
+        BinanceResponseDepth(
+            lastUpdateId=100,
+            bids=[["100", "1"], ["99", "2"], ["98", "3"]],
+            asks=[["101", "1"], ["102", "2"], ["103", "3"]],
+        ),
+        BinanceResponseDepth(lastUpdateId=300, bids=[["90", "1"]], asks=[["91", "1"]]),
+    ]
+
+    async def get_depth_snapshot(symbol_id: str):
+        return snapshots.pop(0)
+
+    connector._ws_client.subscribe_depth = no_op
+    connector._get_depth_snapshot = get_depth_snapshot
+    books = collect(message_bus, f"bookl2.{BINANCE_SYMBOL}")
+
+    await connector.subscribe_bookl2(BINANCE_SYMBOL, depth=2)
+    # events before the snapshot are buffered, the stale one is dropped on replay
+    connector._ws_msg_handler(depth_update(90, 99, 89, [["100", "5"]], []))
+    connector._ws_msg_handler(depth_update(95, 105, 99, [["100.5", "1"]], []))
+    await asyncio.sleep(0)
+    book = connector._orderbook[BINANCE_SYMBOL]
+    assert book.update_id == 105
+    assert book.bids.top(5) == [(100.5, 1.0), (100.0, 1.0), (99.0, 2.0), (98.0, 3.0)]
+    assert len(book.asks) == 3
+    assert books == []
+
+    connector._ws_msg_handler(depth_update(106, 110, 105, [], [["101", "0"]]))
+    # the diffs only carry the changed levels, the book behind the published depth is kept
+    assert books[-1].asks == [(102.0, 2.0), (103.0, 3.0)]
+
+    # `pu` does not follow the book, the snapshot is fetched again
+    connector._ws_msg_handler(depth_update(200, 301, 150, [], [["91", "2"]]))
+    assert len(books) == 1
+    await asyncio.sleep(0)
+    assert book.update_id == 301
+    assert book.asks.top(5) == [(91.0, 2.0)]
+    assert book.bids.top(5) == [(90.0, 1.0)]
+
+    connector._ws_msg_handler(depth_update(302, 305, 301, [["90", "4"]], []))
+    assert books[-1].bids == [(90.0, 4.0)]
+    assert snapshots == []
+
+
+def bybit_depth(type: str, update_id: int, bids: list, asks: list) -> memoryview:
+    msg = {
+        "topic": "orderbook.50.BTCUSDT",
+        "type": type,
+        "ts": update_id,
+        "data": {"s": "BTCUSDT", "b": bids, "a": asks, "u": update_id, "seq": update_id},
+    }
+    return memoryview(msgspec.json.encode(msg))
+
+
+async def test_bybit_bookl2_snapshot_then_delta(message_bus, task_manager):
+    connector = BybitPublicConnector(
+        account_type=BybitAccountType.LINEAR,
+        exchange=make_exchange(ExchangeType.BYBIT, BYBIT_SYMBOL),
+        msgbus=message_bus,
+        task_manager=task_manager,
+    )
+    connector._ws_client.subscribe_order_book = no_op
+    bookl1 = collect(message_bus, f"bookl1.{BYBIT_SYMBOL}")
+    bookl2 = collect(message_bus, f"bookl2.{BYBIT_SYMBOL}")
+
+    await connector.subscribe_bookl2(BYBIT_SYMBOL, depth=2)
+    connector._ws_msg_handler(
+        bybit_depth("snapshot", 1, [["100", "1"], ["99", "2"], ["98", "3"]], [["101", "1"], ["102", "2"]])
+    )
+    assert bookl2[-1].bids == [(100.0, 1.0), (99.0, 2.0)]
+    assert bookl2[-1].asks == [(101.0, 1.0), (102.0, 2.0)]
+
+    connector._ws_msg_handler(bybit_depth("delta", 2, [["100", "0"], ["99.5", "4"]], [["100.5", "3"]]))
+    assert bookl2[-1].bids == [(99.5, 4.0), (99.0, 2.0)]
+    assert bookl2[-1].asks == [(100.5, 3.0), (101.0, 1.0)]
+    assert bookl2[-1].timestamp == 2
+    assert bookl1 == []
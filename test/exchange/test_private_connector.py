@@ -0,0 +1,24 @@
+import asyncio
+
+
+async def test_disconnect_stops_keep_warm(okx_connector):
+    api_client = okx_connector._api_client
+    warmups = []
+
+    async def warmup():
+        warmups.append(api_client._transport)
+        api_client._init_session()
+
+    api_client.warmup = warmup
+    api_client._warmup_urls = ["https://www.okx.com/api/v5/public/time"]
+    api_client._warmup_interval = 0.01
+    okx_connector._keep_warm_task = okx_connector._task_manager.create_task(api_client.keep_warm())
+    await asyncio.sleep(0.02)
+    assert warmups
+
+    await okx_connector.disconnect()
+    count = len(warmups)
+    await asyncio.sleep(0.03)
+    # no warm-up reopens the closed transport
+    assert len(warmups) == count
+    assert api_client._transport is None